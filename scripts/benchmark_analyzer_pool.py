@@ -0,0 +1,48 @@
+"""
+Measures per-turn AnalyzerAgent construction cost with and without the shared graph pool.
+
+Usage: uv run python scripts/benchmark_analyzer_pool.py [turns]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+import dotenv
+
+dotenv.load_dotenv()
+# Building the chat model only needs a key to be present, nothing is sent
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-placeholder")
+
+from sportsagent.agents.baseagent import clear_graph_pool, pool_stats  # noqa: E402
+from sportsagent.nodes.analyzer.analyzeragent import AnalyzerAgent  # noqa: E402
+
+
+def time_turns(turns: int, pooled: bool) -> list[float]:
+    timings = []
+    for _ in range(turns):
+        if not pooled:
+            clear_graph_pool()
+        started = time.perf_counter()
+        AnalyzerAgent()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def main() -> None:
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    cold = time_turns(turns, pooled=False)
+    clear_graph_pool()
+    warm = time_turns(turns, pooled=True)
+
+    print(f"turns={turns}")
+    print(f"recompile per turn: median {statistics.median(cold):.1f}ms, max {max(cold):.1f}ms")
+    print(f"pooled graph:       median {statistics.median(warm[1:]):.3f}ms (first {warm[0]:.1f}ms)")
+    print(f"saved per turn:     {statistics.median(cold) - statistics.median(warm[1:]):.1f}ms")
+    print(f"pool stats: {pool_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmarks the vectorized compare_performance against the previous per-stat loop on a
+synthetic 25-season frame using every column in POSITION_STATS_MAP["ALL"].
+
+Usage: uv run python scripts/benchmark_compare_performance.py [players_per_season]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from sportsagent.constants import POSITION_STATS_MAP
+from sportsagent.models.comparisonmetric import ComparisionMetrics, ComparisonMetric
+from sportsagent.tools.dataframe import compute_comparisons
+
+SEASONS = range(2000, 2025)
+
+
+def build_frame(players_per_season: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    n = len(SEASONS) * players_per_season
+    stats = [c for c in POSITION_STATS_MAP["ALL"] if c not in ("season", "week", "games_played")]
+    data = {stat: rng.gamma(2.0, 50.0, n) for stat in stats}
+    data["player_id"] = [f"P{i % (players_per_season * 3):05d}" for i in range(n)]
+    data["player_name"] = [f"Player {pid}" for pid in data["player_id"]]
+    data["season"] = np.repeat(list(SEASONS), players_per_season)
+    return pd.DataFrame(data)
+
+
+def legacy_compare(df: pd.DataFrame) -> ComparisionMetrics:
+    metrics = ComparisionMetrics(player_count=len(df), comparisons=[])
+    numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
+    stat_cols = [col for col in numeric_cols if col not in ["season", "week", "games_played"]]
+    for stat in stat_cols:
+        if stat in df.columns and df[stat].notna().any():
+            values = df[stat].dropna()
+            if len(values) >= 2:
+                max_val = values.max()
+                min_val = values.min()
+                if max_val > 0:
+                    metrics.comparisons.append(
+                        ComparisonMetric(
+                            stat=stat,
+                            max_value=max_val,
+                            min_value=min_val,
+                            difference=max_val - min_val,
+                            percent_difference=((max_val - min_val) / max_val) * 100,
+                            leader=df.loc[df[stat] == max_val, "player_name"].iloc[0],
+                            trailing=df.loc[df[stat] == min_val, "player_name"].iloc[0],
+                        )
+                    )
+    metrics.comparisons.sort(key=lambda x: x.percent_difference, reverse=True)
+    return metrics
+
+
+def best_of(fn, repeats: int = 5) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def main() -> None:
+    players_per_season = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    df = build_frame(players_per_season)
+
+    legacy = legacy_compare(df)
+    vectorized = compute_comparisons(df)
+    assert vectorized is not None
+    assert [(c.stat, c.leader, c.trailing) for c in legacy.comparisons] == [
+        (c.stat, c.leader, c.trailing) for c in vectorized.comparisons
+    ]
+
+    legacy_ms = best_of(lambda: legacy_compare(df))
+    vectorized_ms = best_of(lambda: compute_comparisons(df))
+    grouped_ms = best_of(lambda: compute_comparisons(df, group_by="player"))
+
+    print(f"frame: {df.shape[0]} rows x {df.shape[1]} cols over {len(SEASONS)} seasons")
+    print(f"legacy loop:           {legacy_ms:.1f}ms")
+    print(f"vectorized:            {vectorized_ms:.1f}ms ({legacy_ms / vectorized_ms:.1f}x)")
+    print(f"vectorized by player:  {grouped_ms:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
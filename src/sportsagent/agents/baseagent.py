@@ -1,3 +1,7 @@
+import hashlib
+import threading
+import time
+from collections.abc import Hashable
 from typing import Any
 
 from langchain.agents import create_agent
@@ -5,7 +9,16 @@ from langchain_core.messages import SystemMessage
 from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph.state import CompiledStateGraph
 
-from sportsagent.config import settings
+from sportsagent.config import settings, setup_logging
+from sportsagent.llm import get_chat_model
+
+logger = setup_logging(__name__)
+
+# Compiled agent graphs are stateless between invocations (per-turn state travels in the
+# invocation input/config), so one compiled graph per configuration is shared process-wide.
+_GRAPH_POOL: dict[Hashable, CompiledStateGraph] = {}
+_POOL_LOCK = threading.Lock()
+_POOL_STATS: dict[str, float] = {"hits": 0, "misses": 0, "compile_seconds": 0.0}
 
 
 class BaseAgent:
@@ -13,7 +26,40 @@ class BaseAgent:
     response: dict[str, Any] | None = None
 
     def __init__(self, **kwargs) -> None:
-        self._compiled_graph = self.create(**kwargs)
+        self._compiled_graph = self.get_graph(**kwargs)
+
+    def get_graph(self, **kwargs) -> CompiledStateGraph:
+        """Return the pooled compiled graph for this configuration, compiling on first use."""
+        if "checkpointer" in kwargs:
+            # Caller-owned checkpointer means caller-owned graph; never share it
+            return self.create(**kwargs)
+
+        key = self.pool_key(**kwargs)
+        with _POOL_LOCK:
+            graph = _GRAPH_POOL.get(key)
+            if graph is not None:
+                _POOL_STATS["hits"] += 1
+                return graph
+
+            started = time.perf_counter()
+            graph = self.create(**kwargs)
+            elapsed = time.perf_counter() - started
+            _GRAPH_POOL[key] = graph
+            _POOL_STATS["misses"] += 1
+            _POOL_STATS["compile_seconds"] += elapsed
+
+        logger.info(f"Compiled {self.agentName} graph in {elapsed * 1000:.1f}ms")
+        return graph
+
+    def pool_key(self, **kwargs) -> Hashable:
+        prompt_digest = hashlib.sha256(self.systemMessage.encode()).hexdigest()[:16]
+        return (
+            type(self).__qualname__,
+            settings.LLM_MODEL,
+            settings.ENABLE_CHECKPOINTING,
+            prompt_digest,
+            tuple(sorted((k, repr(v)) for k, v in kwargs.items())),
+        )
 
     def create(
         self,
@@ -25,7 +71,7 @@ class BaseAgent:
             checkpointer = InMemorySaver()
 
         agent = create_agent(
-            model=settings.LLM_MODEL,
+            model=get_chat_model(settings.LLM_MODEL),
             tools=self.tools,
             system_prompt=SystemMessage(content=self.systemMessage),
             checkpointer=checkpointer,
@@ -46,6 +92,18 @@ class BaseAgent:
         raise NotImplementedError
 
 
+def pool_stats() -> dict[str, float]:
+    """Hit/miss counts and total compile time of the shared agent graph pool."""
+    with _POOL_LOCK:
+        return {**_POOL_STATS, "size": len(_GRAPH_POOL)}
+
+
+def clear_graph_pool() -> None:
+    with _POOL_LOCK:
+        _GRAPH_POOL.clear()
+        _POOL_STATS.update(hits=0, misses=0, compile_seconds=0.0)
+
+
 def get_tool_call_names(messages):
     """
     Method to extract the tool call names from a list of LangChain messages.
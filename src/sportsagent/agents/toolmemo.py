@@ -0,0 +1,158 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from langchain.agents.middleware import AgentMiddleware
+from langchain_core.messages import ToolMessage
+from langgraph.prebuilt.tool_node import ToolCallRequest
+from langgraph.types import Command
+
+from sportsagent.config import settings, setup_logging
+from sportsagent.datasource import get_datasource
+
+logger = setup_logging(__name__)
+
+# Values are {"content": ToolMessage content, "artifact": artifact store key or None}, JSON
+# serializable; artifacts stay in the process-wide store so checkpoints carry only keys
+type ToolMemo = dict[str, Any]
+
+# Read-only tools whose output depends only on their arguments and the analysis frame
+MEMOIZED_TOOLS = frozenset(
+    {
+        "explain_data",
+        "describe_dataset",
+        "compare_performance",
+        "league_context",
+        "find_similar_players",
+    }
+)
+# Tools that read the datasource rather than the analysis frame, mapped to the datasource
+# method giving the version of the data they read. Their entries are keyed on that version
+# and their arguments, so they survive dataset changes but not data refreshes.
+FRAME_INDEPENDENT_TOOLS = {"find_similar_players": "similarity_version"}
+MEMO_CONFIG_KEY = "tool_memo"
+_ANY_FRAME = "*"
+
+_MEMO_STATS: dict[str, int] = {"hits": 0, "misses": 0}
+_STATS_LOCK = threading.Lock()
+_ARTIFACTS: OrderedDict[str, Any] = OrderedDict()
+_ARTIFACTS_LOCK = threading.Lock()
+
+
+def tool_memo_key(tool_name: str, args: dict[str, Any], data_handle: str | None) -> str:
+    """
+    Memo key; the frame fingerprint leads so stale entries can be pruned by prefix.
+    FRAME_INDEPENDENT_TOOLS lead with a wildcard and their data version instead.
+    """
+    canonical = json.dumps(args, sort_keys=True, default=str)
+    digest = hashlib.sha256(f"{tool_name}:{canonical}".encode()).hexdigest()[:16]
+    if tool_name in FRAME_INDEPENDENT_TOOLS:
+        return f"{_data_scope(tool_name)}:{tool_name}:{digest}"
+    return f"{data_handle}:{tool_name}:{digest}"
+
+
+def prune_tool_memo(memo: ToolMemo, data_handle: str | None) -> int:
+    """
+    Drop entries computed on other datasets or older data versions, in place. Returns the
+    number removed.
+    """
+    current = {f"{_data_scope(name)}:{name}:" for name in FRAME_INDEPENDENT_TOOLS}
+    stale = [
+        k
+        for k in memo
+        if not any(k.startswith(prefix) for prefix in current)
+        and (k.startswith(_ANY_FRAME) or data_handle is None or not k.startswith(f"{data_handle}:"))
+    ]
+    for key in stale:
+        del memo[key]
+    if stale:
+        logger.info(f"Pruned {len(stale)} tool memo entries for a changed dataset")
+    return len(stale)
+
+
+def memo_stats() -> dict[str, int]:
+    with _STATS_LOCK:
+        return dict(_MEMO_STATS)
+
+
+class ToolMemoMiddleware(AgentMiddleware):
+    """
+    Serves repeated analysis tool calls from a per-session memo passed in the run config
+    (``configurable.tool_memo``). Only successful results of MEMOIZED_TOOLS are stored.
+    The memo keeps the content and an artifact key; artifacts live in a bounded
+    process-wide store, and a hit whose artifact was evicted runs the tool again.
+    """
+
+    def wrap_tool_call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], ToolMessage | Command[Any]],
+    ) -> ToolMessage | Command[Any]:
+        name = request.tool_call["name"]
+        config = request.runtime.config if request.runtime is not None else {}
+        memo = (config or {}).get("configurable", {}).get(MEMO_CONFIG_KEY)
+        state = request.state if isinstance(request.state, dict) else {}
+        data_handle = state.get("data_handle")
+        if (
+            memo is None
+            or name not in MEMOIZED_TOOLS
+            or not (data_handle or name in FRAME_INDEPENDENT_TOOLS)
+        ):
+            return handler(request)
+
+        key = tool_memo_key(name, request.tool_call.get("args", {}), data_handle)
+        cached = memo.get(key)
+        artifact = _load_artifact(cached.get("artifact")) if cached is not None else None
+        if cached is not None and (cached.get("artifact") is None or artifact is not None):
+            _count("hits")
+            logger.info(f"Tool memo hit for {name}")
+            return ToolMessage(
+                content=cached["content"],
+                artifact=artifact,
+                name=name,
+                tool_call_id=request.tool_call["id"],
+                additional_kwargs={"memoized": True},
+            )
+
+        _count("misses")
+        result = handler(request)
+        if isinstance(result, ToolMessage) and result.status != "error":
+            stored = None
+            if result.artifact is not None:
+                stored = key
+                _store_artifact(key, result.artifact)
+            memo[key] = {"content": result.content, "artifact": stored}
+            while len(memo) > settings.TOOL_MEMO_MAX_ENTRIES:
+                del memo[next(iter(memo))]
+        return result
+
+
+def _data_scope(tool_name: str) -> str:
+    version = getattr(get_datasource(), FRAME_INDEPENDENT_TOOLS[tool_name])()
+    return f"{_ANY_FRAME}{version}"
+
+
+def _store_artifact(key: str, artifact: Any) -> None:
+    with _ARTIFACTS_LOCK:
+        _ARTIFACTS[key] = artifact
+        _ARTIFACTS.move_to_end(key)
+        while len(_ARTIFACTS) > settings.TOOL_ARTIFACT_CACHE_SIZE:
+            _ARTIFACTS.popitem(last=False)
+
+
+def _load_artifact(key: str | None) -> Any:
+    if key is None:
+        return None
+    with _ARTIFACTS_LOCK:
+        artifact = _ARTIFACTS.get(key)
+        if artifact is not None:
+            _ARTIFACTS.move_to_end(key)
+        return artifact
+
+
+def _count(stat: str) -> None:
+    with _STATS_LOCK:
+        _MEMO_STATS[stat] += 1
@@ -1,15 +1,27 @@
 import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from sportsagent.config import settings, setup_logging
-from sportsagent.runner import RunResult, WorkflowRunner
+from sportsagent.llm import aclose_llm_clients
+from sportsagent.runner import RunResult, RunStreamItem, WorkflowRunner
 from sportsagent.session.manager import SessionManager
 from sportsagent.session.memory_store import InMemorySessionStore
 
 logger = setup_logging(__name__)
-app = FastAPI()
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    await aclose_llm_clients()
+
+
+app = FastAPI(lifespan=_lifespan)
 
 _session_manager = SessionManager(InMemorySessionStore())
 
@@ -92,7 +104,7 @@ async def chat_turn(payload: ChatTurnRequest) -> ChatResponse:
         runner = await _get_runner(
             payload.session_id, payload.auto_approve, payload.save_assets_to_file
         )
-        result = await asyncio.to_thread(runner.run, payload.user_query)
+        result = await runner.arun(payload.user_query)
         return _format_response(result)
     except HTTPException:
         raise
@@ -101,6 +113,36 @@ async def chat_turn(payload: ChatTurnRequest) -> ChatResponse:
         raise HTTPException(status_code=500, detail="chat failed") from exc
 
 
+async def _sse_events(items: AsyncIterator[RunStreamItem]) -> AsyncIterator[str]:
+    """Server-sent events: stream events as they happen, then the final ChatResponse."""
+    try:
+        async for item in items:
+            if isinstance(item, RunResult):
+                yield f"event: result\ndata: {_format_response(item).model_dump_json()}\n\n"
+            else:
+                yield f"event: {item.kind}\ndata: {item.model_dump_json()}\n\n"
+    except Exception as exc:
+        logger.error(f"Chat stream failed: {exc}")
+        yield 'event: error\ndata: {"detail": "chat failed"}\n\n'
+
+
+@app.post("/chat/stream")
+async def chat_stream(payload: ChatTurnRequest) -> StreamingResponse:
+    try:
+        runner = await _get_runner(
+            payload.session_id, payload.auto_approve, payload.save_assets_to_file
+        )
+        # Runs on the request's event loop; a client disconnect cancels the in-flight node
+        return StreamingResponse(
+            _sse_events(runner.astream(payload.user_query)),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
+        )
+    except Exception as exc:
+        logger.error(f"Chat stream setup failed: {exc}")
+        raise HTTPException(status_code=500, detail="chat failed") from exc
+
+
 @app.post("/chat/approve", response_model=ChatResponse)
 async def approve(payload: ApprovalRequest) -> ChatResponse:
     try:
@@ -1,8 +1,9 @@
 import argparse
+from collections.abc import Iterable
 from typing import Any
 
 from sportsagent.config import settings, setup_logging
-from sportsagent.runner import RunResult, WorkflowRunner
+from sportsagent.runner import RunResult, RunStreamItem, WorkflowRunner
 
 logger = setup_logging(__name__)
 
@@ -55,15 +56,46 @@ def _prompt_for_approval(auto_approve: bool) -> str:
 def _display_result(result: RunResult) -> None:
     try:
         print(f"Assistant: {result.state.generated_response}")
-        if result.state.visualization and result.state.skip_save:
-            print("Visualization available (skipped saving).")
-        if result.state.visualization and not result.state.skip_save:
-            print(f"Visualization stored in {settings.ASSET_OUTPUT_DIR}")
+        _display_assets(result)
     except Exception as exc:  # pragma: no cover - display guard
         logger.error(f"Display failed: {exc}")
         raise
 
 
+def _display_assets(result: RunResult) -> None:
+    if result.state.visualization and result.state.skip_save:
+        print("Visualization available (skipped saving).")
+    if result.state.visualization and not result.state.skip_save:
+        print(f"Visualization stored in {settings.ASSET_OUTPUT_DIR}")
+
+
+def _consume_stream(items: Iterable[RunStreamItem]) -> RunResult:
+    """Print answer tokens as they arrive and return the turn's RunResult."""
+    try:
+        result = None
+        streamed = False
+        for item in items:
+            if isinstance(item, RunResult):
+                result = item
+            elif item.kind == "token":
+                if not streamed:
+                    print("Assistant: ", end="", flush=True)
+                    streamed = True
+                print(item.content, end="", flush=True)
+
+        if result is None:
+            raise ValueError("Workflow stream ended without a result")
+        if streamed:
+            print()
+            _display_assets(result)
+        else:
+            _display_result(result)
+        return result
+    except Exception as exc:  # pragma: no cover - display guard
+        logger.error(f"Streaming display failed: {exc}")
+        raise
+
+
 def _run_chat(args: argparse.Namespace) -> None:
     try:
         runner = WorkflowRunner(
@@ -76,13 +108,17 @@ def _run_chat(args: argparse.Namespace) -> None:
 
         prompt = args.prompt or _prompt_for_input("You: ")
         while prompt:
-            result = runner.run(prompt, conversation_history=conversation_history, retrieved_data=retrieved_data)
-            _display_result(result)
+            result = _consume_stream(
+                runner.stream(
+                    prompt,
+                    conversation_history=conversation_history,
+                    retrieved_data=retrieved_data,
+                )
+            )
 
             while result.pending == ["approval"]:
                 decision = _prompt_for_approval(args.auto_approve)
-                result = runner.resume_with_approval(decision)
-                _display_result(result)
+                result = _consume_stream(runner.stream_approval(decision))
 
             conversation_history = result.state.conversation_history
             retrieved_data = result.state.retrieved_data
@@ -35,6 +35,11 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     LLM_MODEL: str = "openai:gpt-4o"
     OPENAI_MODEL: str = "gpt-4o"
+    # Connection limits apply per pool: the sync and async LLM clients each get their own
+    LLM_MAX_CONNECTIONS: int = 20
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    LLM_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+    LLM_TIMEOUT_SECONDS: float = 120.0
     # API Keys and Feature Flags
     OPENAI_API_KEY: str = ""
     # SportsAgent Settings
@@ -57,6 +62,49 @@ class Settings(BaseSettings):
     )
     NFLREADPY_CACHE_VERBOSE: bool = False
     NFLREADPY_TIMEOUT: int = 30
+    DATASOURCE_FRAME_CACHE_SIZE: int = 16
+    PBP_STORE_DIR: Path = Field(
+        default_factory=lambda: (
+            Path("/app/data/cache/pbp")
+            if os.environ.get("CONTAINER_ENV") == "1"
+            else PROJECT_ROOT / "data" / "cache" / "pbp"
+        )
+    )
+    PBP_ROW_GROUP_SIZE: int = 16384
+    PBP_REFRESH_HOURS: float = 12.0
+    FRAME_REGISTRY_SIZE: int = 32
+    PROMPT_TOKEN_BUDGET: int = 1500
+    TOOL_MEMO_MAX_ENTRIES: int = 64
+    # Process-wide store of memoized tool artifacts; session memos only hold their keys
+    TOOL_ARTIFACT_CACHE_SIZE: int = 256
+    SIMILARITY_HISTORY_SEASONS: int = 10
+    SIMILARITY_REFRESH_HOURS: float = 12.0
+    PARSE_CACHE_SIZE: int = 256
+    PARSE_CACHE_TTL_SECONDS: float = 3600.0
+    # sqlite file for a persistent parse cache tier; memory-only when unset
+    PARSE_CACHE_DB: Path | None = None
+    RULE_PARSER_ENABLED: bool = True
+    # Share of content words (a matched phrase counts once) the rule parser must account
+    # for before skipping the LLM; parses with any unexplained word are rejected regardless
+    RULE_PARSER_MIN_CONFIDENCE: float = 0.8
+    # Pass gazetteer-resolved players/teams/stats to the parser LLM as hints
+    ENTITY_HINTS_ENABLED: bool = True
+    # Approximate (paraphrase) parse cache in front of the rule and LLM parsers
+    SEMANTIC_CACHE_ENABLED: bool = True
+    SEMANTIC_CACHE_SIZE: int = 512
+    SEMANTIC_CACHE_THRESHOLD: float = 0.9
+    # Share of semantic hits re-parsed anyway to measure (and evict) false hits
+    SEMANTIC_CACHE_AUDIT_RATE: float = 0.05
+    # Bounded conversation context for the parser (see models/conversationmemory.py)
+    CONTEXT_RECENT_TURNS: int = 3
+    CONTEXT_MAX_ENTITIES: int = 8
+    CONTEXT_RESPONSE_CHARS: int = 300
+    CONTEXT_SUMMARY_TURNS: int = 6
+    CONVERSATION_HISTORY_MAX_TURNS: int = 20
+    # Render fully specified bar/line/scatter ChartSpecs directly instead of via LLM code
+    NATIVE_CHARTS_ENABLED: bool = True
+    # Executed-and-working generate_plot code kept per chart intent and column schema
+    VIZ_CODE_CACHE_SIZE: int = 128
 
 
 settings = Settings()
@@ -153,7 +153,6 @@ TEAM_MAPPINGS = {
 }
 
 
-
 # Mapping of common stat name variations to standardized names
 STAT_MAPPINGS = {
     # Passing stats
@@ -574,3 +573,159 @@ QB_NEXTGEN_STATS = [
     "player_jersey_number",
     "player_short_name",
 ]
+
+# Reference: https://nflreadr.nflverse.com/articles/dictionary_pbp.html
+PBP_COLUMNS = [
+    "game_id",
+    "play_id",
+    "season",
+    "week",
+    "season_type",
+    "posteam",
+    "defteam",
+    "home_team",
+    "away_team",
+    "qtr",
+    "down",
+    "ydstogo",
+    "yardline_100",
+    "goal_to_go",
+    "half_seconds_remaining",
+    "game_seconds_remaining",
+    "play_type",
+    "yards_gained",
+    "epa",
+    "wpa",
+    "success",
+    "pass",
+    "rush",
+    "pass_attempt",
+    "rush_attempt",
+    "complete_pass",
+    "air_yards",
+    "yards_after_catch",
+    "touchdown",
+    "pass_touchdown",
+    "rush_touchdown",
+    "interception",
+    "sack",
+    "qb_hit",
+    "first_down",
+    "fumble_lost",
+    "shotgun",
+    "no_huddle",
+    "passer_player_id",
+    "passer_player_name",
+    "rusher_player_id",
+    "rusher_player_name",
+    "receiver_player_id",
+    "receiver_player_name",
+]
+
+# Reference: https://nflreadr.nflverse.com/articles/dictionary_participation.html
+PARTICIPATION_COLUMNS = [
+    "nflverse_game_id",
+    "play_id",
+    "possession_team",
+    "offense_formation",
+    "offense_personnel",
+    "defenders_in_box",
+    "defense_personnel",
+    "number_of_pass_rushers",
+    "defense_man_zone_type",
+    "defense_coverage_type",
+    "was_pressure",
+    "time_to_throw",
+]
+
+# Reference: https://nflreadr.nflverse.com/articles/dictionary_schedules.html
+SCHEDULE_COLUMNS = [
+    "game_id",
+    "season",
+    "game_type",
+    "week",
+    "gameday",
+    "weekday",
+    "gametime",
+    "away_team",
+    "away_score",
+    "home_team",
+    "home_score",
+    "location",
+    "result",
+    "total",
+    "overtime",
+    "away_rest",
+    "home_rest",
+    "spread_line",
+    "total_line",
+    "div_game",
+    "roof",
+    "surface",
+    "stadium",
+]
+
+RECEIVING_NEXTGEN_STATS = [
+    "season",
+    "season_type",
+    "week",
+    "player_display_name",
+    "player_position",
+    "team_abbr",
+    "avg_cushion",
+    "avg_separation",
+    "avg_intended_air_yards",
+    "percent_share_of_intended_air_yards",
+    "receptions",
+    "targets",
+    "catch_percentage",
+    "yards",
+    "rec_touchdowns",
+    "avg_yac",
+    "avg_expected_yac",
+    "avg_yac_above_expectation",
+    "player_gsis_id",
+    "player_first_name",
+    "player_last_name",
+    "player_jersey_number",
+    "player_short_name",
+]
+
+RUSHING_NEXTGEN_STATS = [
+    "season",
+    "season_type",
+    "week",
+    "player_display_name",
+    "player_position",
+    "team_abbr",
+    "efficiency",
+    "percent_attempts_gte_eight_defenders",
+    "avg_time_to_los",
+    "rush_attempts",
+    "rush_yards",
+    "expected_rush_yards",
+    "rush_yards_over_expected",
+    "avg_rush_yards",
+    "rush_yards_over_expected_per_att",
+    "rush_pct_over_expected",
+    "rush_touchdowns",
+    "player_gsis_id",
+    "player_first_name",
+    "player_last_name",
+    "player_jersey_number",
+    "player_short_name",
+]
+
+NEXTGEN_STATS_MAP = {
+    "passing": QB_NEXTGEN_STATS,
+    "receiving": RECEIVING_NEXTGEN_STATS,
+    "rushing": RUSHING_NEXTGEN_STATS,
+}
+
+NEXTGEN_POSITION_MAP = {
+    "QB": "passing",
+    "WR": "receiving",
+    "TE": "receiving",
+    "RB": "rushing",
+    "FB": "rushing",
+}
@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+
+from sportsagent.config import setup_logging
+
+logger = setup_logging(__name__)
+
+ALL_POSITIONS = "ALL"
+# Players below this share of the season's max games are excluded from the reference pool
+MIN_GAMES_FRACTION = 0.25
+_EXCLUDED_COLUMNS = {"season", "week", "games", "player_jersey_number"}
+
+
+class StatDistributions:
+    """
+    Sorted per-position value arrays (plus mean/std) for every numeric stat of one season.
+
+    Built once from the season's regular-season player totals; percentile ranks are then
+    a ``searchsorted`` into the sorted arrays and z-scores a vectorized subtraction.
+    """
+
+    def __init__(self, frame: pd.DataFrame, season: int) -> None:
+        self.season = season
+        pool = qualified_pool(frame)
+        self.stats = [
+            c
+            for c in pool.columns
+            if c not in _EXCLUDED_COLUMNS
+            and pd.api.types.is_numeric_dtype(pool[c])
+            and pool[c].dtype != bool
+        ]
+        positions = pool["position"].astype(str) if "position" in pool.columns else None
+
+        self._sorted: dict[tuple[str, str], np.ndarray] = {}
+        groups = {ALL_POSITIONS: pool}
+        if positions is not None:
+            groups |= {pos: pool[positions == pos] for pos in positions.unique()}
+
+        means, stds = {}, {}
+        for position, group in groups.items():
+            block = group[self.stats].astype("float64")
+            values = block.to_numpy(na_value=np.nan)
+            for i, stat in enumerate(self.stats):
+                column = values[:, i]
+                self._sorted[(position, stat)] = np.sort(column[~np.isnan(column)])
+            means[position] = block.mean()
+            stds[position] = block.std()
+        self.means = pd.DataFrame(means).T
+        self.stds = pd.DataFrame(stds).T
+        logger.info(
+            f"Built {season} stat distributions: {len(pool)} qualified players, "
+            f"{len(groups)} position groups, {len(self.stats)} stats"
+        )
+
+    @property
+    def positions(self) -> list[str]:
+        return list(self.means.index)
+
+    def pool_size(self, stat: str, position: str = ALL_POSITIONS) -> int:
+        return len(self._sorted.get((position, stat), ()))
+
+    def percentile(self, stat: str, position: str, values: np.ndarray) -> np.ndarray:
+        """Share of the position's qualified players at or below each value, 0-100."""
+        ref = self._sorted.get((position, stat))
+        if ref is None or len(ref) == 0:
+            return np.full(len(values), np.nan)
+        ranks = np.searchsorted(ref, values, side="right") / len(ref) * 100
+        return np.where(np.isnan(values), np.nan, ranks)
+
+    def zscore(self, stat: str, position: str, values: np.ndarray) -> np.ndarray:
+        if position not in self.means.index or stat not in self.means.columns:
+            return np.full(len(values), np.nan)
+        std = self.stds.at[position, stat]
+        if not std or np.isnan(std):
+            return np.full(len(values), np.nan)
+        return (values - self.means.at[position, stat]) / std
+
+
+def qualified_pool(frame: pd.DataFrame) -> pd.DataFrame:
+    if "games" not in frame.columns or frame.empty:
+        return frame
+    games = pd.to_numeric(frame["games"], errors="coerce")
+    return frame[games >= games.max() * MIN_GAMES_FRACTION]
+
+
+def league_context(
+    df: pd.DataFrame,
+    distributions: dict[int, StatDistributions],
+    stats: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Percentile ranks and z-scores for each row of ``df`` against its season and position
+    group (or the whole league when the row has no known position).
+    """
+    try:
+        if df.empty or "season" not in df.columns:
+            return pd.DataFrame()
+
+        available = (
+            set().union(*(d.stats for d in distributions.values())) if distributions else set()
+        )
+        candidates = stats or [
+            c
+            for c in df.columns
+            if pd.api.types.is_numeric_dtype(df[c]) and c not in _EXCLUDED_COLUMNS
+        ]
+        stats = [s for s in candidates if s in available and s in df.columns]
+
+        identity = [
+            c
+            for c in ("player_display_name", "player_name", "team", "position", "season")
+            if c in df.columns
+        ]
+        result = df[identity].copy()
+        seasons = pd.to_numeric(df["season"], errors="coerce").to_numpy()
+        positions = (
+            df["position"].astype(str).to_numpy()
+            if "position" in df.columns
+            else np.full(len(df), ALL_POSITIONS)
+        )
+
+        columns: dict[str, np.ndarray] = {}
+        for stat in stats:
+            values = pd.to_numeric(df[stat], errors="coerce").to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+            pctl = np.full(len(df), np.nan)
+            z = np.full(len(df), np.nan)
+            for season, dist in distributions.items():
+                season_mask = seasons == season
+                for position in np.unique(positions[season_mask]):
+                    group = position if position in dist.positions else ALL_POSITIONS
+                    mask = season_mask & (positions == position)
+                    pctl[mask] = dist.percentile(stat, group, values[mask])
+                    z[mask] = dist.zscore(stat, group, values[mask])
+            columns[stat] = values
+            columns[f"{stat}_pctl"] = pctl
+            columns[f"{stat}_z"] = z
+        return pd.concat([result.reset_index(drop=True), pd.DataFrame(columns)], axis=1)
+    except Exception as e:
+        logger.error(f"Failed to compute league context: {e}")
+        raise
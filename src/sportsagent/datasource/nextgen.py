@@ -0,0 +1,124 @@
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from sportsagent.config import setup_logging
+from sportsagent.constants import NEXTGEN_STATS_MAP
+
+logger = setup_logging(__name__)
+
+type NextGenStatType = Literal["passing", "receiving", "rushing"]
+
+NEXTGEN_KEY = ["player_gsis_id", "season", "week"]
+# Next Gen season-level rows are published as week 0
+SEASON_WEEK = 0
+
+_CATEGORY_COLUMNS = ["season_type", "player_position", "team_abbr"]
+_SMALL_INT_COLUMNS = ["season", "week", "player_jersey_number"]
+_IDENTITY_COLUMNS = {
+    "season",
+    "season_type",
+    "week",
+    "player_display_name",
+    "player_position",
+    "team_abbr",
+    "player_gsis_id",
+    "player_first_name",
+    "player_last_name",
+    "player_jersey_number",
+    "player_short_name",
+}
+
+
+def nextgen_metric_columns(stat_type: NextGenStatType) -> list[str]:
+    return [c for c in NEXTGEN_STATS_MAP[stat_type] if c not in _IDENTITY_COLUMNS]
+
+
+def optimize_nextgen(df: pd.DataFrame, stat_type: NextGenStatType) -> pd.DataFrame:
+    """Project to the stat type's schema, downcast and sort on the join key."""
+    try:
+        result = df[[c for c in NEXTGEN_STATS_MAP[stat_type] if c in df.columns]].copy()
+        for col in _CATEGORY_COLUMNS:
+            if col in result.columns:
+                result[col] = result[col].astype("category")
+        for col in _SMALL_INT_COLUMNS:
+            if col in result.columns:
+                values = pd.to_numeric(result[col], errors="coerce")
+                result[col] = values.astype("float32" if values.isna().any() else "int16")
+        for col in nextgen_metric_columns(stat_type):
+            if col in result.columns and pd.api.types.is_float_dtype(result[col]):
+                result[col] = result[col].astype("float32")
+        return result.sort_values(NEXTGEN_KEY, kind="stable").reset_index(drop=True)
+    except Exception as e:
+        logger.error(f"Failed to optimize {stat_type} next gen frame: {e}")
+        raise
+
+
+class NextGenIndex:
+    """
+    Next Gen rows keyed by a hashed (player_gsis_id, season, week) index so they can
+    be attached to player stats with one ``get_indexer`` lookup.
+    """
+
+    def __init__(self, frame: pd.DataFrame, stat_type: NextGenStatType) -> None:
+        self.stat_type = stat_type
+        deduped = frame.drop_duplicates(subset=NEXTGEN_KEY, keep="first")
+        self.frame = deduped.reset_index(drop=True)
+        self.metrics = [c for c in nextgen_metric_columns(stat_type) if c in self.frame.columns]
+        self._index = pd.MultiIndex.from_arrays(
+            [
+                self.frame["player_gsis_id"].astype(str).to_numpy(),
+                self.frame["season"].to_numpy(np.int64),
+                self.frame["week"].to_numpy(np.int64),
+            ],
+            names=NEXTGEN_KEY,
+        )
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def join(self, df: pd.DataFrame, id_col: str = "player_id") -> pd.DataFrame:
+        """
+        Attach Next Gen metrics to ``df``. Weekly rows match their week; rows without a
+        week (season summaries) match the season-level row. Metric names that already
+        exist in ``df`` are prefixed with ``ngs_``; metrics ``df`` already carries from an
+        earlier join are left alone, so joining twice adds no columns.
+        """
+        try:
+            if df.empty or id_col not in df.columns or "season" not in df.columns:
+                return df
+            if all(col in df.columns or f"ngs_{col}" in df.columns for col in self.metrics):
+                logger.info(f"{self.stat_type} next gen stats already joined; skipping")
+                return df
+
+            if "week" in df.columns:
+                weeks = pd.to_numeric(df["week"], errors="coerce").fillna(SEASON_WEEK)
+            else:
+                weeks = pd.Series(SEASON_WEEK, index=df.index)
+            keys = pd.MultiIndex.from_arrays(
+                [
+                    df[id_col].astype(str).to_numpy(),
+                    pd.to_numeric(df["season"], errors="coerce").fillna(-1).to_numpy(np.int64),
+                    weeks.to_numpy(np.int64),
+                ]
+            )
+            positions = self._index.get_indexer(keys)
+            found = positions >= 0
+            take = np.where(found, positions, 0)
+
+            result = df.copy()
+            for col in self.metrics:
+                if f"ngs_{col}" in df.columns:
+                    continue
+                values = self.frame[col].to_numpy(dtype=np.float64, na_value=np.nan).take(take)
+                values[~found] = np.nan
+                result[f"ngs_{col}" if col in df.columns else col] = values
+
+            logger.info(
+                f"Joined {self.stat_type} next gen stats onto {int(found.sum())}/{len(df)} rows"
+            )
+            return result
+        except Exception as e:
+            logger.error(f"Failed to join {self.stat_type} next gen stats: {e}")
+            raise
@@ -1,11 +1,33 @@
+import time
+from datetime import date
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 from urllib.request import urlretrieve
 
 import nflreadpy as nfl
 import pandas as pd
+import polars as pl
 
 from sportsagent.config import Settings, setup_logging
+from sportsagent.constants import CURRENT_SEASON, PARTICIPATION_COLUMNS, PBP_COLUMNS
+from sportsagent.datasource.distributions import StatDistributions, league_context
+from sportsagent.datasource.framecache import FrameCache
+from sportsagent.datasource.nextgen import NextGenIndex, NextGenStatType, optimize_nextgen
+from sportsagent.datasource.pbpstore import PBPStore, build_predicates
+from sportsagent.datasource.schedules import TeamGameIndex, optimize_schedules
+from sportsagent.datasource.similarity import SimilarityIndex
+from sportsagent.datasource.situations import (
+    SITUATION_PBP_COLUMNS,
+    SplitLevel,
+    compute_situational_splits,
+    resolve_situations,
+    restrict_to_last_n_games,
+)
+from sportsagent.datasource.weekindex import (
+    WeekIndexedFrame,
+    take_last_n_games,
+    week_bounds_for_dates,
+)
 from sportsagent.models.chatboterror import RetrievalError
 
 logger = setup_logging(__name__)
@@ -41,6 +63,14 @@ class NFLReadPyDataSource:
 
         self.TEAM_COLORS = {}
         self.TEAM_LOGO_PATHS = {}
+        self.frame_cache = FrameCache(max_entries=int(self.settings.DATASOURCE_FRAME_CACHE_SIZE))
+        self.pbp_store = PBPStore(
+            root=Path(str(self.settings.PBP_STORE_DIR)),
+            loader=lambda season: nfl.load_pbp(seasons=[season]),
+            row_group_size=int(self.settings.PBP_ROW_GROUP_SIZE),
+            refresh_hours=float(self.settings.PBP_REFRESH_HOURS),
+        )
+        self.similarity_index = SimilarityIndex()
         self.preload_teams_data()
         super().__init__()
 
@@ -55,14 +85,26 @@ class NFLReadPyDataSource:
         players: list[str] | None = None,
         position: str | None = None,
         stats: list[str] | None = None,
+        start_week: int | None = None,
+        end_week: int | None = None,
+        last_n_games: int | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
     ) -> pd.DataFrame:
         try:
             logger.info(f"Retrieving Player stats for {seasons=}, {summary_level=}")
 
-            result = nfl.load_player_stats(
-                seasons=seasons,
-                summary_level=summary_level,
-            ).to_pandas()
+            windowed = _has_game_window(start_week, end_week, last_n_games, start_date, end_date)
+            if windowed and summary_level != "week":
+                logger.info(f"Game window requested, using weekly rows instead of {summary_level=}")
+                summary_level = "week"
+
+            if summary_level == "week":
+                result = self._slice_weekly(
+                    "player_stats", seasons, start_week, end_week, start_date, end_date
+                )
+            else:
+                result = self._load_stats_frame("player_stats", seasons, summary_level)
 
             if result.empty:
                 logger.error(f"No player stats found for seasons: {seasons}")
@@ -70,20 +112,28 @@ class NFLReadPyDataSource:
 
             if position and not result.empty:
                 _before = len(result)
-                result = result[result["position"] == position.upper()].copy()
+                result = result[result["position"] == position.upper()]
                 logger.info(f"Filtered by position {position=}, rows {_before} -> {len(result)}")
 
             if players:
                 _before = len(result)
-                result = result[result["player_display_name"].str.strip().isin(players)].copy()
+                result = result[result["player_display_name"].str.strip().isin(players)]
                 logger.info(f"Filtered by players {players=}, rows {_before} -> {len(result)}")
 
+            if last_n_games:
+                _before = len(result)
+                result = take_last_n_games(result, last_n_games, "player_id")
+                logger.info(
+                    f"Filtered to {last_n_games=} per player, rows {_before} -> {len(result)}"
+                )
+
             if stats:
                 _before = len(result.columns)
                 valid_stats = [s for s in stats if s in result.columns]
                 result = result[valid_stats]
                 logger.info(f"Filtered by stats {stats=}, cols {_before} -> {len(result.columns)}")
 
+            result = result.copy()
             logger.info(
                 f"Retrieved dataframe with rows: {len(result)} cols: {list(result.columns)}"
             )
@@ -99,23 +149,40 @@ class NFLReadPyDataSource:
         summary_level: Literal["week", "reg", "post", "reg+post"] = "reg",
         teams: list[str] | None = None,
         stats: list[str] | None = None,
+        start_week: int | None = None,
+        end_week: int | None = None,
+        last_n_games: int | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
     ) -> pd.DataFrame:
         try:
             logger.info(f"Retrieving Team stats for {teams=}, {seasons=}, {summary_level=}")
 
-            df = nfl.load_team_stats(
-                seasons=seasons,
-                summary_level=summary_level,
-            ).to_pandas()
+            windowed = _has_game_window(start_week, end_week, last_n_games, start_date, end_date)
+            if windowed and summary_level != "week":
+                logger.info(f"Game window requested, using weekly rows instead of {summary_level=}")
+                summary_level = "week"
+
+            if summary_level == "week":
+                df = self._slice_weekly(
+                    "team_stats", seasons, start_week, end_week, start_date, end_date
+                )
+            else:
+                df = self._load_stats_frame("team_stats", seasons, summary_level)
 
             if df.empty:
                 raise ValueError(f"Team '{teams}' not found in nflreadpy data for {seasons=}")
 
             if teams and "ALL" not in teams:
                 _before = len(df)
-                df = df[df["team"].str.strip().isin([team.upper() for team in teams])].copy()
+                df = df[df["team"].str.strip().isin([team.upper() for team in teams])]
                 logger.info(f"Filtered by teams {teams=}, rows {_before} -> {len(df)}")
 
+            if last_n_games:
+                _before = len(df)
+                df = take_last_n_games(df, last_n_games, "team")
+                logger.info(f"Filtered to {last_n_games=} per team, rows {_before} -> {len(df)}")
+
             if stats:
                 _before = len(df.columns)
                 # Only select stats that exist in the dataframe
@@ -123,6 +190,7 @@ class NFLReadPyDataSource:
                 df = df[valid_stats]
                 logger.info(f"Filtered by stats {stats=}, cols {_before} -> {len(df.columns)}")
 
+            df = df.copy()
             logger.info(f"Retrieved dataframe shape {df.shape} cols: {list(df.columns)}")
             return df
 
@@ -130,6 +198,117 @@ class NFLReadPyDataSource:
             logger.error(f"Error retrieving team stats from nflreadpy: {e}")
             raise RetrievalError(message=f"Failed to retrieve team stats: {str(e)}") from e
 
+    def _load_stats_frame(
+        self,
+        dataset: Literal["player_stats", "team_stats"],
+        seasons: list[int],
+        summary_level: Literal["week", "reg", "post", "reg+post"],
+    ) -> pd.DataFrame:
+        loader = nfl.load_player_stats if dataset == "player_stats" else nfl.load_team_stats
+        key = (dataset, tuple(sorted(set(seasons))), summary_level)
+        return self.frame_cache.get_or_load(
+            key,
+            lambda: loader(seasons=list(key[1]), summary_level=summary_level).to_pandas(),
+        )
+
+    def _week_index(
+        self,
+        dataset: Literal["player_stats", "team_stats"],
+        seasons: list[int],
+    ) -> WeekIndexedFrame:
+        key = (dataset, tuple(sorted(set(seasons))), "week_index")
+        return self.frame_cache.get_or_load(
+            key,
+            lambda: WeekIndexedFrame(self._load_stats_frame(dataset, seasons, "week")),
+        )
+
+    def _slice_weekly(
+        self,
+        dataset: Literal["player_stats", "team_stats"],
+        seasons: list[int],
+        start_week: int | None,
+        end_week: int | None,
+        start_date: date | None,
+        end_date: date | None,
+    ) -> pd.DataFrame:
+        index = self._week_index(dataset, seasons)
+        if index.frame.empty:
+            return index.frame
+
+        if start_date is None and end_date is None:
+            result = index.slice(seasons, start_week, end_week)
+        else:
+            result = index.slice_ranges(
+                self._week_bounds(seasons, start_week, end_week, start_date, end_date)
+            )
+
+        logger.info(
+            f"Week-sliced {dataset} {start_week=} {end_week=} {start_date=} {end_date=}, "
+            f"rows {len(index)} -> {len(result)}"
+        )
+        return result
+
+    def _week_bounds(
+        self,
+        seasons: list[int],
+        start_week: int | None,
+        end_week: int | None,
+        start_date: date | None,
+        end_date: date | None,
+    ) -> dict[int, tuple[int | None, int | None]]:
+        """Inclusive (start_week, end_week) per season, narrowed by a game-date window."""
+        if start_date is None and end_date is None:
+            return dict.fromkeys(sorted(set(seasons)), (start_week, end_week))
+        date_bounds = week_bounds_for_dates(self._load_schedules(seasons), start_date, end_date)
+        return {
+            season: (
+                max(lo, start_week) if start_week is not None else lo,
+                min(hi, end_week) if end_week is not None else hi,
+            )
+            for season, (lo, hi) in date_bounds.items()
+            if season in seasons
+        }
+
+    def get_schedules(
+        self,
+        seasons: list[int],
+        teams: list[str] | None = None,
+    ) -> pd.DataFrame:
+        try:
+            logger.info(f"Retrieving schedules for {seasons=}, {teams=}")
+            df = self._load_schedules(seasons)
+            if teams and "ALL" not in teams:
+                upper = [team.upper() for team in teams]
+                df = df[df["home_team"].isin(upper) | df["away_team"].isin(upper)]
+            logger.info(f"Retrieved schedules shape {df.shape}")
+            return df.copy()
+        except Exception as e:
+            logger.error(f"Error retrieving schedules from nflreadpy: {e}")
+            raise RetrievalError(message=f"Failed to retrieve schedules: {str(e)}") from e
+
+    def join_schedules(self, df: pd.DataFrame, team_col: str = "team") -> pd.DataFrame:
+        """Add opponent, home/away, rest days, score and result columns to weekly rows."""
+        try:
+            if df.empty or "season" not in df.columns or "week" not in df.columns:
+                return df
+            seasons = sorted(pd.to_numeric(df["season"], errors="coerce").dropna().astype(int))
+            return self._team_game_index(list(dict.fromkeys(seasons))).join(df, team_col=team_col)
+        except Exception as e:
+            logger.error(f"Error joining schedules: {e}")
+            raise RetrievalError(message=f"Failed to join schedules: {str(e)}") from e
+
+    def _load_schedules(self, seasons: list[int]) -> pd.DataFrame:
+        key = ("schedules", tuple(sorted(set(seasons))))
+        return self.frame_cache.get_or_load(
+            key, lambda: optimize_schedules(nfl.load_schedules(seasons=list(key[1])).to_pandas())
+        )
+
+    def _team_game_index(self, seasons: list[int]) -> TeamGameIndex:
+        key = ("schedules", tuple(sorted(set(seasons))), "team_games")
+        return self.frame_cache.get_or_load(
+            key, lambda: TeamGameIndex(self._load_schedules(seasons))
+        )
+
     def preload_teams_data(self) -> None:
         try:
             logger.info("Preloading teams data from nflreadpy")
@@ -196,6 +375,305 @@ class NFLReadPyDataSource:
             logger.error(f"Error retrieving snap counts from nflreadpy: {e}")
             raise RetrievalError(message=f"Failed to retrieve snap counts: {str(e)}") from e
 
+    def get_pbp(
+        self,
+        seasons: list[int],
+        columns: list[str] | None = None,
+        start_week: int | None = None,
+        end_week: int | None = None,
+        teams: list[str] | None = None,
+        filters: dict[str, Any] | None = None,
+        include_participation: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Play-by-play rows read from the season/week partitioned store.
+
+        Only ``columns`` (default ``PBP_COLUMNS``) are read, and week bounds, ``teams``
+        and ``filters`` (column -> value or list of values) are pushed down to the scan.
+        """
+        try:
+            logger.info(f"Retrieving play-by-play for {seasons=}, {start_week=}, {end_week=}")
+            self.pbp_store.ensure_seasons(seasons)
+
+            predicates = build_predicates(filters)
+            if teams and "ALL" not in teams:
+                upper = [team.upper() for team in teams]
+                predicates.append(pl.col("posteam").is_in(upper) | pl.col("defteam").is_in(upper))
+
+            df = self.pbp_store.scan(
+                seasons=seasons,
+                columns=list(dict.fromkeys(["game_id", "play_id", *(columns or PBP_COLUMNS)])),
+                start_week=start_week,
+                end_week=end_week,
+                predicates=predicates,
+            ).to_pandas()
+
+            if include_participation and not df.empty:
+                participation = self.get_participation(seasons)
+                if not participation.empty:
+                    df = df.merge(
+                        participation.drop(columns=["possession_team"], errors="ignore"),
+                        left_on=["game_id", "play_id"],
+                        right_on=["nflverse_game_id", "play_id"],
+                        how="left",
+                    ).drop(columns=["nflverse_game_id"])
+
+            logger.info(f"Retrieved play-by-play shape {df.shape}")
+            return df
+        except Exception as e:
+            logger.error(f"Error retrieving play-by-play from nflreadpy: {e}")
+            raise RetrievalError(message=f"Failed to retrieve play-by-play: {str(e)}") from e
+
+    def get_participation(
+        self,
+        seasons: list[int],
+    ) -> pd.DataFrame:
+        try:
+            logger.info(f"Retrieving participation for {seasons=}")
+            key = ("participation", tuple(sorted(set(seasons))))
+            df = self.frame_cache.get_or_load(key, lambda: self._load_participation(list(key[1])))
+            logger.info(f"Retrieved participation shape {df.shape}")
+            return df
+        except Exception as e:
+            logger.error(f"Error retrieving participation from nflreadpy: {e}")
+            raise RetrievalError(message=f"Failed to retrieve participation: {str(e)}") from e
+
+    def _load_participation(self, seasons: list[int]) -> pd.DataFrame:
+        raw = nfl.load_participation(seasons=seasons)
+        columns = [c for c in PARTICIPATION_COLUMNS if c in raw.columns]
+        return raw.select(columns).to_pandas()
+
+    def get_nextgen_stats(
+        self,
+        stat_type: NextGenStatType,
+        seasons: list[int],
+        players: list[str] | None = None,
+    ) -> pd.DataFrame:
+        try:
+            logger.info(f"Retrieving {stat_type} next gen stats for {seasons=}")
+            df = self._nextgen_index(stat_type, seasons).frame
+            if players:
+                df = df[df["player_display_name"].str.strip().isin(players)]
+            logger.info(f"Retrieved next gen stats shape {df.shape}")
+            return df.copy()
+        except Exception as e:
+            logger.error(f"Error retrieving next gen stats from nflreadpy: {e}")
+            raise RetrievalError(message=f"Failed to retrieve next gen stats: {str(e)}") from e
+
+    def join_nextgen_stats(
+        self,
+        df: pd.DataFrame,
+        stat_type: NextGenStatType,
+        id_col: str = "player_id",
+    ) -> pd.DataFrame:
+        """Attach Next Gen metrics to player stats keyed on (player id, season, week)."""
+        try:
+            if df.empty or "season" not in df.columns:
+                return df
+            seasons = pd.to_numeric(df["season"], errors="coerce").dropna().astype(int)
+            index = self._nextgen_index(stat_type, sorted(set(seasons)))
+            return index.join(df, id_col=id_col)
+        except Exception as e:
+            logger.error(f"Error joining next gen stats: {e}")
+            raise RetrievalError(message=f"Failed to join next gen stats: {str(e)}") from e
+
+    def _nextgen_index(self, stat_type: NextGenStatType, seasons: list[int]) -> NextGenIndex:
+        key = ("nextgen", stat_type, tuple(sorted(set(seasons))))
+        return self.frame_cache.get_or_load(
+            key,
+            lambda: NextGenIndex(
+                optimize_nextgen(
+                    nfl.load_nextgen_stats(seasons=list(key[2]), stat_type=stat_type).to_pandas(),
+                    stat_type,
+                ),
+                stat_type,
+            ),
+        )
+
+    def get_situational_splits(
+        self,
+        seasons: list[int],
+        situations: str | list[str] | None = None,
+        level: SplitLevel = "player",
+        player_ids: list[str] | None = None,
+        teams: list[str] | None = None,
+        start_week: int | None = None,
+        end_week: int | None = None,
+        last_n_games: int | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> pd.DataFrame:
+        """
+        Per-situation player/team splits computed from play-by-play.
+
+        Full seasons are computed once per (situation set, level) and cached; ``player_ids``
+        and ``teams`` only filter the cached result. A week, date or last-N-games window is
+        applied to the plays before they are aggregated.
+        """
+        try:
+            resolved = resolve_situations(situations)
+            logger.info(f"Retrieving situational splits for {seasons=}, {resolved=}, {level=}")
+            situation_key = frozenset(resolved)
+
+            parts = []
+            if _has_game_window(start_week, end_week, last_n_games, start_date, end_date):
+                parts = self._windowed_situational_splits(
+                    seasons,
+                    resolved,
+                    level,
+                    start_week,
+                    end_week,
+                    last_n_games,
+                    start_date,
+                    end_date,
+                )
+            else:
+                for season in sorted(set(seasons)):
+                    key = ("situational_splits", season, situation_key, level)
+                    season_df = self.frame_cache.get_or_load(
+                        key, lambda s=season: self._compute_situational_splits(s, resolved, level)
+                    )
+                    if not season_df.empty:
+                        parts.append(season_df)
+
+            if not parts:
+                return pd.DataFrame()
+            df = pd.concat(parts, ignore_index=True)
+
+            if player_ids and "player_id" in df.columns:
+                df = df[df["player_id"].isin(player_ids)]
+            if teams and "ALL" not in teams and "team" in df.columns:
+                df = df[df["team"].isin([team.upper() for team in teams])]
+
+            logger.info(f"Retrieved situational splits shape {df.shape}")
+            return df.reset_index(drop=True)
+        except Exception as e:
+            logger.error(f"Error computing situational splits: {e}")
+            raise RetrievalError(message=f"Failed to compute situational splits: {str(e)}") from e
+
+    def _compute_situational_splits(
+        self, season: int, situations: list[str], level: SplitLevel
+    ) -> pd.DataFrame:
+        pbp = self.get_pbp(
+            seasons=[season],
+            columns=SITUATION_PBP_COLUMNS,
+            include_participation="under_pressure" in situations,
+        )
+        splits = compute_situational_splits(pbp, situations, level=level)
+        if not splits.empty:
+            splits.insert(0, "season", season)
+        return splits
+
+    def _windowed_situational_splits(
+        self,
+        seasons: list[int],
+        situations: list[str],
+        level: SplitLevel,
+        start_week: int | None,
+        end_week: int | None,
+        last_n_games: int | None,
+        start_date: date | None,
+        end_date: date | None,
+    ) -> list[pd.DataFrame]:
+        bounds = self._week_bounds(seasons, start_week, end_week, start_date, end_date)
+        frames = []
+        for season, (low, high) in sorted(bounds.items()):
+            pbp = self.get_pbp(
+                seasons=[season],
+                columns=SITUATION_PBP_COLUMNS,
+                start_week=low,
+                end_week=high,
+                include_participation="under_pressure" in situations,
+            )
+            if not pbp.empty:
+                frames.append(pbp)
+        if not frames:
+            return []
+        pbp = pd.concat(frames, ignore_index=True)
+        if last_n_games:
+            pbp = restrict_to_last_n_games(pbp, last_n_games, level)
+
+        parts = []
+        for season, plays in pbp.groupby("season", sort=True):
+            splits = compute_situational_splits(plays, situations, level=level)
+            if not splits.empty:
+                splits.insert(0, "season", int(season))
+                parts.append(splits)
+        return parts
+
+    def get_stat_distributions(self, season: int) -> StatDistributions:
+        """Per-position stat distributions for a season, built once and cached."""
+        key = ("stat_distributions", season)
+        return self.frame_cache.get_or_load(
+            key,
+            lambda: StatDistributions(
+                self._load_stats_frame("player_stats", [season], "reg"), season
+            ),
+        )
+
+    def get_league_context(self, df: pd.DataFrame, stats: list[str] | None = None) -> pd.DataFrame:
+        """Percentile ranks and z-scores of season-level player rows against their position."""
+        try:
+            if df.empty or "season" not in df.columns:
+                return pd.DataFrame()
+            seasons = sorted(set(pd.to_numeric(df["season"], errors="coerce").dropna().astype(int)))
+            logger.info(f"Computing league context for {seasons=}, {stats=}")
+            distributions = {season: self.get_stat_distributions(season) for season in seasons}
+            return league_context(df, distributions, stats)
+        except Exception as e:
+            logger.error(f"Error computing league context: {e}")
+            raise RetrievalError(message=f"Failed to compute league context: {str(e)}") from e
+
+    def get_similar_players(
+        self,
+        player: str,
+        season: int,
+        k: int = 5,
+        seasons: list[int] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Nearest player-seasons at the same position by cosine similarity of standardized
+        per-game stat profiles. Candidates come from ``seasons`` (default: recent history).
+        """
+        try:
+            if seasons is None:
+                history = int(self.settings.SIMILARITY_HISTORY_SEASONS)
+                seasons = list(range(CURRENT_SEASON - history + 1, CURRENT_SEASON + 1))
+            candidates = sorted(set(seasons))
+            logger.info(f"Finding {k} players similar to {player} ({season}) in {candidates}")
+            self._ensure_similarity_seasons(sorted({*candidates, season}))
+
+            located = self.similarity_index.locate(player, season)
+            if located is None:
+                return pd.DataFrame()
+            position, row = located
+            return self.similarity_index.most_similar(position, [row], k=k, seasons=candidates)[0]
+        except Exception as e:
+            logger.error(f"Error finding similar players: {e}")
+            raise RetrievalError(message=f"Failed to find similar players: {str(e)}") from e
+
+    def _ensure_similarity_seasons(self, seasons: list[int]) -> None:
+        for season in seasons:
+            version = self._similarity_version(season)
+            if self.similarity_index.has_season(season, version):
+                continue
+            if self.similarity_index.has_season(season):
+                # The in-progress season moved on; reload its totals and rebuild only its block
+                stale = {("player_stats", (season,), "reg"), ("stat_distributions", season)}
+                self.frame_cache.invalidate(stale.__contains__)
+            frame = self._load_stats_frame("player_stats", [season], "reg")
+            self.similarity_index.add_season(season, frame, version)
+
+    def similarity_version(self) -> str:
+        """Version of the similarity data; changes whenever the live season is rebuilt."""
+        return self._similarity_version(CURRENT_SEASON)
+
+    def _similarity_version(self, season: int) -> str:
+        if season < CURRENT_SEASON:
+            return "final"
+        window = float(self.settings.SIMILARITY_REFRESH_HOURS) * 3600
+        return f"live-{int(time.time() // window)}"
+
     def get_player_data(
         self,
     ) -> pd.DataFrame:
@@ -207,3 +685,13 @@ class NFLReadPyDataSource:
         except Exception as e:
             logger.error(f"Error retrieving player data from nflreadpy: {e}")
             raise RetrievalError(message=f"Failed to retrieve player data: {str(e)}") from e
+
+
+def _has_game_window(
+    start_week: int | None,
+    end_week: int | None,
+    last_n_games: int | None,
+    start_date: date | None,
+    end_date: date | None,
+) -> bool:
+    return any(v is not None for v in (start_week, end_week, last_n_games, start_date, end_date))
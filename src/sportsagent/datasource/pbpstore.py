@@ -0,0 +1,145 @@
+import shutil
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from sportsagent.config import setup_logging
+from sportsagent.constants import CURRENT_SEASON
+
+logger = setup_logging(__name__)
+
+PARTITION_COLUMNS = ["season", "week"]
+_INGESTED_MARKER = "_INGESTED"
+
+
+class PBPStore:
+    """
+    Season/week hive-partitioned parquet store for play-by-play data.
+
+    Each season is downloaded once and written as ``season=YYYY/week=W/*.parquet``.
+    Reads are lazy scans, so partition pruning, column projection and row-group
+    predicate pushdown happen inside the parquet reader.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        loader: Callable[[int], pl.DataFrame],
+        row_group_size: int = 16384,
+        refresh_hours: float = 12.0,
+    ) -> None:
+        self.root = Path(root)
+        self.loader = loader
+        self.row_group_size = row_group_size
+        self.refresh_hours = refresh_hours
+        self._lock = threading.Lock()
+
+    def season_dir(self, season: int) -> Path:
+        return self.root / f"season={season}"
+
+    def has_season(self, season: int) -> bool:
+        marker = self.season_dir(season) / _INGESTED_MARKER
+        if not marker.exists():
+            return False
+        if season < CURRENT_SEASON:
+            return True
+        age_hours = (time.time() - marker.stat().st_mtime) / 3600
+        return age_hours < self.refresh_hours
+
+    def ensure_seasons(self, seasons: list[int]) -> None:
+        try:
+            with self._lock:
+                for season in sorted(set(seasons)):
+                    if not self.has_season(season):
+                        self.ingest_season(season)
+        except Exception as e:
+            logger.error(f"Failed to prepare play-by-play partitions for {seasons=}: {e}")
+            raise
+
+    def ingest_season(self, season: int) -> None:
+        try:
+            logger.info(f"Ingesting play-by-play for {season=} into {self.root}")
+            df = self.loader(season)
+            if df.is_empty():
+                # Mark it anyway so an unplayed season is not re-downloaded on every query
+                logger.warning(f"No play-by-play rows returned for {season=}")
+                self.season_dir(season).mkdir(parents=True, exist_ok=True)
+                (self.season_dir(season) / _INGESTED_MARKER).touch()
+                return
+
+            sort_cols = [c for c in ("posteam", "game_id", "play_id") if c in df.columns]
+            if sort_cols:
+                df = df.sort(sort_cols)
+
+            staging = self.root / f".staging_season={season}"
+            shutil.rmtree(staging, ignore_errors=True)
+            df.write_parquet(
+                staging,
+                partition_by=PARTITION_COLUMNS,
+                row_group_size=self.row_group_size,
+                statistics=True,
+            )
+
+            target = self.season_dir(season)
+            shutil.rmtree(target, ignore_errors=True)
+            (staging / f"season={season}").rename(target)
+            shutil.rmtree(staging, ignore_errors=True)
+            (target / _INGESTED_MARKER).touch()
+            logger.info(f"Ingested {df.height} plays for {season=}")
+        except Exception as e:
+            logger.error(f"Failed to ingest play-by-play for {season=}: {e}")
+            raise
+
+    def scan(
+        self,
+        seasons: list[int],
+        columns: list[str] | None = None,
+        start_week: int | None = None,
+        end_week: int | None = None,
+        predicates: list[pl.Expr] | None = None,
+    ) -> pl.DataFrame:
+        try:
+            # Seasons ingested empty have a marker but no week partitions
+            available = [s for s in sorted(set(seasons)) if any(self.season_dir(s).glob("week=*"))]
+            if not available:
+                return pl.DataFrame()
+
+            lf = pl.scan_parquet(
+                self.root / "season=*" / "**" / "*.parquet", hive_partitioning=True
+            )
+            conditions = [pl.col("season").is_in(available)]
+            if start_week is not None:
+                conditions.append(pl.col("week") >= start_week)
+            if end_week is not None:
+                conditions.append(pl.col("week") <= end_week)
+            conditions.extend(predicates or [])
+            lf = lf.filter(pl.all_horizontal(conditions))
+
+            if columns:
+                schema = lf.collect_schema()
+                projected = [
+                    c for c in dict.fromkeys([*PARTITION_COLUMNS, *columns]) if c in schema
+                ]
+                lf = lf.select(projected)
+
+            return lf.collect()
+        except Exception as e:
+            logger.error(f"Failed to scan play-by-play store for {seasons=}: {e}")
+            raise
+
+
+def build_predicates(filters: dict[str, Any] | None) -> list[pl.Expr]:
+    """Equality / membership filters expressed as polars predicates for pushdown."""
+    predicates = []
+    for column, value in (filters or {}).items():
+        if isinstance(value, list | tuple | set | frozenset):
+            predicates.append(pl.col(column).is_in(list(value)))
+        elif value is None:
+            predicates.append(pl.col(column).is_null())
+        else:
+            predicates.append(pl.col(column) == value)
+    return predicates
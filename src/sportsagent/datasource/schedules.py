@@ -0,0 +1,156 @@
+import numpy as np
+import pandas as pd
+
+from sportsagent.config import setup_logging
+from sportsagent.constants import SCHEDULE_COLUMNS
+
+logger = setup_logging(__name__)
+
+GAME_KEY = ["season", "week", "team"]
+TEAM_GAME_COLUMNS = [
+    "game_id",
+    "gameday",
+    "opponent",
+    "home_away",
+    "rest_days",
+    "team_score",
+    "opponent_score",
+    "point_diff",
+    "game_result",
+]
+
+_CATEGORY_COLUMNS = [
+    "game_type",
+    "weekday",
+    "away_team",
+    "home_team",
+    "location",
+    "roof",
+    "surface",
+]
+_SMALL_INT_COLUMNS = [
+    "season",
+    "week",
+    "away_score",
+    "home_score",
+    "away_rest",
+    "home_rest",
+    "div_game",
+    "overtime",
+]
+
+
+def optimize_schedules(df: pd.DataFrame) -> pd.DataFrame:
+    """Project to ``SCHEDULE_COLUMNS`` and downcast repeated strings / small ints."""
+    try:
+        result = df[[c for c in SCHEDULE_COLUMNS if c in df.columns]].copy()
+        for col in _CATEGORY_COLUMNS:
+            if col in result.columns:
+                result[col] = result[col].astype("category")
+        for col in _SMALL_INT_COLUMNS:
+            if col in result.columns:
+                values = pd.to_numeric(result[col], errors="coerce")
+                result[col] = values.astype("float32" if values.isna().any() else "int16")
+        return result
+    except Exception as e:
+        logger.error(f"Failed to optimize schedules frame: {e}")
+        raise
+
+
+def build_team_games(schedules: pd.DataFrame) -> pd.DataFrame:
+    """One row per (season, week, team) with the game seen from that team's side."""
+    try:
+        home_scores = pd.to_numeric(schedules["home_score"], errors="coerce").to_numpy(float)
+        away_scores = pd.to_numeric(schedules["away_score"], errors="coerce").to_numpy(float)
+        if "location" in schedules.columns:
+            neutral = (schedules["location"].astype(str) == "Neutral").to_numpy()
+        else:
+            neutral = np.zeros(len(schedules), dtype=bool)
+
+        def side(team_col: str, opp_col: str, rest_col: str, scores, opp_scores, venue: str):
+            return pd.DataFrame(
+                {
+                    "season": schedules["season"].astype("int64").to_numpy(),
+                    "week": schedules["week"].astype("int64").to_numpy(),
+                    "team": schedules[team_col].astype(str).to_numpy(),
+                    "game_id": schedules["game_id"].to_numpy(),
+                    "gameday": schedules["gameday"].to_numpy(),
+                    "opponent": schedules[opp_col].astype(str).to_numpy(),
+                    "home_away": np.where(neutral, "neutral", venue),
+                    "rest_days": pd.to_numeric(schedules[rest_col], errors="coerce").to_numpy(
+                        float
+                    ),
+                    "team_score": scores,
+                    "opponent_score": opp_scores,
+                }
+            )
+
+        games = pd.concat(
+            [
+                side("home_team", "away_team", "home_rest", home_scores, away_scores, "home"),
+                side("away_team", "home_team", "away_rest", away_scores, home_scores, "away"),
+            ],
+            ignore_index=True,
+        )
+        diff = games["team_score"].to_numpy() - games["opponent_score"].to_numpy()
+        games["point_diff"] = diff
+        games["game_result"] = np.select(
+            [diff > 0, diff < 0, diff == 0], ["W", "L", "T"], default=None
+        )
+        for col in ("team", "opponent", "home_away", "game_result"):
+            games[col] = games[col].astype("category")
+
+        return games.sort_values(GAME_KEY, kind="stable").set_index(GAME_KEY)
+    except Exception as e:
+        logger.error(f"Failed to build team games from schedules: {e}")
+        raise
+
+
+class TeamGameIndex:
+    """
+    Team-game rows keyed by a hashed (season, week, team) index, so decorating a
+    weekly frame is one vectorized ``get_indexer`` lookup instead of a merge.
+    """
+
+    def __init__(self, schedules: pd.DataFrame) -> None:
+        self.games = build_team_games(schedules)
+        self._index = pd.MultiIndex.from_arrays(
+            [
+                self.games.index.get_level_values("season").to_numpy(np.int64),
+                self.games.index.get_level_values("week").to_numpy(np.int64),
+                self.games.index.get_level_values("team").astype(str).to_numpy(),
+            ],
+            names=GAME_KEY,
+        )
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def join(self, df: pd.DataFrame, team_col: str = "team") -> pd.DataFrame:
+        try:
+            if df.empty or any(c not in df.columns for c in ("season", "week", team_col)):
+                return df
+
+            keys = pd.MultiIndex.from_arrays(
+                [
+                    pd.to_numeric(df["season"], errors="coerce").fillna(-1).to_numpy(np.int64),
+                    pd.to_numeric(df["week"], errors="coerce").fillna(-1).to_numpy(np.int64),
+                    df[team_col].astype(str).str.strip().str.upper().to_numpy(),
+                ]
+            )
+            positions = self._index.get_indexer(keys)
+            found = positions >= 0
+
+            result = df.copy()
+            for col in TEAM_GAME_COLUMNS:
+                values = self.games[col].to_numpy(dtype=object).take(np.where(found, positions, 0))
+                values[~found] = None
+                result[col] = values
+            for col in ("rest_days", "team_score", "opponent_score", "point_diff"):
+                result[col] = pd.to_numeric(result[col], errors="coerce")
+
+            logger.info(f"Joined schedules onto {int(found.sum())}/{len(df)} rows")
+            return result
+        except Exception as e:
+            logger.error(f"Failed to join schedules: {e}")
+            raise
@@ -0,0 +1,192 @@
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from sportsagent.config import setup_logging
+from sportsagent.constants import PLAYER_STATS_COMMON, POSITION_STATS_MAP
+from sportsagent.datasource.distributions import qualified_pool
+
+logger = setup_logging(__name__)
+
+SIMILARITY_POSITIONS = ["QB", "RB", "WR", "TE", "K"]
+# Already normalized for playing time, so they are not divided by games
+RATE_STAT_MARKERS = ("share", "rate", "pct", "cpoe", "pacr", "racr", "wopr", "dakota", "long")
+_META_COLUMNS = ["player_id", "player_display_name", "team", "season", "games"]
+
+
+def feature_columns(frame: pd.DataFrame, position: str) -> list[str]:
+    common = set(PLAYER_STATS_COMMON)
+    return [
+        c
+        for c in dict.fromkeys(POSITION_STATS_MAP[position])
+        if c not in common
+        and c in frame.columns
+        and pd.api.types.is_numeric_dtype(frame[c])
+        and frame[c].dtype != bool
+    ]
+
+
+@dataclass
+class SeasonBlock:
+    """L2-normalized per-game z-score vectors for one (position, season) player pool."""
+
+    position: str
+    season: int
+    features: list[str]
+    vectors: np.ndarray
+    meta: pd.DataFrame
+
+
+def build_season_block(frame: pd.DataFrame, position: str, season: int) -> SeasonBlock | None:
+    """
+    Standardize within the season's position pool so comps across eras compare relative
+    production, then L2-normalize so cosine similarity is a plain dot product.
+    """
+    if "position" in frame.columns:
+        frame = frame[frame["position"].astype(str) == position]
+    pool = qualified_pool(frame)
+    features = feature_columns(pool, position)
+    if len(pool) < 2 or not features:
+        return None
+
+    values = pool[features].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    if "games" in pool.columns:
+        games = pd.to_numeric(pool["games"], errors="coerce").to_numpy(dtype=np.float64)
+        games = np.where(games > 0, games, np.nan)[:, None]
+        counting = np.array([not any(m in f for m in RATE_STAT_MARKERS) for f in features])
+        values[:, counting] = values[:, counting] / games
+
+    values = np.nan_to_num(values, nan=0.0)
+    std = values.std(axis=0)
+    z = (values - values.mean(axis=0)) / np.where(std > 0, std, 1.0)
+    norms = np.linalg.norm(z, axis=1, keepdims=True)
+    vectors = np.ascontiguousarray(z / np.where(norms > 0, norms, 1.0), dtype=np.float32)
+
+    meta = pool[[c for c in _META_COLUMNS if c in pool.columns]].reset_index(drop=True)
+    meta = meta.assign(season=season, position=position)
+    return SeasonBlock(position, season, features, vectors, meta)
+
+
+class SimilarityIndex:
+    """
+    Season blocks per position, stacked on demand into one contiguous float32 matrix per
+    position. Replacing a season (e.g. the in-progress one) only rebuilds that season's
+    blocks; the position matrices are re-stacked lazily on the next query.
+    """
+
+    def __init__(self) -> None:
+        self._blocks: dict[tuple[str, int], SeasonBlock] = {}
+        self._matrices: dict[str, tuple[np.ndarray, pd.DataFrame, list[str]]] = {}
+        self._versions: dict[int, str] = {}
+        self._lock = threading.RLock()
+
+    def has_season(self, season: int, version: str | None = None) -> bool:
+        with self._lock:
+            indexed = self._versions.get(season)
+            return indexed is not None and (version is None or indexed == version)
+
+    def add_season(self, season: int, frame: pd.DataFrame, version: str = "") -> None:
+        try:
+            blocks = {
+                position: build_season_block(frame, position, season)
+                for position in SIMILARITY_POSITIONS
+            }
+            with self._lock:
+                for position, block in blocks.items():
+                    self._blocks.pop((position, season), None)
+                    if block is not None:
+                        self._blocks[(position, season)] = block
+                    self._matrices.pop(position, None)
+                self._versions[season] = version
+            logger.info(f"Indexed {season} similarity blocks (version {version or 'n/a'})")
+        except Exception as e:
+            logger.error(f"Failed to index {season} for similarity: {e}")
+            raise
+
+    def _matrix(self, position: str) -> tuple[np.ndarray, pd.DataFrame, list[str]]:
+        with self._lock:
+            if position not in self._matrices:
+                blocks = sorted(
+                    (b for (p, _), b in self._blocks.items() if p == position),
+                    key=lambda b: b.season,
+                )
+                if not blocks:
+                    raise KeyError(f"No similarity data indexed for {position}")
+                # Seasons can expose different stat columns; align on the shared ones
+                features = [f for f in blocks[0].features if all(f in b.features for b in blocks)]
+                matrix = np.ascontiguousarray(
+                    np.vstack(
+                        [b.vectors[:, [b.features.index(f) for f in features]] for b in blocks]
+                    )
+                )
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                matrix /= np.where(norms > 0, norms, 1.0)
+                meta = pd.concat([b.meta for b in blocks], ignore_index=True)
+                self._matrices[position] = (matrix, meta, features)
+            return self._matrices[position]
+
+    def locate(self, player: str, season: int) -> tuple[str, int] | None:
+        """
+        (position, matrix row) of a player-season. An id or full display name wins;
+        otherwise a partial name must match exactly one player, or ValueError is raised.
+        """
+        needle = player.strip().lower()
+        with self._lock:
+            blocks = [b for (_, s), b in self._blocks.items() if s == season]
+        exact: list[tuple[SeasonBlock, int]] = []
+        partial: list[tuple[SeasonBlock, int]] = []
+        for block in blocks:
+            names = block.meta["player_display_name"].astype(str).str.lower()
+            matches = names == needle
+            if "player_id" in block.meta.columns:
+                matches |= block.meta["player_id"].astype(str).str.lower() == needle
+            exact.extend((block, int(i)) for i in np.flatnonzero(matches.to_numpy()))
+            contains = names.str.contains(needle, regex=False).to_numpy(dtype=bool)
+            partial.extend((block, int(i)) for i in np.flatnonzero(contains))
+
+        found = exact or partial
+        if not found:
+            return None
+        if len(found) > 1:
+            candidates = ", ".join(
+                sorted({str(b.meta["player_display_name"].iloc[i]) for b, i in found})
+            )
+            raise ValueError(f"'{player}' matches several players in {season}: {candidates}")
+        block, row = found[0]
+        _, meta, _ = self._matrix(block.position)
+        # Blocks are stacked in season order, so a block's rows stay contiguous
+        offset = int(np.argmax((meta["season"] == season).to_numpy()))
+        return block.position, offset + row
+
+    def most_similar(
+        self,
+        position: str,
+        rows: list[int],
+        k: int = 5,
+        seasons: list[int] | None = None,
+    ) -> list[pd.DataFrame]:
+        """Top-k neighbours for several query rows from one batched matrix product."""
+        matrix, meta, _ = self._matrix(position)
+        scores = matrix[rows] @ matrix.T
+        if seasons:
+            scores[:, ~meta["season"].isin(seasons).to_numpy()] = -np.inf
+        ids = meta["player_id"].astype(str).to_numpy() if "player_id" in meta.columns else None
+
+        results = []
+        for query_scores, row in zip(scores, rows, strict=True):
+            # Other seasons of the same player are trivially similar; leave them out
+            query_scores[row] = -np.inf
+            if ids is not None:
+                query_scores[ids == ids[row]] = -np.inf
+            top_k = min(k, int(np.isfinite(query_scores).sum()))
+            if top_k == 0:
+                results.append(meta.iloc[[]].assign(similarity=[]))
+                continue
+            top = np.argpartition(-query_scores, top_k - 1)[:top_k]
+            top = top[np.argsort(-query_scores[top], kind="stable")]
+            results.append(
+                meta.iloc[top].assign(similarity=query_scores[top].round(4)).reset_index(drop=True)
+            )
+        return results
@@ -0,0 +1,301 @@
+from collections.abc import Callable
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from sportsagent.config import setup_logging
+
+logger = setup_logging(__name__)
+
+type SituationMask = Callable[[dict[str, np.ndarray]], np.ndarray]
+type SplitLevel = Literal["player", "team"]
+
+SITUATION_PBP_COLUMNS = [
+    "posteam",
+    "down",
+    "ydstogo",
+    "yardline_100",
+    "goal_to_go",
+    "half_seconds_remaining",
+    "pass",
+    "rush",
+    "pass_attempt",
+    "complete_pass",
+    "yards_gained",
+    "epa",
+    "success",
+    "touchdown",
+    "first_down",
+    "interception",
+    "sack",
+    "qb_hit",
+    "passer_player_id",
+    "passer_player_name",
+    "rusher_player_id",
+    "rusher_player_name",
+    "receiver_player_id",
+    "receiver_player_name",
+]
+
+
+def _under_pressure(c: dict[str, np.ndarray]) -> np.ndarray:
+    hit_or_sack = (c["qb_hit"] == 1) | (c["sack"] == 1)
+    pressure = c.get("was_pressure")
+    if pressure is None:
+        return hit_or_sack
+    known = ~np.isnan(pressure)
+    return np.where(known, pressure == 1, hit_or_sack)
+
+
+SITUATIONS: dict[str, SituationMask] = {
+    "all": lambda c: np.ones(len(c["down"]), dtype=bool),
+    "red_zone": lambda c: c["yardline_100"] <= 20,
+    "goal_to_go": lambda c: c["goal_to_go"] == 1,
+    "third_down": lambda c: c["down"] == 3,
+    "fourth_down": lambda c: c["down"] == 4,
+    "two_minute_drill": lambda c: c["half_seconds_remaining"] <= 120,
+    "under_pressure": _under_pressure,
+    "first_and_10": lambda c: (c["down"] == 1) & (c["ydstogo"] >= 10),
+    "second_and_short": lambda c: (c["down"] == 2) & (c["ydstogo"] <= 3),
+    "second_and_long": lambda c: (c["down"] == 2) & (c["ydstogo"] >= 7),
+    "third_and_short": lambda c: (c["down"] == 3) & (c["ydstogo"] <= 3),
+    "third_and_medium": lambda c: (c["down"] == 3) & (c["ydstogo"] >= 4) & (c["ydstogo"] <= 6),
+    "third_and_long": lambda c: (c["down"] == 3) & (c["ydstogo"] >= 7),
+    "own_territory": lambda c: c["yardline_100"] > 50,
+    "opponent_territory": lambda c: (c["yardline_100"] <= 50) & (c["yardline_100"] > 20),
+}
+
+SITUATION_GROUPS: dict[str, list[str]] = {
+    "down_distance": [
+        "first_and_10",
+        "second_and_short",
+        "second_and_long",
+        "third_and_short",
+        "third_and_medium",
+        "third_and_long",
+        "fourth_down",
+    ],
+    "field_position": ["own_territory", "opponent_territory", "red_zone", "goal_to_go"],
+}
+
+_METRICS = [
+    ("plays", None),
+    ("pass_attempts", "pass_attempt"),
+    ("completions", "complete_pass"),
+    ("yards", "yards_gained"),
+    ("epa", "epa"),
+    ("successes", "success"),
+    ("touchdowns", "touchdown"),
+    ("first_downs", "first_down"),
+    ("interceptions", "interception"),
+    ("sacks", "sack"),
+]
+
+_ROLES = [
+    ("passer", "passer_player_id", "passer_player_name"),
+    ("rusher", "rusher_player_id", "rusher_player_name"),
+    ("receiver", "receiver_player_id", "receiver_player_name"),
+]
+
+
+def resolve_situations(situations: str | list[str] | None) -> list[str]:
+    """Expand group names ("down_distance") and comma lists into known situation keys."""
+    if not situations:
+        return ["all", "red_zone", "third_down", "two_minute_drill", "under_pressure"]
+    if isinstance(situations, str):
+        situations = situations.replace(";", ",").split(",")
+
+    resolved: list[str] = []
+    for raw in situations:
+        name = raw.strip().lower().replace(" ", "_").replace("-", "_")
+        if name in SITUATION_GROUPS:
+            resolved.extend(SITUATION_GROUPS[name])
+        elif name in SITUATIONS:
+            resolved.append(name)
+        else:
+            logger.warning(f"Unknown situation '{raw}', skipping")
+    return list(dict.fromkeys(["all", *resolved]))
+
+
+def compute_situational_splits(
+    pbp: pd.DataFrame,
+    situations: list[str],
+    level: SplitLevel = "player",
+) -> pd.DataFrame:
+    """
+    Player (by passer/rusher/receiver role) or team splits for every situation in a
+    single grouped reduction: plays are scored against all situation masks at once,
+    sorted by group, and summed with ``np.add.reduceat``.
+    """
+    try:
+        unknown = [s for s in situations if s not in SITUATIONS]
+        if unknown:
+            raise ValueError(f"Unknown situations: {unknown}")
+        if pbp.empty:
+            return pd.DataFrame()
+
+        plays = pbp[(_numeric(pbp, "pass") == 1) | (_numeric(pbp, "rush") == 1)]
+        if plays.empty:
+            return pd.DataFrame()
+
+        columns = {
+            col: _numeric(plays, col)
+            for col in (
+                "down",
+                "ydstogo",
+                "yardline_100",
+                "goal_to_go",
+                "half_seconds_remaining",
+                "qb_hit",
+                "sack",
+            )
+        }
+        if "was_pressure" in plays.columns:
+            columns["was_pressure"] = _numeric(plays, "was_pressure")
+
+        masks = np.column_stack([SITUATIONS[s](columns) for s in situations]).astype(np.float32)
+        values = np.column_stack(
+            [
+                np.ones(len(plays), dtype=np.float32)
+                if source is None
+                else np.nan_to_num(_numeric(plays, source)).astype(np.float32)
+                for _, source in _METRICS
+            ]
+        )
+
+        row_idx, keys, names, roles = _group_rows(plays, level)
+        if len(row_idx) == 0:
+            return pd.DataFrame()
+
+        codes, uniques = pd.factorize(pd.MultiIndex.from_arrays([keys, roles]))
+        order = np.argsort(codes, kind="stable")
+        sorted_codes = codes[order]
+        starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+        sorted_rows = row_idx[order]
+
+        weighted = (masks[sorted_rows][:, :, None] * values[sorted_rows][:, None, :]).reshape(
+            len(sorted_rows), -1
+        )
+        totals = np.add.reduceat(weighted, starts, axis=0).reshape(
+            len(starts), len(situations), len(_METRICS)
+        )
+
+        group_codes = sorted_codes[starts]
+        group_keys = uniques[group_codes]
+        first_names = names[order][starts]
+
+        n_groups, n_situations = len(starts), len(situations)
+        result = pd.DataFrame(
+            totals.reshape(n_groups * n_situations, len(_METRICS)),
+            columns=[name for name, _ in _METRICS],
+        )
+        entity = np.repeat(np.array([k[0] for k in group_keys], dtype=object), n_situations)
+        if level == "player":
+            result.insert(0, "player_id", entity)
+            result.insert(1, "player_name", np.repeat(first_names, n_situations))
+            result.insert(2, "role", np.repeat(np.array([k[1] for k in group_keys]), n_situations))
+        else:
+            result.insert(0, "team", entity)
+        result.insert(result.columns.get_loc("plays"), "situation", np.tile(situations, n_groups))
+
+        result = result[result["plays"] > 0].reset_index(drop=True)
+        plays_col = result["plays"].to_numpy()
+        result["epa_per_play"] = result["epa"].to_numpy() / plays_col
+        result["success_rate"] = result["successes"].to_numpy() / plays_col
+        result["yards_per_play"] = result["yards"].to_numpy() / plays_col
+        return result.round(4)
+    except Exception as e:
+        logger.error(f"Failed to compute situational splits for {situations=}: {e}")
+        raise
+
+
+def restrict_to_last_n_games(
+    pbp: pd.DataFrame, n: int, level: SplitLevel = "player"
+) -> pd.DataFrame:
+    """
+    Plays from each team's (or player's) most recent ``n`` games. At player level a play
+    outside one player's window only loses that player's role id, so it still counts for
+    the other players on it.
+    """
+    try:
+        if pbp.empty:
+            return pbp
+        plays = pbp.sort_values(["season", "week"], kind="stable")
+        if level == "team":
+            games = plays[["posteam", "game_id"]].dropna().drop_duplicates()
+            recent = pd.MultiIndex.from_frame(games.groupby("posteam", sort=False).tail(n))
+            return plays[pd.MultiIndex.from_frame(plays[["posteam", "game_id"]]).isin(recent)]
+
+        roles = [(id_col, name_col) for _, id_col, name_col in _ROLES if id_col in plays.columns]
+        if not roles:
+            return plays
+        appearances = (
+            pd.concat(
+                [
+                    plays[[id_col, "game_id", "season", "week"]].set_axis(
+                        ["player_id", "game_id", "season", "week"], axis=1
+                    )
+                    for id_col, _ in roles
+                ],
+                ignore_index=True,
+            )
+            .dropna(subset=["player_id"])
+            .drop_duplicates(["player_id", "game_id"])
+            .sort_values(["season", "week"], kind="stable")
+        )
+        recent = pd.MultiIndex.from_frame(
+            appearances.groupby("player_id", sort=False).tail(n)[["player_id", "game_id"]]
+        )
+
+        plays = plays.copy()
+        for id_col, name_col in roles:
+            outside = ~pd.MultiIndex.from_arrays([plays[id_col], plays["game_id"]]).isin(recent)
+            plays.loc[outside, [c for c in (id_col, name_col) if c in plays.columns]] = None
+        return plays
+    except Exception as e:
+        logger.error(f"Failed to restrict plays to the last {n} games: {e}")
+        raise
+
+
+def _numeric(df: pd.DataFrame, column: str) -> np.ndarray:
+    if column not in df.columns:
+        return np.full(len(df), np.nan)
+    return pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+
+
+def _group_rows(
+    plays: pd.DataFrame, level: SplitLevel
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    positions = np.arange(len(plays))
+    if level == "team":
+        teams = plays["posteam"].to_numpy(dtype=object)
+        valid = pd.notna(teams)
+        keep = positions[valid]
+        return keep, teams[valid], teams[valid], np.full(len(keep), "team", dtype=object)
+
+    row_parts, key_parts, name_parts, role_parts = [], [], [], []
+    for role, id_col, name_col in _ROLES:
+        if id_col not in plays.columns:
+            continue
+        ids = plays[id_col].to_numpy(dtype=object)
+        valid = pd.notna(ids)
+        row_parts.append(positions[valid])
+        key_parts.append(ids[valid])
+        names = (
+            plays[name_col].to_numpy(dtype=object)
+            if name_col in plays.columns
+            else np.full(len(plays), None, dtype=object)
+        )
+        name_parts.append(names[valid])
+        role_parts.append(np.full(int(valid.sum()), role, dtype=object))
+
+    if not row_parts:
+        empty = np.array([], dtype=object)
+        return np.array([], dtype=np.int64), empty, empty, empty
+    return (
+        np.concatenate(row_parts),
+        np.concatenate(key_parts),
+        np.concatenate(name_parts),
+        np.concatenate(role_parts),
+    )
@@ -0,0 +1,97 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from sportsagent.config import setup_logging
+
+logger = setup_logging(__name__)
+
+_WEEK_SPAN = 100
+
+
+class WeekIndexedFrame:
+    """
+    Weekly stats frame sorted on (season, week) so week windows resolve to
+    contiguous row ranges via binary search instead of boolean masks.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        try:
+            self.frame = df.sort_values(["season", "week"], kind="stable").reset_index(drop=True)
+            self._keys = _season_week_keys(self.frame)
+        except Exception as e:
+            logger.error(f"Failed to build week index: {e}")
+            raise
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def slice(
+        self,
+        seasons: list[int],
+        start_week: int | None = None,
+        end_week: int | None = None,
+    ) -> pd.DataFrame:
+        bounds = dict.fromkeys(seasons, (start_week, end_week))
+        return self.slice_ranges(bounds)
+
+    def slice_ranges(self, bounds: dict[int, tuple[int | None, int | None]]) -> pd.DataFrame:
+        try:
+            parts = []
+            for season in sorted(bounds):
+                start_week, end_week = bounds[season]
+                lo = season * _WEEK_SPAN + (start_week if start_week is not None else 0)
+                hi = season * _WEEK_SPAN + (end_week if end_week is not None else _WEEK_SPAN - 1)
+                left = int(np.searchsorted(self._keys, lo, side="left"))
+                right = int(np.searchsorted(self._keys, hi, side="right"))
+                if right > left:
+                    parts.append(self.frame.iloc[left:right])
+
+            if not parts:
+                return self.frame.iloc[0:0]
+            if len(parts) == 1:
+                return parts[0]
+            return pd.concat(parts, ignore_index=True)
+        except Exception as e:
+            logger.error(f"Failed to slice week index for {bounds=}: {e}")
+            raise
+
+
+def _season_week_keys(df: pd.DataFrame) -> np.ndarray:
+    seasons = pd.to_numeric(df["season"], errors="coerce").fillna(0).to_numpy(np.int64)
+    weeks = pd.to_numeric(df["week"], errors="coerce").fillna(0).to_numpy(np.int64)
+    return seasons * _WEEK_SPAN + weeks
+
+
+def week_bounds_for_dates(
+    schedules: pd.DataFrame,
+    start_date: date | None,
+    end_date: date | None,
+) -> dict[int, tuple[int, int]]:
+    """Map a game-date window onto inclusive (start_week, end_week) bounds per season."""
+    try:
+        gamedays = pd.to_datetime(schedules["gameday"], errors="coerce")
+        mask = gamedays.notna()
+        if start_date is not None:
+            mask &= gamedays >= pd.Timestamp(start_date)
+        if end_date is not None:
+            mask &= gamedays <= pd.Timestamp(end_date)
+
+        in_window = schedules.loc[mask, ["season", "week"]]
+        if in_window.empty:
+            return {}
+        grouped = in_window.groupby("season")["week"].agg(["min", "max"])
+        return {
+            int(season): (int(row["min"]), int(row["max"])) for season, row in grouped.iterrows()
+        }
+    except Exception as e:
+        logger.error(f"Failed to resolve week bounds for {start_date=} {end_date=}: {e}")
+        raise
+
+
+def take_last_n_games(df: pd.DataFrame, n: int, entity_key: str) -> pd.DataFrame:
+    """Keep the most recent ``n`` rows per entity from a (season, week)-sorted frame."""
+    if df.empty or entity_key not in df.columns:
+        return df
+    return df.groupby(entity_key, sort=False, observed=True).tail(n)
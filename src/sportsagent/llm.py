@@ -0,0 +1,153 @@
+import threading
+from collections.abc import Hashable
+from typing import Any
+
+import httpx
+from langchain.chat_models import init_chat_model
+from langchain_core.language_models import BaseChatModel
+from langchain_openai import ChatOpenAI
+
+from sportsagent.config import settings, setup_logging
+
+logger = setup_logging(__name__)
+
+# Chat models and their HTTP clients are process-wide: every node and agent reuses the same
+# keep-alive connection pool instead of opening a new TLS session per call.
+_MODELS: dict[Hashable, BaseChatModel] = {}
+_CLIENTS: dict[str, httpx.Client | httpx.AsyncClient] = {}
+_LOCK = threading.Lock()
+_STATS: dict[str, int] = {"models_created": 0, "requests": 0, "connections_opened": 0}
+_STATS_LOCK = threading.Lock()
+
+
+def get_chat_model(model: str | None = None, **kwargs: Any) -> BaseChatModel:
+    """
+    Shared chat model for ``model`` ("provider:name" or a bare OpenAI model name,
+    default ``settings.LLM_MODEL``). Instances are cached per model and keyword arguments;
+    OpenAI models are wired to the pooled HTTP clients.
+    """
+    spec = model or settings.LLM_MODEL
+    provider, _, name = spec.rpartition(":")
+    key = (provider or "openai", name, tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+    with _LOCK:
+        cached = _MODELS.get(key)
+        if cached is not None:
+            return cached
+    try:
+        if key[0] == "openai":
+            chat_model: BaseChatModel = ChatOpenAI(
+                model=name,
+                api_key=settings.OPENAI_API_KEY or None,
+                http_client=get_http_client(),
+                http_async_client=get_async_http_client(),
+                **kwargs,
+            )
+        else:
+            chat_model = init_chat_model(spec, **kwargs)
+    except Exception as e:
+        logger.error(f"Failed to create chat model {spec}: {e}")
+        raise
+
+    with _LOCK:
+        chat_model = _MODELS.setdefault(key, chat_model)
+    _count("models_created")
+    logger.info(f"Created shared chat model {spec}")
+    return chat_model
+
+
+def get_http_client() -> httpx.Client:
+    with _LOCK:
+        if "sync" not in _CLIENTS:
+            _CLIENTS["sync"] = httpx.Client(
+                limits=_limits(),
+                timeout=float(settings.LLM_TIMEOUT_SECONDS),
+                event_hooks={"request": [_trace_request]},
+            )
+        return _CLIENTS["sync"]  # type: ignore[return-value]
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    with _LOCK:
+        if "async" not in _CLIENTS:
+            _CLIENTS["async"] = httpx.AsyncClient(
+                limits=_limits(),
+                timeout=float(settings.LLM_TIMEOUT_SECONDS),
+                event_hooks={"request": [_atrace_request]},
+            )
+        return _CLIENTS["async"]  # type: ignore[return-value]
+
+
+def llm_client_stats() -> dict[str, float]:
+    """Shared model count plus HTTP requests vs newly opened connections (reuse rate)."""
+    with _STATS_LOCK:
+        stats: dict[str, float] = dict(_STATS)
+    with _LOCK:
+        stats["models"] = len(_MODELS)
+    stats["connections_reused"] = max(stats["requests"] - stats["connections_opened"], 0)
+    stats["reuse_rate"] = (
+        stats["connections_reused"] / stats["requests"] if stats["requests"] else 0.0
+    )
+    return stats
+
+
+def close_llm_clients() -> None:
+    """
+    Close the sync connection pool and drop shared models (tests, sync shutdown). The async
+    pool can only be closed from an event loop; use ``aclose_llm_clients`` there.
+    """
+    for kind, client in _release_clients():
+        if kind == "sync":
+            client.close()  # type: ignore[union-attr]
+
+
+async def aclose_llm_clients() -> None:
+    """Close both connection pools and drop shared models (app shutdown)."""
+    for kind, client in _release_clients():
+        if kind == "sync":
+            client.close()  # type: ignore[union-attr]
+        else:
+            await client.aclose()  # type: ignore[union-attr]
+
+
+def _release_clients() -> list[tuple[str, httpx.Client | httpx.AsyncClient]]:
+    with _LOCK:
+        clients = list(_CLIENTS.items())
+        _CLIENTS.clear()
+        _MODELS.clear()
+    return clients
+
+
+def _limits() -> httpx.Limits:
+    # max_connections bounds concurrent in-flight LLM requests; extra calls wait for the pool.
+    # The sync and async clients each get their own pool with these limits, so a process
+    # driving both can hold up to twice LLM_MAX_CONNECTIONS connections.
+    return httpx.Limits(
+        max_connections=int(settings.LLM_MAX_CONNECTIONS),
+        max_keepalive_connections=int(settings.LLM_MAX_KEEPALIVE_CONNECTIONS),
+        keepalive_expiry=float(settings.LLM_KEEPALIVE_EXPIRY_SECONDS),
+    )
+
+
+def _trace_request(request: httpx.Request) -> None:
+    _count("requests")
+    request.extensions["trace"] = _trace
+
+
+async def _atrace_request(request: httpx.Request) -> None:
+    _count("requests")
+    request.extensions["trace"] = _atrace
+
+
+def _trace(event_name: str, info: dict[str, Any]) -> None:
+    # httpcore only emits connect events when the pool has no idle connection to reuse
+    if event_name == "connection.connect_tcp.complete":
+        _count("connections_opened")
+
+
+async def _atrace(event_name: str, info: dict[str, Any]) -> None:
+    _trace(event_name, info)
+
+
+def _count(stat: str) -> None:
+    with _STATS_LOCK:
+        _STATS[stat] += 1
@@ -267,8 +267,8 @@ with tab_chat:
                     st.session_state["messages"].append(
                         {"role": "assistant", "content": "User cancelled chart execution."}
                     )
-                    # Skip execution by updating state
-                    graph.update_state(config, {"visualization_code": None})
+                    # Skip execution and drop any chart already built for this turn
+                    graph.update_state(config, {"visualization_code": None, "visualization": None})
                     run_workflow(None)
 
     elif st.session_state.get("interrupt_state") == "approval":
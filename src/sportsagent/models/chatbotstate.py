@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field, StringConstraints
 
 from sportsagent.models.analyzeroutput import AnalyzerOutput
 from sportsagent.models.chatboterror import ErrorStates
+from sportsagent.models.conversationmemory import ConversationMemory
 from sportsagent.models.parsedquery import ParsedQuery
 from sportsagent.models.retrieveddata import RetrievedData
 
@@ -23,6 +24,10 @@ class ChatbotState(BaseModel):
     parsed_query: ParsedQuery = Field(default_factory=ParsedQuery)
     generated_response: str | Markdown
     conversation_history: ConversationHistory = Field(default_factory=list)
+    conversation_memory: ConversationMemory = Field(
+        default_factory=ConversationMemory,
+        description="Bounded parser context, updated incrementally in exit_node",
+    )
     error: ErrorStates | None = Field(default=None)
     retrieved_data: RetrievedData | None = Field(default=None)
     pending_action: PendingAction | None = Field(default=None)
@@ -34,6 +39,10 @@ class ChatbotState(BaseModel):
     internal_trace: list[str] = Field(default_factory=list)
     skip_save: bool = Field(default=False)
     analyzer_output: AnalyzerOutput | None = Field(default=None)
+    tool_memo: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Analyzer tool results (content and artifact store key) keyed by dataset fingerprint, tool and args",
+    )
 
     def __str__(self) -> str:
         return (
@@ -0,0 +1,97 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from sportsagent.config import settings
+
+
+def _clip(text: Any, limit: int) -> str:
+    text = " ".join(str(text).split())
+    return text if len(text) <= limit else text[: limit - 3].rstrip() + "..."
+
+
+def _remember(items: list[str], new: list[str], limit: int) -> list[str]:
+    """Most recently mentioned first, without duplicates, at most ``limit`` long."""
+    return list(dict.fromkeys([*reversed(new), *items]))[:limit]
+
+
+class ConversationMemory(BaseModel):
+    """
+    Bounded rolling context for the query parser, updated once per turn in exit_node.
+
+    Keeps the last few turns (responses clipped), most-recently-used players/stats/teams,
+    and a one-line digest per older turn, so the parser prompt stays the same size no
+    matter how long the session runs.
+    """
+
+    recent_turns: list[dict[str, str]] = Field(default_factory=list)
+    players: list[str] = Field(default_factory=list)
+    stats: list[str] = Field(default_factory=list)
+    teams: list[str] = Field(default_factory=list)
+    summary: list[str] = Field(
+        default_factory=list, description="One-line digests of turns older than recent_turns"
+    )
+    older_turns: int = Field(default=0, description="Turns folded into the summary so far")
+
+    @property
+    def turns_seen(self) -> int:
+        return self.older_turns + len(self.recent_turns)
+
+    def update(self, turn: dict[str, Any]) -> None:
+        """Fold one conversation_history turn into the memory."""
+        self.players = _remember(
+            self.players, list(turn.get("mentioned_players") or []), settings.CONTEXT_MAX_ENTITIES
+        )
+        self.stats = _remember(
+            self.stats,
+            [
+                *(turn.get("mentioned_stats") or []),
+                *(turn.get("mentioned_players_stats") or []),
+                *(turn.get("mentioned_teams_stats") or []),
+            ],
+            settings.CONTEXT_MAX_ENTITIES,
+        )
+        self.teams = _remember(
+            self.teams, list(turn.get("mentioned_teams") or []), settings.CONTEXT_MAX_ENTITIES
+        )
+
+        self.recent_turns.append(
+            {
+                "content": _clip(turn.get("content", ""), settings.CONTEXT_RESPONSE_CHARS),
+                "response": _clip(turn.get("response", ""), settings.CONTEXT_RESPONSE_CHARS),
+                "role": str(turn.get("role", "user")),
+            }
+        )
+        while len(self.recent_turns) > settings.CONTEXT_RECENT_TURNS:
+            older = self.recent_turns.pop(0)
+            self.summary.append(_clip(older["content"], 80))
+            self.older_turns += 1
+        self.summary = self.summary[-settings.CONTEXT_SUMMARY_TURNS :]
+
+    @classmethod
+    def from_history(cls, conversation_history: list[dict[str, Any]]) -> "ConversationMemory":
+        memory = cls()
+        for turn in conversation_history:
+            memory.update(turn)
+        return memory
+
+    def to_context(self) -> dict[str, Any]:
+        """The parser's context dict: recent players/stats/teams, dialogue and summary."""
+        messages = []
+        for turn in self.recent_turns:
+            label = "Assistant" if turn["role"].lower() == "assistant" else "User"
+            messages.append(f"{label}: {turn['content']}")
+            if turn["response"]:
+                messages.append(f"Assistant: {turn['response']}")
+        summary = ""
+        if self.summary:
+            summary = f"{self.older_turns} earlier turns; most recent asked: " + "; ".join(
+                self.summary
+            )
+        return {
+            "recent_players": list(self.players),
+            "recent_stats": list(self.stats),
+            "recent_teams": list(self.teams),
+            "messages": messages,
+            "summary": summary,
+        }
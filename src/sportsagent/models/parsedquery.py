@@ -1,7 +1,8 @@
 import re
+from datetime import date
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from sportsagent.constants import (
     CURRENT_SEASON,
@@ -14,6 +15,8 @@ from sportsagent.constants import (
     TEAMS_STATS_MAP,
 )
 
+_TEAM_CODES = frozenset([*TEAM_ABBREVIATIONS, "ALL"])
+
 
 # Helper to clean strings for filenames
 def _clean(s: str) -> str:
@@ -24,24 +27,129 @@ class TimePeriod(BaseModel):
     seasons: list[int] = Field(
         default=[CURRENT_SEASON], description="NFL seasons year (e.g., [2025] for 2025 season)"
     )
-    # specific_weeks: list[int] | None = Field(default=None, description="Specific week numbers")
+    start_week: int | None = Field(
+        default=None,
+        description="First week of a week range, inclusive (e.g., 10 for 'weeks 10-14', 5 for 'week 5')",
+    )
+    end_week: int | None = Field(
+        default=None,
+        description="Last week of a week range, inclusive (e.g., 14 for 'weeks 10-14', 5 for 'week 5')",
+    )
+    last_n_games: int | None = Field(
+        default=None,
+        description="Only the most recent N games per player/team (e.g., 3 for 'last 3 games')",
+    )
+    start_date: date | None = Field(
+        default=None, description="First game date of a date window, inclusive (YYYY-MM-DD)"
+    )
+    end_date: date | None = Field(
+        default=None, description="Last game date of a date window, inclusive (YYYY-MM-DD)"
+    )
     # career: bool = Field(default=False, description="Whether to query career statistics")
     summary_level: Literal["week", "reg", "post", "reg+post"] = Field(
         default="reg",
         description='choice: one of week (default), "reg" for regular season, "post" for postseason, "reg+post" for combined regular season + postseason stats',
     )
 
+    @model_validator(mode="after")
+    def validate_game_window(self) -> "TimePeriod":
+        if self.start_week and self.end_week and self.start_week > self.end_week:
+            self.start_week, self.end_week = self.end_week, self.start_week
+        if self.start_date and self.end_date and self.start_date > self.end_date:
+            self.start_date, self.end_date = self.end_date, self.start_date
+        if (self.start_date or self.end_date) and "seasons" not in self.model_fields_set:
+            first = _season_for_date(self.start_date or self.end_date)
+            last = _season_for_date(self.end_date or self.start_date)
+            self.seasons = list(range(first, last + 1))
+        if self.has_game_window:
+            self.summary_level = "week"
+        return self
+
+    @property
+    def has_game_window(self) -> bool:
+        return any(
+            v is not None
+            for v in (
+                self.start_week,
+                self.end_week,
+                self.last_n_games,
+                self.start_date,
+                self.end_date,
+            )
+        )
+
+    def game_window(self) -> dict[str, Any]:
+        """Week/game filters to push down to the datasource."""
+        return {
+            "start_week": self.start_week,
+            "end_week": self.end_week,
+            "last_n_games": self.last_n_games,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+        }
+
+    @property
+    def label(self) -> str:
+        parts = ["-".join(str(p) for p in self.seasons)] if self.seasons else []
+        if self.start_week is not None or self.end_week is not None:
+            start = self.start_week if self.start_week is not None else ""
+            end = self.end_week if self.end_week is not None else ""
+            parts.append(f"wk{start}" if start == end else f"wk{start}-{end}")
+        if self.last_n_games:
+            parts.append(f"last{self.last_n_games}")
+        if self.start_date or self.end_date:
+            start = self.start_date.isoformat() if self.start_date else ""
+            end = self.end_date.isoformat() if self.end_date else ""
+            parts.append(f"{start}to{end}")
+        return "_".join(parts)
+
 
 class QueryFilters(BaseModel):
     opponent: str | None = Field(default=None, description="Opponent team")
-    home_away: str | None = Field(default=None, description="'home', 'away', or None")
+    home_away: Literal["home", "away"] | None = Field(
+        default=None, description="'home', 'away', or None"
+    )
     min_value: float | None = Field(default=None, description="Minimum value for statistics")
     max_value: float | None = Field(default=None, description="Maximum value for statistics")
     situation: str | None = Field(
         default=None,
-        description="Game situation (e.g., 'under_pressure', 'red_zone')",
+        description=(
+            "Game situation(s), comma separated: 'red_zone', 'goal_to_go', 'third_down', "
+            "'fourth_down', 'two_minute_drill', 'under_pressure', 'first_and_10', "
+            "'second_and_short', 'second_and_long', 'third_and_short', 'third_and_medium', "
+            "'third_and_long', 'own_territory', 'opponent_territory', or the groups "
+            "'down_distance' / 'field_position'"
+        ),
     )
 
+    @field_validator("opponent", mode="before")
+    def validate_opponent(cls, v):
+        if not v:
+            return None
+        if v.upper() in TEAM_ABBREVIATIONS:
+            return v.upper()
+        return TEAM_MAPPINGS.get(v.lower().strip(), v)
+
+    @field_validator("home_away", mode="before")
+    def validate_home_away(cls, v):
+        # Free-form venue wording ("on the road", "home games", "at Buffalo"); anything
+        # unrecognized drops the filter rather than failing the whole parse
+        if not v:
+            return None
+        v = str(v).lower().strip()
+        if "away" in v or "road" in v:
+            return "away"
+        if "home" in v:
+            return "home"
+        if re.match(r"(?:at|@)(?:\s|$)", v):
+            return "away"
+        return None
+
+    @property
+    def splits_by_game(self) -> bool:
+        """Whether the filters need per-game schedule context (opponent/venue)."""
+        return bool(self.opponent or self.home_away)
+
 
 class StatisticsQuery(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
@@ -55,6 +163,19 @@ class StatisticsQuery(BaseModel):
         description="Time period for the query",
         alias="timePeriod",
     )
+    filters: QueryFilters = Field(
+        default_factory=QueryFilters,
+        description="Optional opponent, venue, value and game situation filters",
+    )
+    limit: int | None = Field(
+        default=None,
+        ge=1,
+        description="Number of entries requested for leaderboards (e.g., 5 for 'top 5')",
+    )
+    sort_order: Literal["desc", "asc"] = Field(
+        default="desc",
+        description="'desc' for most/top/best (default), 'asc' for fewest/least/bottom",
+    )
 
 
 class ChartSpec(BaseModel):
@@ -145,8 +266,8 @@ class PlayerStatsQuery(StatisticsQuery):
             # Limit to 2 stats
             parts.append("-".join(_clean(s) for s in self.statistics[:2]))
 
-        if self.tp.seasons:
-            parts.append("-".join(str(p) for p in self.tp.seasons))
+        if self.tp.label:
+            parts.append(self.tp.label)
             # parts.append(f"{self.tp.seasons}")
 
         # if self.comparison:
@@ -183,8 +304,8 @@ class TeamStatsQuery(StatisticsQuery):
             # Limit to 2 stats
             parts.append("-".join(_clean(s) for s in self.statistics[:2]))
 
-        if self.tp.seasons:
-            parts.append("-".join(str(p) for p in self.tp.seasons))
+        if self.tp.label:
+            parts.append(self.tp.label)
 
         # if self.comparison:
         #     parts.append("comp")
@@ -197,7 +318,7 @@ class TeamStatsQuery(StatisticsQuery):
             return v
         # Normalize team names
         for i, team_name in enumerate(v):
-            if team_name not in [*TEAM_ABBREVIATIONS, "ALL"]:
+            if team_name not in _TEAM_CODES:
                 normalized_name = TEAM_MAPPINGS.get(team_name.lower(), team_name)
                 v[i] = normalized_name
             else:
@@ -267,7 +388,15 @@ class ParsedQuery(BaseModel):
         alias="wantsVisualization",
     )
     enrichment_datasets: list[
-        Literal["rosters", "snap_counts", "schedules", "participation", "player_info"]
+        Literal[
+            "rosters",
+            "snap_counts",
+            "schedules",
+            "participation",
+            "player_info",
+            "situational_splits",
+            "nextgen_stats",
+        ]
     ] = Field(
         default_factory=list,
         description="Optional enrichment datasets to fetch and attach to retrieved_data.",
@@ -294,6 +423,28 @@ class ParsedQuery(BaseModel):
     def needs_clarification(self) -> bool:
         return self.parse_status == "needs_clarification"
 
+    @property
+    def requested_columns(self) -> list[str]:
+        """
+        Columns the user explicitly asked about (stats and chart axes), in request order.
+        """
+        columns: list[str] = []
+        for query in (self.player_stats_query, self.team_stats_query):
+            if query:
+                columns.extend(query.statistics)
+        if self.chart_spec:
+            columns.extend(
+                c
+                for c in (self.chart_spec.y_axis, self.chart_spec.x_axis, self.chart_spec.group_by)
+                if c
+            )
+        return list(dict.fromkeys(columns))
+
+
+def _season_for_date(value: date) -> int:
+    # NFL seasons kick off in September and run through the February Super Bowl
+    return value.year if value.month >= 3 else value.year - 1
+
 
 def normalize_player_name(
     name: str,
@@ -0,0 +1,15 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+type StreamEventKind = Literal["token", "tool", "status"]
+
+
+class StreamEvent(BaseModel):
+    """Incremental workflow output surfaced to CLI/API clients while a turn is running."""
+
+    kind: StreamEventKind = Field(
+        description="'token' for answer text deltas, 'tool' for agent tool calls, 'status' for finished nodes"
+    )
+    content: str
+    node: str | None = Field(default=None, description="Workflow node that produced the event")
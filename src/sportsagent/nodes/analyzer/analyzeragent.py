@@ -1,5 +1,6 @@
 import datetime
 import operator
+import uuid
 from collections.abc import Sequence
 from typing import Annotated, Any
 
@@ -8,15 +9,31 @@ from langchain.agents import AgentState
 from langchain.agents.middleware import HumanInTheLoopMiddleware
 from langchain.agents.structured_output import ToolStrategy
 from langchain_core.callbacks import StdOutCallbackHandler
-from langchain_core.messages import BaseMessage, HumanMessage
+from langchain_core.messages import AIMessageChunk, BaseMessage, HumanMessage
+from langchain_core.utils.json import parse_partial_json
 from langgraph.graph.state import CompiledStateGraph
 
 from sportsagent.agents.baseagent import BaseAgent, get_tool_call_names
+from sportsagent.agents.toolmemo import (
+    MEMO_CONFIG_KEY,
+    ToolMemo,
+    ToolMemoMiddleware,
+    prune_tool_memo,
+)
 from sportsagent.config import settings, setup_logging
 from sportsagent.models.analyzeroutput import AnalyzerOutput
+from sportsagent.models.streamevent import StreamEvent
 from sportsagent.nodes.analyzer import get_analyzer_template
 from sportsagent.tools.common import request_more_data
-from sportsagent.tools.dataframe import compare_performance, describe_dataset, explain_data
+from sportsagent.tools.dataframe import (
+    compare_performance,
+    describe_dataset,
+    explain_data,
+    find_similar_players,
+    league_context,
+)
+from sportsagent.utils.frameregistry import get_frame_registry
+from sportsagent.utils.streaming import workflow_stream_writer
 
 logger = setup_logging(__name__)
 
@@ -24,7 +41,7 @@ logger = setup_logging(__name__)
 class AnalyzerGraphState(AgentState):
     internal_messages: Annotated[Sequence[BaseMessage], operator.add]
     user_instructions: str
-    data_raw: dict
+    data_handle: str | None
     eda_artifacts: dict
     tool_calls: list
 
@@ -38,7 +55,10 @@ class AnalyzerAgent(BaseAgent):
         return super().create(
             recursion_limit=recursion_limit,
             state_schema=AnalyzerGraphState,
-            middleware=[HumanInTheLoopMiddleware(interrupt_on={"request_more_data": True})],
+            middleware=[
+                HumanInTheLoopMiddleware(interrupt_on={"request_more_data": True}),
+                ToolMemoMiddleware(),
+            ],
             response_format=ToolStrategy(AnalyzerOutput),
             **kwargs,
         )
@@ -58,6 +78,8 @@ class AnalyzerAgent(BaseAgent):
             explain_data,
             describe_dataset,
             compare_performance,
+            league_context,
+            find_similar_players,
             request_more_data,
         ]
 
@@ -80,7 +102,7 @@ class AnalyzerAgent(BaseAgent):
         response = await self._compiled_graph.ainvoke(
             {
                 "user_instructions": user_instructions,
-                "data_raw": data_raw.to_dict() if data_raw is not None else None,
+                "data_handle": _register(data_raw),
             },
             **kwargs,
         )
@@ -92,6 +114,7 @@ class AnalyzerAgent(BaseAgent):
         user_instructions: str | None = None,
         data_raw: pd.DataFrame | None = None,
         session_id: str | None = None,
+        tool_memo: ToolMemo | None = None,
         **kwargs,
     ):
         """
@@ -103,27 +126,43 @@ class AnalyzerAgent(BaseAgent):
             The instructions for the agent.
         data_raw : pd.DataFrame, optional
             The input data as a DataFrame.
+        tool_memo : dict, optional
+            Session tool-result memo. Entries for other datasets are pruned and new
+            results are added in place.
         """
 
         last_state = None
+        # The compiled graph is shared across turns, so each run gets its own thread
+        thread_id = f"{session_id or settings.DEFAULT_SESSION}:{uuid.uuid4().hex[:8]}"
+        writer = workflow_stream_writer()
+        judgment_stream = JudgmentStream()
+        data_handle = _register(data_raw)
+        configurable: dict[str, Any] = {"thread_id": thread_id}
+        if tool_memo is not None:
+            prune_tool_memo(tool_memo, data_handle)
+            configurable[MEMO_CONFIG_KEY] = tool_memo
         try:
-            # Use stream to capture state incrementally
-            for state in self._compiled_graph.stream(
+            # Stream state values for the final response and message chunks for clients
+            for mode, payload in self._compiled_graph.stream(
                 input={
                     "messages": [HumanMessage(content=user_instructions)]
                     if user_instructions
                     else [],
                     "user_instructions": user_instructions,
-                    "data_raw": data_raw.to_dict() if data_raw is not None else None,
+                    "data_handle": data_handle,
                 },
                 config={
-                    "configurable": {"thread_id": session_id or settings.DEFAULT_SESSION},
+                    "configurable": configurable,
                     "callbacks": [StdOutCallbackHandler()],
                 },
-                stream_mode="values",
+                stream_mode=["values", "messages"],
                 **kwargs,
             ):
-                last_state = state
+                if mode == "values":
+                    last_state = payload
+                elif writer is not None:
+                    for event in judgment_stream.feed(payload[0]):
+                        writer(event)
 
             self.response = last_state
 
@@ -132,6 +171,10 @@ class AnalyzerAgent(BaseAgent):
             if last_state:
                 self.response = last_state
             raise e
+        finally:
+            checkpointer = getattr(self._compiled_graph, "checkpointer", None)
+            if checkpointer is not None and hasattr(checkpointer, "delete_thread"):
+                checkpointer.delete_thread(thread_id)
 
         return None
 
@@ -216,3 +259,57 @@ class AnalyzerAgent(BaseAgent):
                     )
                     trace.append(f"🤖 Agent: {content}")
         return trace
+
+
+class JudgmentStream:
+    """
+    Turns streamed model chunks into client events. The final answer arrives as the
+    ``AnalyzerOutput`` structured-output tool call, so its partial JSON arguments are
+    re-parsed per chunk and only the newly completed part of ``judgment`` is emitted.
+    """
+
+    def __init__(self) -> None:
+        self._names: dict[tuple[str | None, int], str] = {}
+        self._args: dict[tuple[str | None, int], str] = {}
+        self._emitted: dict[tuple[str | None, int], int] = {}
+
+    def feed(self, chunk: Any) -> list[StreamEvent]:
+        if not isinstance(chunk, AIMessageChunk):
+            return []
+        events = []
+        if isinstance(chunk.content, str) and chunk.content:
+            events.append(StreamEvent(kind="token", content=chunk.content, node="analyzer"))
+
+        for tool_chunk in chunk.tool_call_chunks:
+            key = (chunk.id, tool_chunk.get("index") or 0)
+            if tool_chunk.get("name"):
+                self._names[key] = tool_chunk["name"]
+                if tool_chunk["name"] != AnalyzerOutput.__name__:
+                    events.append(
+                        StreamEvent(kind="tool", content=tool_chunk["name"], node="analyzer")
+                    )
+            self._args[key] = self._args.get(key, "") + (tool_chunk.get("args") or "")
+            if self._names.get(key) == AnalyzerOutput.__name__:
+                delta = self._judgment_delta(key)
+                if delta:
+                    events.append(StreamEvent(kind="token", content=delta, node="analyzer"))
+        return events
+
+    def _judgment_delta(self, key: tuple[str | None, int]) -> str:
+        try:
+            parsed = parse_partial_json(self._args[key]) if self._args[key] else None
+        except ValueError:
+            return ""
+        judgment = parsed.get("judgment") if isinstance(parsed, dict) else None
+        if not isinstance(judgment, str):
+            return ""
+        emitted = self._emitted.get(key, 0)
+        self._emitted[key] = max(emitted, len(judgment))
+        return judgment[emitted:]
+
+
+def _register(data_raw: pd.DataFrame | None) -> str | None:
+    """Register the analysis frame and return the handle tools resolve it by."""
+    if data_raw is None:
+        return None
+    return get_frame_registry().register(data_raw)
@@ -5,6 +5,7 @@ from sportsagent.models.chatboterror import UNKNOWN_ERROR_RESPONSE, ErrorStates
 from sportsagent.models.chatbotstate import ChatbotState
 from sportsagent.nodes.analyzer import get_analyzer_template
 from sportsagent.nodes.analyzer.analyzeragent import AnalyzerAgent
+from sportsagent.utils.promptrender import render_frame_for_prompt
 
 logger = setup_logging(__name__)
 
@@ -24,16 +25,17 @@ def analyzer_node(state: ChatbotState) -> ChatbotState:
 
         analyzer_agent = AnalyzerAgent()
 
-        data_context = {}
-        data_sample_str = ""
-        total_rows = 0
-
-        for key, records in state.retrieved_data.items():
-            if records:
-                df = pd.DataFrame(records)
-                data_context[key] = df
-                data_sample_str += f"\n### Dataset: {key}\n{df.head(3).to_string()}\n"
-                total_rows += len(df)
+        data_context = {
+            key: pd.DataFrame(records) for key, records in state.retrieved_data.items() if records
+        }
+        total_rows = sum(len(df) for df in data_context.values())
+        priority_columns = state.parsed_query.requested_columns if state.parsed_query else []
+        dataset_budget = settings.PROMPT_TOKEN_BUDGET // max(len(data_context), 1)
+        data_sample_str = "".join(
+            f"\n### Dataset: {key}\n"
+            f"{render_frame_for_prompt(df, dataset_budget, priority_columns, name=key)}\n"
+            for key, df in data_context.items()
+        )
 
         primary_df = pd.DataFrame()
         if "players" in data_context:
@@ -50,11 +52,14 @@ def analyzer_node(state: ChatbotState) -> ChatbotState:
             user_instructions=state.user_query,
         )
 
+        tool_memo = dict(state.tool_memo)
         analyzer_agent.invoke_agent(
             user_instructions=user_instructions,
             data_raw=primary_df,
             session_id=state.session_id,
+            tool_memo=tool_memo,
         )
+        state.tool_memo = tool_memo
 
         state.internal_trace = analyzer_agent.get_execution_trace(settings.SHOW_INTERNAL)
 
@@ -0,0 +1,259 @@
+import re
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from sportsagent.config import setup_logging
+from sportsagent.models.analyzeroutput import AnalyzerOutput
+from sportsagent.models.chatboterror import ErrorStates
+from sportsagent.models.chatbotstate import ChatbotState
+from sportsagent.models.parsedquery import StatisticsQuery
+from sportsagent.models.streamevent import StreamEvent
+from sportsagent.nodes.fastanswer import get_fastanswer_template
+from sportsagent.utils.promptrender import markdown_table
+from sportsagent.utils.streaming import emit_stream_event
+
+logger = setup_logging(__name__)
+
+type AnswerMode = Literal["lookup", "ranking"]
+
+DEFAULT_RANKING_LIMIT = 10
+MAX_FAST_STATISTICS = 3
+MAX_LOOKUP_ENTITIES = 3
+# Wording that asks for reasoning rather than a sort/lookup keeps the analyzer in the loop
+ANALYTICAL_PATTERN = re.compile(
+    r"\b(why|how come|explain|analy[sz]\w*|trend\w*|compar\w*|versus|vs\.?|better|worse|"
+    r"improv\w*|declin\w*|predict\w*|project\w*|should|insight\w*|efficien\w*|"
+    r"correlat\w*|consistent|breakout|regress\w*|outlook|expect\w*)\b",
+    re.IGNORECASE,
+)
+PLAYER_NAME_COLUMNS = ["player_display_name", "player_name"]
+
+
+@dataclass
+class FastAnswerPlan:
+    mode: AnswerMode
+    dataset: Literal["players", "teams"]
+    frame: pd.DataFrame
+    name_col: str
+    statistics: list[str]
+    entities: list[str]
+    limit: int
+    sort_order: Literal["desc", "asc"]
+    position: str | None
+    period: str
+
+
+def plan_fast_answer(state: ChatbotState) -> FastAnswerPlan | None:
+    """
+    Decide whether the parsed query is a plain sort or lookup over the retrieved table.
+
+    Returns a plan only for single-dataset retrievals of one to three numeric stats with
+    one row per entity and season; anything else (enrichments, situations, weekly game
+    logs, analytical wording) returns ``None`` and goes through the analyzer agent.
+    """
+    pq = state.parsed_query
+    if (
+        pq is None
+        or state.error
+        or state.approval_required
+        or pq.workflow_intent != "retrieve"
+        or pq.enrichment_datasets
+        or state.retrieved_data is None
+        or ANALYTICAL_PATTERN.search(state.user_query)
+    ):
+        return None
+
+    if pq.player_stats_query and not pq.team_stats_query:
+        dataset, query = "players", pq.player_stats_query
+        entities = list(query.players or [])
+        position = query.position if query.position not in (None, "ALL") else None
+    elif pq.team_stats_query and not pq.player_stats_query:
+        dataset, query = "teams", pq.team_stats_query
+        entities = [t for t in query.teams if t != "ALL"]
+        position = None
+    else:
+        return None
+
+    if (
+        state.retrieved_data.keys() != [dataset]
+        or not 0 < len(query.statistics) <= MAX_FAST_STATISTICS
+        or query.filters.situation
+    ):
+        return None
+
+    records = state.retrieved_data.players if dataset == "players" else state.retrieved_data.teams
+    frame = pd.DataFrame(records)
+    name_col = _name_column(frame, dataset)
+    if name_col is None or not _is_answerable_table(frame, name_col, query.statistics):
+        return None
+
+    if query.limit is None and 0 < len(entities) <= MAX_LOOKUP_ENTITIES:
+        mode: AnswerMode = "lookup"
+    else:
+        mode = "ranking"
+
+    return FastAnswerPlan(
+        mode=mode,
+        dataset=dataset,
+        frame=frame,
+        name_col=name_col,
+        statistics=query.statistics,
+        entities=entities,
+        limit=query.limit or DEFAULT_RANKING_LIMIT,
+        sort_order=query.sort_order,
+        position=position,
+        period=_period_label(query, frame),
+    )
+
+
+def fast_answer_node(state: ChatbotState) -> ChatbotState:
+    """Answer sort/lookup queries from the retrieved table with templates, without an LLM."""
+    try:
+        plan = plan_fast_answer(state)
+        if plan is None:
+            logger.warning("Fast answer node reached without an answerable plan")
+            state.error = ErrorStates.RESPONSE_GENERATION_ERROR
+            state.generated_response = "I couldn't compute a direct answer for this query."
+            return state
+
+        output = build_fast_answer(plan)
+        state.analyzer_output = output
+        state.generated_response = output.judgment
+        state.approval_required = False
+        state.internal_trace = [
+            f"fast_answer: {plan.mode} over {plan.dataset} by {', '.join(plan.statistics)}"
+        ]
+        emit_stream_event(StreamEvent(kind="token", content=output.judgment, node="fast_answer"))
+        logger.info(f"Answered {plan.mode} query deterministically ({len(plan.frame)} rows)")
+    except Exception as e:
+        logger.error(f"Fast answer node error: {e}", exc_info=True)
+        state.error = ErrorStates.RESPONSE_GENERATION_ERROR
+        state.generated_response = "I couldn't compute a direct answer for this query."
+    return state
+
+
+def build_fast_answer(plan: FastAnswerPlan) -> AnalyzerOutput:
+    primary = plan.statistics[0]
+    ranked = plan.frame.sort_values(
+        primary, ascending=plan.sort_order == "asc", kind="stable", na_position="last"
+    )
+    if plan.mode == "lookup":
+        frame = ranked[_matches_entities(ranked[plan.name_col], plan.entities)]
+        if frame.empty:
+            # Names did not line up with the table; fall back to the sorted rows
+            frame = ranked
+    else:
+        frame = ranked.head(plan.limit)
+
+    multi_season = "season" in frame.columns and frame["season"].nunique() > 1
+    rows = [_row_context(row, plan, multi_season) for row in frame.to_dict(orient="records")]
+    judgment = (
+        get_fastanswer_template(f"{plan.mode}.j2")
+        .render(
+            rows=rows,
+            leader=rows[0],
+            stat_label=_stat_label(primary),
+            scope=_scope_label(plan),
+            period=plan.period,
+            sort_order=plan.sort_order,
+        )
+        .strip()
+    )
+
+    shown = [
+        c
+        for c in dict.fromkeys([plan.name_col, "team", "season", *plan.statistics])
+        if c in frame.columns
+    ]
+    direction = "ascending" if plan.sort_order == "asc" else "descending"
+    analysis = (
+        f"{plan.mode.capitalize()} computed directly from {len(plan.frame)} retrieved "
+        f"{plan.dataset} rows, sorted by {primary} ({direction}).\n\n"
+        f"{markdown_table(frame[shown].round(2))}"
+    )
+    return AnalyzerOutput(analysis=analysis, judgment=judgment, visualization_request=None)
+
+
+def _name_column(frame: pd.DataFrame, dataset: str) -> str | None:
+    candidates = PLAYER_NAME_COLUMNS if dataset == "players" else ["team"]
+    return next((c for c in candidates if c in frame.columns), None)
+
+
+def _is_answerable_table(frame: pd.DataFrame, name_col: str, statistics: list[str]) -> bool:
+    if frame.empty:
+        return False
+    if any(
+        s not in frame.columns or not pd.api.types.is_numeric_dtype(frame[s]) for s in statistics
+    ):
+        return False
+    # Weekly game logs need aggregation choices that belong to the analyzer
+    if "week" in frame.columns and frame["week"].nunique(dropna=True) > 1:
+        return False
+    key = [c for c in (name_col, "season") if c in frame.columns]
+    return not frame.duplicated(subset=key).any()
+
+
+def _matches_entities(names: pd.Series, entities: list[str]) -> np.ndarray:
+    # Parsed names may be partial ("Mahomes") while the table holds display names
+    lowered = names.astype(str).str.lower()
+    mask = np.zeros(len(names), dtype=bool)
+    for entity in entities:
+        mask |= lowered.str.contains(entity.lower(), regex=False).to_numpy()
+    return mask
+
+
+def _row_context(row: dict, plan: FastAnswerPlan, multi_season: bool) -> dict[str, str | None]:
+    values = ", ".join(
+        f"{_format_value(row.get(stat))} {_stat_label(stat)}" for stat in plan.statistics
+    )
+    team = row.get("team") if plan.name_col != "team" else None
+    season = row.get("season") if multi_season else None
+    return {
+        "name": str(row[plan.name_col]),
+        "team": str(team) if team and not pd.isna(team) else None,
+        "season": str(int(season)) if season is not None and not pd.isna(season) else None,
+        "primary": _format_value(row.get(plan.statistics[0])),
+        "summary": values,
+    }
+
+
+def _format_value(value) -> str:
+    if value is None or pd.isna(value):
+        return "n/a"
+    value = float(value)
+    if value.is_integer():
+        return f"{value:,.0f}"
+    if abs(value) < 1:
+        return f"{value:.3f}"
+    return f"{value:,.1f}"
+
+
+def _stat_label(stat: str) -> str:
+    return stat.replace("_", " ")
+
+
+def _scope_label(plan: FastAnswerPlan) -> str:
+    if plan.dataset == "teams":
+        return "all teams" if not plan.entities else ""
+    if plan.position:
+        return f"all {plan.position}s"
+    return "all players" if not plan.entities else ""
+
+
+def _period_label(query: StatisticsQuery, frame: pd.DataFrame) -> str:
+    # Prefer the seasons actually returned over the parsed defaults
+    if "season" in frame.columns and frame["season"].notna().any():
+        seasons = sorted(int(v) for v in frame["season"].dropna().unique())
+    else:
+        seasons = sorted(query.tp.seasons)
+    if not seasons:
+        return ""
+    label = str(seasons[0]) if len(seasons) == 1 else f"{seasons[0]}-{seasons[-1]}"
+    if query.tp.summary_level == "post":
+        return f"the {label} postseason"
+    if query.tp.summary_level == "reg+post":
+        return f"{label} (regular season + playoffs)"
+    return label
@@ -0,0 +1,150 @@
+import re
+import threading
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sportsagent.config import setup_logging
+from sportsagent.constants import TEAM_ABBREVIATIONS, TEAM_MAPPINGS
+from sportsagent.nodes.queryparser.ruleparser import STAT_PHRASES, get_player_name_index
+
+logger = setup_logging(__name__)
+
+_TOKEN = re.compile(r"[\w&'’.-]+")
+_POSSESSIVE = re.compile(r"['’]s$")
+_DROPPED = re.compile(r"[.'’]")
+
+
+@dataclass(frozen=True)
+class EntityMention:
+    kind: str  # "player" | "team" | "stat"
+    value: str  # canonical form: display name, team abbreviation or stat column
+    text: str  # the span as written in the query
+    start: int
+    end: int
+
+
+def tokenize(text: str) -> list[tuple[str, int, int]]:
+    """
+    Lookup tokens with their character offsets in ``text``: lower case, possessives,
+    periods and apostrophes dropped ("A.J. Brown's" -> "aj", "brown").
+    """
+    tokens = []
+    for match in _TOKEN.finditer(text):
+        token = _DROPPED.sub("", _POSSESSIVE.sub("", match.group().lower())).strip("-")
+        if token:
+            tokens.append((token, match.start(), match.end()))
+    return tokens
+
+
+class Gazetteer:
+    """
+    Aho-Corasick automaton over word tokens. All patterns are matched in a single pass
+    over the query, and matching whole tokens keeps "ne" from firing inside "Tennessee".
+    Overlapping hits resolve leftmost-longest; on ties the pattern added first wins.
+    """
+
+    def __init__(self) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._outputs: list[list[int]] = [[]]
+        # (kind, value, token count, exact spelling for case-sensitive patterns)
+        self._patterns: list[tuple[str, str, int, str | None]] = []
+        self._built = True
+
+    def add(self, phrase: str, kind: str, value: str, case_sensitive: bool = False) -> None:
+        tokens = [token for token, _, _ in tokenize(phrase)]
+        if not tokens:
+            return
+        node = 0
+        for token in tokens:
+            nxt = self._goto[node].get(token)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][token] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            node = nxt
+        self._outputs[node].append(len(self._patterns))
+        self._patterns.append((kind, value, len(tokens), phrase if case_sensitive else None))
+        self._built = False
+
+    def build(self) -> "Gazetteer":
+        """Compute failure links (BFS); outputs of suffix states are merged in."""
+        queue: deque[int] = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for token, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(token, 0)
+                self._outputs[child] = self._outputs[child] + self._outputs[self._fail[child]]
+        self._built = True
+        return self
+
+    def scan(self, text: str) -> list[EntityMention]:
+        """Every non-overlapping entity mention in ``text``, in order of appearance."""
+        if not self._built:
+            self.build()
+        tokens = tokenize(text)
+        hits: list[tuple[int, int, int]] = []  # (start token, -length, pattern id)
+        node = 0
+        for i, (token, _, _) in enumerate(tokens):
+            while node and token not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(token, 0)
+            for pattern_id in self._outputs[node]:
+                length = self._patterns[pattern_id][2]
+                hits.append((i - length + 1, -length, pattern_id))
+
+        mentions = []
+        covered_until = 0
+        for first, _, pattern_id in sorted(hits):
+            if first < covered_until:
+                continue
+            kind, value, length, exact = self._patterns[pattern_id]
+            start, end = tokens[first][1], tokens[first + length - 1][2]
+            span = text[start:end]
+            if exact is not None and _DROPPED.sub("", _POSSESSIVE.sub("", span)) != exact:
+                continue
+            mentions.append(EntityMention(kind=kind, value=value, text=span, start=start, end=end))
+            covered_until = first + length
+        return mentions
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+
+def build_gazetteer(player_names: Iterable[str] = ()) -> Gazetteer:
+    """Gazetteer over player display names, team names/abbreviations and stat phrases."""
+    gazetteer = Gazetteer()
+    for name in player_names:
+        gazetteer.add(name, "player", name)
+    for phrase, team in TEAM_MAPPINGS.items():
+        gazetteer.add(phrase, "team", team)
+    # Abbreviations only count as written ("KC", "NO"), never as the words "no" or "was"
+    for team in TEAM_ABBREVIATIONS:
+        gazetteer.add(team, "team", team, case_sensitive=True)
+    for phrase, column in STAT_PHRASES.items():
+        gazetteer.add(phrase, "stat", column)
+    return gazetteer.build()
+
+
+_GAZETTEER: Gazetteer | None = None
+_GAZETTEER_LOCK = threading.Lock()
+
+
+def get_gazetteer() -> Gazetteer:
+    global _GAZETTEER
+    if _GAZETTEER is None:
+        with _GAZETTEER_LOCK:
+            if _GAZETTEER is None:
+                _GAZETTEER = build_gazetteer(get_player_name_index().values())
+                logger.info(f"Built entity gazetteer with {len(_GAZETTEER)} patterns")
+    return _GAZETTEER
@@ -0,0 +1,197 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from sportsagent.config import settings, setup_logging
+from sportsagent.constants import CURRENT_SEASON, TEAM_ABBREVIATIONS
+from sportsagent.models.parsedquery import ParsedQuery
+
+logger = setup_logging(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_ABBREVIATION = re.compile(r"\b([A-Z]{2,3})\b")
+_TEAM_CODES = frozenset(TEAM_ABBREVIATIONS)
+
+
+def normalize_query(user_query: str) -> str:
+    """
+    Whitespace, trailing punctuation and case do not change how a query parses, except for
+    upper-case team abbreviations: the rule parser and gazetteer only read "KC" or "WAS" as
+    teams when written that way, so those keep their case.
+    """
+    text = _WHITESPACE.sub(" ", user_query).strip().rstrip("?!. ")
+    return "".join(
+        part if part in _TEAM_CODES else part.lower() for part in _ABBREVIATION.split(text)
+    )
+
+
+def context_digest(context: dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(context, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def parse_cache_key(user_query: str, context: dict[str, Any]) -> str:
+    """
+    Key over the normalized query, a digest of the extracted conversation context and
+    everything else the parser prompt depends on (current season, parser model).
+    """
+    material = "|".join(
+        [
+            normalize_query(user_query),
+            context_digest(context),
+            str(CURRENT_SEASON),
+            settings.OPENAI_MODEL,
+        ]
+    )
+    return hashlib.sha256(material.encode()).hexdigest()[:32]
+
+
+class ParseCache:
+    """
+    LRU + TTL cache of parser results, optionally backed by a sqlite file so repeat
+    queries survive restarts and are shared between processes.
+
+    Entries are stored as ``ParsedQuery`` JSON; every hit returns a fresh instance, so
+    callers may mutate the result freely.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 3600.0,
+        db_path: Path | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = Path(db_path) if db_path else None
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        if self.db_path is not None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS parse_cache "
+                    "(key TEXT PRIMARY KEY, payload TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+
+    def get(self, key: str) -> ParsedQuery | None:
+        try:
+            now = time.time()
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and now - entry[0] > self.ttl_seconds:
+                    del self._entries[key]
+                    self.expirations += 1
+                    entry = None
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return ParsedQuery.model_validate_json(entry[1])
+
+            entry = self._disk_get(key, now)
+            with self._lock:
+                if entry is None:
+                    self.misses += 1
+                    return None
+                self.disk_hits += 1
+                self._store(key, entry)
+            return ParsedQuery.model_validate_json(entry[1])
+        except Exception as e:
+            # A corrupt or incompatible entry is just a miss; the parser runs as usual
+            logger.warning(f"Parse cache read failed for {key}: {e}")
+            self.invalidate(key)
+            return None
+
+    def put(self, key: str, parsed_query: ParsedQuery) -> None:
+        try:
+            entry = (time.time(), parsed_query.model_dump_json())
+            with self._lock:
+                self._store(key, entry)
+            if self.db_path is not None:
+                with self._connect() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO parse_cache (key, payload, created_at) "
+                        "VALUES (?, ?, ?)",
+                        (key, entry[1], entry[0]),
+                    )
+        except Exception as e:
+            logger.warning(f"Parse cache write failed for {key}: {e}")
+
+    def invalidate(self, key: str | None = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+        if self.db_path is not None:
+            with self._connect() as conn:
+                if key is None:
+                    conn.execute("DELETE FROM parse_cache")
+                else:
+                    conn.execute("DELETE FROM parse_cache WHERE key = ?", (key,))
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+    def _store(self, key: str, entry: tuple[float, str]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _disk_get(self, key: str, now: float) -> tuple[float, str] | None:
+        if self.db_path is None:
+            return None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT created_at, payload FROM parse_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[0] > self.ttl_seconds:
+                conn.execute("DELETE FROM parse_cache WHERE key = ?", (key,))
+                with self._lock:
+                    self.expirations += 1
+                return None
+        return float(row[0]), str(row[1])
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5.0)
+
+
+_PARSE_CACHE: ParseCache | None = None
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+def get_parse_cache() -> ParseCache:
+    global _PARSE_CACHE
+    if _PARSE_CACHE is None:
+        with _PARSE_CACHE_LOCK:
+            if _PARSE_CACHE is None:
+                _PARSE_CACHE = ParseCache(
+                    max_entries=int(settings.PARSE_CACHE_SIZE),
+                    ttl_seconds=float(settings.PARSE_CACHE_TTL_SECONDS),
+                    db_path=settings.PARSE_CACHE_DB,
+                )
+    return _PARSE_CACHE
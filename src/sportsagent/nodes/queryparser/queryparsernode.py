@@ -1,15 +1,24 @@
 import asyncio
+import random
+from functools import lru_cache
 from typing import Any
 
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
 
 from sportsagent.config import settings, setup_logging
 from sportsagent.constants import CURRENT_SEASON
+from sportsagent.llm import get_chat_model
 from sportsagent.models.chatboterror import ChatbotError, ErrorStates
 from sportsagent.models.chatbotstate import ChatbotState, ConversationHistory
+from sportsagent.models.conversationmemory import ConversationMemory
 from sportsagent.models.parsedquery import ParsedQuery
 from sportsagent.nodes.queryparser import get_queryparser_template
+from sportsagent.nodes.queryparser.gazetteer import get_gazetteer
+from sportsagent.nodes.queryparser.parsecache import get_parse_cache, parse_cache_key
+from sportsagent.nodes.queryparser.ruleparser import record_parse, rule_parse
+from sportsagent.nodes.queryparser.semanticcache import SemanticMatch, get_semantic_cache
+from sportsagent.utils.tokenusage import get_token_usage
 
 logger = setup_logging(__name__)
 
@@ -19,157 +28,297 @@ def query_parser_node(state: ChatbotState) -> ChatbotState:
 
     try:
         state.approval_result = None
-        state = _parse_query_sync(state)
-        if state.parsed_query:
-            pending_action = state.parsed_query.workflow_intent
-            if pending_action == "rechart" and (
-                state.parsed_query.player_stats_query is not None
-                or state.parsed_query.team_stats_query is not None
-                or bool(state.parsed_query.enrichment_datasets)
-            ):
-                pending_action = "enrich" if state.parsed_query.enrichment_datasets else "retrieve"
-
-            state.pending_action = pending_action
-            state.needs_visualization = bool(state.parsed_query.wants_visualization)
-        logger.info(
-            f"Successfully parsed query.intent - {state.parsed_query.query_intent if state.parsed_query else 'unknown'}"
-        )
-    except ChatbotError as e:
-        state.error = e.error_type
-        state.generated_response = e.message
+        state = _parse_query(state)
+        _set_pending_action(state)
     except Exception as e:
-        logger.warning(f"Unexpected error during query parsing: {e}")
-        state.error = ErrorStates.PARSING_ERROR
-        state.generated_response = "An unexpected error occurred while parsing your query."
-        # raise e
+        _record_parser_failure(state, e)
     return state
 
 
-def _parse_query_sync(state: ChatbotState) -> ChatbotState:
+async def aquery_parser_node(state: ChatbotState) -> ChatbotState:
+    """
+    Async counterpart of ``query_parser_node`` used by ``astream``/``ainvoke``: the parser
+    LLM call is awaited on the caller's event loop. Cancellation (e.g. a dropped client)
+    propagates and aborts the in-flight request instead of being reported as a parse error.
+    """
+    logger.info("Parsing user query")
+
     try:
-        return asyncio.run(_parse_query(state))
-    except RuntimeError as exc:
-        if "already running" not in str(exc).lower():
-            raise
-        loop = asyncio.new_event_loop()
-        try:
-            return loop.run_until_complete(_parse_query(state))
-        finally:
-            loop.close()
+        state.approval_result = None
+        state = await _aparse_query(state)
+        _set_pending_action(state)
+    except asyncio.CancelledError:
+        logger.info("Query parsing cancelled")
+        raise
+    except Exception as e:
+        _record_parser_failure(state, e)
+    return state
+
+
+def _set_pending_action(state: ChatbotState) -> None:
+    if state.parsed_query:
+        pending_action = state.parsed_query.workflow_intent
+        if pending_action == "rechart" and (
+            state.parsed_query.player_stats_query is not None
+            or state.parsed_query.team_stats_query is not None
+            or bool(state.parsed_query.enrichment_datasets)
+        ):
+            pending_action = "enrich" if state.parsed_query.enrichment_datasets else "retrieve"
+
+        state.pending_action = pending_action
+        state.needs_visualization = bool(state.parsed_query.wants_visualization)
+    logger.info(
+        f"Successfully parsed query.intent - {state.parsed_query.query_intent if state.parsed_query else 'unknown'}"
+    )
+
+
+def _record_parser_failure(state: ChatbotState, e: Exception) -> None:
+    if isinstance(e, ChatbotError):
+        state.error = e.error_type
+        state.generated_response = e.message
+        return
+    logger.warning(f"Unexpected error during query parsing: {e}")
+    state.error = ErrorStates.PARSING_ERROR
+    state.generated_response = "An unexpected error occurred while parsing your query."
 
 
 def _extract_context_from_history(
     conversation_history: ConversationHistory,
 ) -> dict[str, Any]:
-    context = {
-        "recent_players": [],
-        "recent_stats": [],
-        "recent_teams": [],
-        "messages": [],
-    }
-
-    # Look at last 3 turns for context
-    recent_turns = (
-        conversation_history[-3:] if len(conversation_history) >= 3 else conversation_history
+    history = conversation_history[-settings.CONVERSATION_HISTORY_MAX_TURNS :]
+    return ConversationMemory.from_history(history).to_context()
+
+
+def _conversation_context(state: ChatbotState) -> dict[str, Any]:
+    """Parser context from the incrementally kept memory; rebuilt only if it lags history."""
+    memory = state.conversation_memory
+    if memory.turns_seen and memory.turns_seen >= len(state.conversation_history):
+        return memory.to_context()
+    return _extract_context_from_history(state.conversation_history)
+
+
+@lru_cache(maxsize=1)
+def parser_system_prompt() -> str:
+    """
+    Static parser instructions, rendered once. Kept byte-identical across calls and sent
+    as the first message so provider-side prompt caching can reuse the prefix.
+    """
+    return (
+        get_queryparser_template("parsing_prompt.j2").render(current_season=CURRENT_SEASON)
+        + "\n\n"
+        + get_queryparser_template("ambiguity_handling.j2").render()
     )
 
-    for turn in recent_turns:
-        if "mentioned_players" in turn:
-            context["recent_players"].extend(turn["mentioned_players"])
 
-        if "mentioned_stats" in turn:
-            context["recent_stats"].extend(turn["mentioned_stats"])
-        if "mentioned_players_stats" in turn:
-            context["recent_stats"].extend(turn["mentioned_players_stats"])
-        if "mentioned_teams_stats" in turn:
-            context["recent_stats"].extend(turn["mentioned_teams_stats"])
+def _build_context_prompt(context: dict[str, Any]) -> str | None:
+    if not (
+        context["recent_players"]
+        or context["recent_stats"]
+        or context["messages"]
+        or context.get("summary")
+    ):
+        return None
 
-        if "role" in turn and "content" in turn:
-            role = str(turn["role"]).lower()
-            label = "Assistant" if role == "assistant" else "User"
-            context["messages"].append(f"{label}: {turn['content']}")
+    prompt = "**CONVERSATION CONTEXT (Use this to resolve references):**"
 
-        if "content" in turn and "response" in turn:
-            context["messages"].append(f"User: {turn['content']}")
-            context["messages"].append(f"Assistant: {turn['response']}")
+    if context.get("summary"):
+        prompt += f"\n\nEarlier in this session: {context['summary']}"
 
-    # Remove duplicates while preserving order
-    context["recent_players"] = list(dict.fromkeys(context["recent_players"]))
-    context["recent_stats"] = list(dict.fromkeys(context["recent_stats"]))
+    if context["messages"]:
+        prompt += "\n\nRecent Dialogue:\n" + "\n".join(context["messages"])
 
-    return context
+    if context["recent_players"]:
+        prompt += f"\n\n- Recently mentioned players: {', '.join(context['recent_players'])}"
+        prompt += "\n  → If the query doesn't mention a player explicitly, assume it refers to these players"
 
+    if context["recent_stats"]:
+        prompt += f"\n- Recently mentioned statistics: {', '.join(context['recent_stats'])}"
+        prompt += "\n  → If the query asks about 'those stats' or similar, use these"
 
-def _build_parsing_prompt(user_query: str, context: dict[str, Any]) -> str:
-    prompt = get_queryparser_template("parsing_prompt.j2").render(
-        current_season=CURRENT_SEASON,
-    )
+    prompt += "\n\n**This appears to be a follow-up question. Use the context above to fill in missing information.**"
+    return prompt
 
-    if context["recent_players"] or context["recent_stats"] or context["messages"]:
-        prompt += "\n\n**CONVERSATION CONTEXT (Use this to resolve references):**"
 
-        if context["messages"]:
-            prompt += "\n\nRecent Dialogue:\n" + "\n".join(context["messages"])
+def _build_entity_prompt(user_query: str) -> str | None:
+    if not settings.ENTITY_HINTS_ENABLED:
+        return None
+    try:
+        mentions = get_gazetteer().scan(user_query)
+    except Exception as e:
+        logger.warning(f"Entity scan failed; parsing without hints: {e}")
+        return None
+    if not mentions:
+        return None
+
+    labels = {"player": "Players", "team": "Teams", "stat": "Statistics"}
+    prompt = "**RECOGNIZED ENTITIES (already resolved from the query; use these exact values):**"
+    for kind, label in labels.items():
+        resolved = [
+            m.value if m.text == m.value else f'{m.value} ("{m.text}")'
+            for m in mentions
+            if m.kind == kind
+        ]
+        if resolved:
+            prompt += f"\n- {label}: {', '.join(dict.fromkeys(resolved))}"
+    return prompt
 
-        if context["recent_players"]:
-            prompt += f"\n\n- Recently mentioned players: {', '.join(context['recent_players'])}"
-            prompt += "\n  → If the query doesn't mention a player explicitly, assume it refers to these players"
 
-        if context["recent_stats"]:
-            prompt += f"\n- Recently mentioned statistics: {', '.join(context['recent_stats'])}"
-            prompt += "\n  → If the query asks about 'those stats' or similar, use these"
+def _build_parser_messages(user_query: str, context: dict[str, Any]) -> list[BaseMessage]:
+    """
+    Static system prefix, then the per-turn context and pre-resolved entities (if any)
+    and the user query.
+    """
+    messages: list[BaseMessage] = [SystemMessage(content=parser_system_prompt())]
+    for per_turn in (_build_context_prompt(context), _build_entity_prompt(user_query)):
+        if per_turn:
+            messages.append(SystemMessage(content=per_turn))
+    messages.append(HumanMessage(content=user_query))
+    return messages
+
+
+def _rule_parse(user_query: str) -> ParsedQuery | None:
+    if not settings.RULE_PARSER_ENABLED:
+        return None
+    result = rule_parse(user_query)
+    # Any word the rules could not place may be a filter they would silently drop
+    # ("by a rookie", "when trailing"), so those queries always go to the LLM
+    if (
+        result is None
+        or result.unexplained
+        or result.confidence < settings.RULE_PARSER_MIN_CONFIDENCE
+    ):
+        return None
+    record_parse("rule")
+    logger.info(f"Rule parser handled query (confidence {result.confidence:.2f})")
+    return result.parsed_query
+
+
+def _parser_llm() -> Runnable:
+    llm = get_chat_model(settings.OPENAI_MODEL)
+    return llm.with_structured_output(ParsedQuery, method="function_calling", include_raw=True)
+
+
+def _llm_parse(user_query: str, context: dict[str, Any]) -> ParsedQuery:
+    result = _parser_llm().invoke(
+        input=_build_parser_messages(user_query, context),
+        temperature=0,
+    )
+    return _structured_result(result)
 
-        prompt += "\n\n**This appears to be a follow-up question. Use the context above to fill in missing information.**"
 
-    prompt += get_queryparser_template("ambiguity_handling.j2").render(
-        user_query=user_query,
+async def _allm_parse(user_query: str, context: dict[str, Any]) -> ParsedQuery:
+    result = await _parser_llm().ainvoke(
+        input=_build_parser_messages(user_query, context),
+        temperature=0,
     )
-    return prompt
+    return _structured_result(result)
 
 
-async def _parse_query(state: ChatbotState) -> ChatbotState:
-    try:
-        user_query = state.user_query
-        logger.info(f"Parsing user query: {user_query[:50]}...")
-        conversation_history = state.conversation_history
-        context = _extract_context_from_history(conversation_history)
+def _structured_result(result: Any) -> ParsedQuery:
+    parsed_result = result
+    if isinstance(result, dict):
+        get_token_usage("query_parser").record(result.get("raw"))
+        if result.get("parsing_error"):
+            raise result["parsing_error"]
+        parsed_result = result.get("parsed")
+    if not isinstance(parsed_result, ParsedQuery):
+        raise ValueError("LLM did not return a ParsedQuery instance")
+    record_parse("llm")
+    return parsed_result
 
-        system_prompt = _build_parsing_prompt(user_query, context)
 
-        llm = ChatOpenAI(model=settings.OPENAI_MODEL)
+def _parse_query(state: ChatbotState) -> ChatbotState:
+    try:
+        context, cache_key, parsed_result, audit = _parse_without_llm(state)
+        if parsed_result is None:
+            parsed_result = _llm_parse(state.user_query, context)
+            _remember_parse(state.user_query, context, cache_key, parsed_result, audit)
+        return _apply_parsed_query(state, parsed_result)
+    except Exception as e:
+        raise _parsing_error(state, e) from e
 
-        structured_llm = llm.with_structured_output(ParsedQuery, method="function_calling")
 
-        parsed_result = structured_llm.invoke(
-            input=[
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_query),
-            ],
-            temperature=0,
+async def _aparse_query(state: ChatbotState) -> ChatbotState:
+    try:
+        context, cache_key, parsed_result, audit = _parse_without_llm(state)
+        if parsed_result is None:
+            parsed_result = await _allm_parse(state.user_query, context)
+            _remember_parse(state.user_query, context, cache_key, parsed_result, audit)
+        return _apply_parsed_query(state, parsed_result)
+    except Exception as e:
+        raise _parsing_error(state, e) from e
+
+
+def _parse_without_llm(
+    state: ChatbotState,
+) -> tuple[dict[str, Any], str, ParsedQuery | None, SemanticMatch | None]:
+    """
+    Conversation context, parse cache key and the cached, paraphrase-cached or rule-based
+    parse, if any. The last item is a semantic hit that was held back for auditing.
+    """
+    user_query = state.user_query
+    logger.info(f"Parsing user query: {user_query[:50]}...")
+    context = _conversation_context(state)
+
+    cache = get_parse_cache()
+    cache_key = parse_cache_key(user_query, context)
+    parsed_result = cache.get(cache_key)
+    if parsed_result is not None:
+        logger.info("Parse cache hit; skipping the parser LLM")
+        return context, cache_key, parsed_result, None
+
+    audit = None
+    if settings.SEMANTIC_CACHE_ENABLED:
+        match = get_semantic_cache().lookup(user_query, context)
+        if match is not None and random.random() >= settings.SEMANTIC_CACHE_AUDIT_RATE:
+            cache.put(cache_key, match.parsed_query)
+            return context, cache_key, match.parsed_query, None
+        audit = match
+
+    parsed_result = _rule_parse(user_query)
+    if parsed_result is not None:
+        _remember_parse(user_query, context, cache_key, parsed_result, audit)
+    return context, cache_key, parsed_result, audit
+
+
+def _remember_parse(
+    user_query: str,
+    context: dict[str, Any],
+    cache_key: str,
+    parsed_result: ParsedQuery,
+    audit: SemanticMatch | None,
+) -> None:
+    get_parse_cache().put(cache_key, parsed_result)
+    if not settings.SEMANTIC_CACHE_ENABLED:
+        return
+    semantic_cache = get_semantic_cache()
+    if audit is not None:
+        if audit.parsed_query == parsed_result:
+            return
+        logger.warning(f"Semantic cache false hit: {user_query[:50]!r} vs {audit.query[:50]!r}")
+        semantic_cache.report_false_hit(audit.entry_id)
+    semantic_cache.add(user_query, context, parsed_result)
+
+
+def _apply_parsed_query(state: ChatbotState, parsed_result: ParsedQuery) -> ChatbotState:
+    # Store parsed query in state
+    state.parsed_query = parsed_result
+
+    # If clarification is needed, set error to signal workflow
+    if parsed_result.needs_clarification:
+        state.error = ErrorStates.CLARIFICATION_NEEDED
+        state.generated_response = (
+            parsed_result.clarification_question
+            or "I need more information to answer your question. Could you please clarify?"
         )
-        if not isinstance(parsed_result, ParsedQuery):
-            raise ValueError("LLM did not return a ParsedQuery instance")
-
-        # Store parsed query in state
-        state.parsed_query = parsed_result
-
-        # If clarification is needed, set error to signal workflow
-        if parsed_result.needs_clarification:
-            state.error = ErrorStates.CLARIFICATION_NEEDED
-            state.generated_response = (
-                parsed_result.clarification_question
-                or "I need more information to answer your question. Could you please clarify?"
-            )
-        logger.info(f"Parsed query: {parsed_result}")
-        return state
+    logger.info(f"Parsed query: {parsed_result}")
+    return state
 
-    except Exception as e:
-        # Handle parsing errors
-        # log_error(e, context={"user_query": state.user_query[:100]}, level="warning")
-
-        raise ChatbotError(
-            error_type=ErrorStates.PARSING_ERROR,
-            message=f"Failed to parse query: {str(e)}",
-            details={"user_query": state.user_query[:200]},
-            recoverable=True,
-        ) from e
+
+def _parsing_error(state: ChatbotState, e: Exception) -> ChatbotError:
+    return ChatbotError(
+        error_type=ErrorStates.PARSING_ERROR,
+        message=f"Failed to parse query: {str(e)}",
+        details={"user_query": state.user_query[:200]},
+        recoverable=True,
+    )
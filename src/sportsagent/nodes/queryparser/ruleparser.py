@@ -0,0 +1,304 @@
+import re
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from sportsagent.config import setup_logging
+from sportsagent.constants import (
+    CURRENT_SEASON,
+    PLAYER_STATS_COMMON,
+    POSITION_STATS_MAP,
+    STAT_MAPPINGS,
+    TEAM_ABBREVIATIONS,
+    TEAM_MAPPINGS,
+    TEAMS_STATS_COMMON,
+    TEAMS_STATS_MAP,
+)
+from sportsagent.models.parsedquery import (
+    ParsedQuery,
+    PlayerStatsQuery,
+    TeamStatsQuery,
+    TimePeriod,
+)
+
+logger = setup_logging(__name__)
+
+# Shapes the rule tier does not attempt: charts, game windows, splits, enrichments and
+# follow-up edits ("instead", "add ...") all go to the LLM parser
+UNSUPPORTED_PATTERN = re.compile(
+    r"\b(chart|plot|graph|visuali[sz]\w*|weeks?|weekly|games?|game logs?|vs|versus|against|"
+    r"home|away|road|red zone|third down|fourth down|3rd|4th|goal to go|two minute|pressure|"
+    r"snaps?|snap counts?|rosters?|next gen|participation|schedules?|since|before|after|"
+    r"average|avg|per|height|weight|college|draft\w*|instead|now|also|add|include|join|"
+    r"rechart|switch|change|similar|compare to)\b"
+)
+AMBIGUOUS_STAT_TERMS = {"yards", "touchdowns", "tds"}
+STOPWORDS = {
+    *"a an and & by for from in of on the to with during over across".split(),
+    *"what whats who which how many much did does do have has had is are was were".split(),
+    *"show me give get list find tell stats statistics total totals number".split(),
+    *"season seasons year years regular league nfl all players player team teams".split(),
+}
+_POSITION_TERMS = {
+    "qb": "QB",
+    "quarterback": "QB",
+    "rb": "RB",
+    "running back": "RB",
+    "wr": "WR",
+    "wide receiver": "WR",
+    "receiver": "WR",
+    "te": "TE",
+    "tight end": "TE",
+    "kicker": "K",
+}
+_ASCENDING_TERMS = {"fewest", "least", "lowest", "worst", "bottom"}
+
+_SEASON_RANGE = re.compile(r"\b((?:19|20)\d{2})\s*(?:-|to|through|thru)\s*((?:19|20)\d{2})\b")
+_SEASON = re.compile(r"\b((?:19|20)\d{2})\b")
+_RECENT_SEASONS = re.compile(r"\b(?:last|past) (\d{1,2}) seasons\b")
+_RELATIVE_SEASON = re.compile(r"\b(this|current|last) season\b")
+_POSTSEASON = re.compile(r"\b(playoffs?|postseason)\b")
+_RANKING = re.compile(
+    r"\b(top|bottom) (\d{1,3})\b|\b(\d{1,3}) (best|worst)\b|"
+    r"\b(most|leaders?|leading|highest|best|top|fewest|least|lowest|worst|bottom)\b"
+)
+_TEAM_WORD = re.compile(r"\bteams?\b")
+_POSITION = re.compile(
+    r"\b(" + "|".join(sorted(map(re.escape, _POSITION_TERMS), key=len, reverse=True)) + r")s?\b"
+)
+_TEAM_NAME = re.compile(
+    r"\b(" + "|".join(sorted(map(re.escape, TEAM_MAPPINGS), key=len, reverse=True)) + r")\b"
+)
+
+
+def name_key(text: str) -> str:
+    """Lookup form shared by queries and player names: lower case, no periods/apostrophes."""
+    text = re.sub(r"['’]s\b", "", text.lower())
+    text = re.sub(r"[.'’]", "", text)
+    text = re.sub(r"[^\w\s&-]", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _stat_phrases() -> dict[str, str]:
+    identity = {*PLAYER_STATS_COMMON, *TEAMS_STATS_COMMON}
+    columns = [
+        c
+        for c in dict.fromkeys([*POSITION_STATS_MAP["ALL"], *TEAMS_STATS_MAP["ALL"]])
+        if c not in identity
+    ]
+    phrases: dict[str, str] = {}
+    for column in columns:
+        spoken = column.replace("_", " ")
+        for phrase in (column, spoken, spoken.replace(" tds", " touchdowns")):
+            phrases.setdefault(phrase, column)
+    for phrase, column in STAT_MAPPINGS.items():
+        if column in columns and phrase not in AMBIGUOUS_STAT_TERMS:
+            phrases.setdefault(name_key(phrase), column)
+    return phrases
+
+
+STAT_PHRASES = _stat_phrases()
+_STAT = re.compile(
+    r"\b(" + "|".join(sorted(map(re.escape, STAT_PHRASES), key=len, reverse=True)) + r")\b"
+)
+TEAM_STAT_COLUMNS = set(TEAMS_STATS_MAP["ALL"])
+# Stands in for each matched phrase once it is consumed, so it is counted exactly once
+_MATCHED_TOKEN = "\0"
+_MATCHED = f" {_MATCHED_TOKEN} "
+
+
+@dataclass
+class RuleParse:
+    parsed_query: ParsedQuery
+    confidence: float
+    unexplained: list[str] = field(default_factory=list)
+
+
+def rule_parse(user_query: str, player_index: dict[str, str] | None = None) -> RuleParse | None:
+    """
+    Deterministic parse of single-shape stat questions: players and/or teams, named stats,
+    seasons and "top N". Returns ``None`` for shapes it does not model; otherwise a parse
+    whose confidence is the share of content words it could account for, each matched
+    phrase ("passing yards", "Lamar Jackson", "last 3 seasons") counting as one word.
+    """
+    try:
+        text = name_key(user_query)
+        if not text or UNSUPPORTED_PATTERN.search(text):
+            return None
+        wants_teams = bool(_TEAM_WORD.search(text))
+
+        # Uppercase abbreviations are only trusted as written ("KC", not "was")
+        teams = [t for t in re.findall(r"\b[A-Z]{2,3}\b", user_query) if t in TEAM_ABBREVIATIONS]
+        for team in teams:
+            text = re.sub(rf"\b{team.lower()}\b", _MATCHED, text)
+
+        tp_fields, text = _extract_time_period(text)
+        limit, sort_order, ranked, text = _extract_ranking(text)
+
+        statistics = [STAT_PHRASES[m] for m in _STAT.findall(text)]
+        text = _STAT.sub(_MATCHED, text)
+        if not statistics:
+            return None
+
+        players, text = _extract_players(
+            text, player_index if player_index is not None else get_player_name_index()
+        )
+        teams += [TEAM_MAPPINGS[m] for m in _TEAM_NAME.findall(text)]
+        text = _TEAM_NAME.sub(_MATCHED, text)
+        positions = [_POSITION_TERMS[m] for m in _POSITION.findall(text)]
+        text = _POSITION.sub(_MATCHED, text)
+
+        if not (players or teams or positions or ranked) or len(set(positions)) > 1:
+            return None
+
+        common = {
+            "statistics": list(dict.fromkeys(statistics)),
+            "tp": TimePeriod(**tp_fields),
+            "limit": limit,
+            "sort_order": sort_order,
+        }
+        if not players and (teams or wants_teams) and not positions:
+            if not set(statistics) <= TEAM_STAT_COLUMNS:
+                return None
+            parsed = ParsedQuery(
+                query_intent="team_stats",
+                parse_status="parsed",
+                team_stats_query=TeamStatsQuery(
+                    teams=list(dict.fromkeys(teams)) or ["ALL"], **common
+                ),
+            )
+        else:
+            parsed = ParsedQuery(
+                query_intent="player_stats",
+                parse_status="parsed",
+                player_stats_query=PlayerStatsQuery(
+                    players=players or None,
+                    position=positions[0] if positions else None,
+                    teams=list(dict.fromkeys(teams)),
+                    **common,
+                ),
+            )
+
+        tokens = text.split()
+        unexplained = [t for t in tokens if t not in STOPWORDS and t != _MATCHED_TOKEN]
+        explained = tokens.count(_MATCHED_TOKEN)
+        confidence = explained / (explained + len(unexplained)) if explained else 0.0
+        return RuleParse(
+            parsed_query=parsed, confidence=round(confidence, 3), unexplained=unexplained
+        )
+    except Exception as e:
+        # Anything odd simply defers to the LLM parser
+        logger.warning(f"Rule parser failed on {user_query[:50]!r}: {e}")
+        return None
+
+
+def _extract_time_period(text: str) -> tuple[dict, str]:
+    seasons: list[int] = []
+    for start, end in _SEASON_RANGE.findall(text):
+        low, high = sorted((int(start), int(end)))
+        seasons.extend(range(low, high + 1))
+    text = _SEASON_RANGE.sub(_MATCHED, text)
+    for count in _RECENT_SEASONS.findall(text):
+        seasons.extend(range(CURRENT_SEASON - int(count) + 1, CURRENT_SEASON + 1))
+    text = _RECENT_SEASONS.sub(_MATCHED, text)
+    for relative in _RELATIVE_SEASON.findall(text):
+        seasons.append(CURRENT_SEASON - 1 if relative == "last" else CURRENT_SEASON)
+    text = _RELATIVE_SEASON.sub(_MATCHED, text)
+    seasons.extend(int(s) for s in _SEASON.findall(text))
+    text = _SEASON.sub(_MATCHED, text)
+
+    fields: dict = {}
+    if seasons:
+        fields["seasons"] = sorted(set(seasons))
+    if _POSTSEASON.search(text):
+        fields["summary_level"] = "post"
+        text = _POSTSEASON.sub(_MATCHED, text)
+    return fields, text
+
+
+def _extract_ranking(text: str) -> tuple[int | None, str, bool, str]:
+    limit, sort_order, ranked = None, "desc", False
+    for top_word, top_n, n_best, best_word, word in _RANKING.findall(text):
+        ranked = True
+        term = top_word or best_word or word
+        if top_n or n_best:
+            limit = int(top_n or n_best)
+        if term in _ASCENDING_TERMS:
+            sort_order = "asc"
+    return limit, sort_order, ranked, _RANKING.sub(_MATCHED, text)
+
+
+def _extract_players(text: str, player_index: dict[str, str]) -> tuple[list[str], str]:
+    tokens = text.split()
+    players: list[str] = []
+    kept: list[str] = []
+    i = 0
+    while i < len(tokens):
+        for n in (4, 3, 2):
+            name = player_index.get(" ".join(tokens[i : i + n])) if i + n <= len(tokens) else None
+            if name:
+                players.append(name)
+                kept.append(_MATCHED_TOKEN)
+                i += n
+                break
+        else:
+            kept.append(tokens[i])
+            i += 1
+    return list(dict.fromkeys(players)), " ".join(kept)
+
+
+def build_player_name_index(names: Iterable[str]) -> dict[str, str]:
+    """Map lookup keys of multi-word player names to their display form."""
+    index = {}
+    for name in names:
+        key = name_key(name)
+        if 2 <= len(key.split()) <= 4:
+            index.setdefault(key, name)
+    return index
+
+
+_PLAYER_INDEX: dict[str, str] | None = None
+_PLAYER_INDEX_LOCK = threading.Lock()
+
+
+def get_player_name_index() -> dict[str, str]:
+    global _PLAYER_INDEX
+    if _PLAYER_INDEX is None:
+        with _PLAYER_INDEX_LOCK:
+            if _PLAYER_INDEX is None:
+                _PLAYER_INDEX = _load_player_name_index()
+    return _PLAYER_INDEX
+
+
+def _load_player_name_index() -> dict[str, str]:
+    from sportsagent.datasource import get_datasource
+
+    try:
+        players = get_datasource().get_player_data()
+        column = next(
+            c for c in ("display_name", "player_display_name", "full_name") if c in players.columns
+        )
+        index = build_player_name_index(players[column].dropna().astype(str))
+        logger.info(f"Built player name index with {len(index)} names")
+        return index
+    except Exception as e:
+        logger.warning(f"Player name index unavailable; player queries use the LLM parser: {e}")
+        return {}
+
+
+_RULE_STATS: dict[str, int] = {"rule_parses": 0, "llm_parses": 0}
+_STATS_LOCK = threading.Lock()
+
+
+def record_parse(source: str) -> None:
+    with _STATS_LOCK:
+        _RULE_STATS[f"{source}_parses"] += 1
+
+
+def rule_parser_stats() -> dict[str, float]:
+    """Counts of parses answered by the rule tier vs the LLM, plus the rule hit rate."""
+    with _STATS_LOCK:
+        stats: dict[str, float] = dict(_RULE_STATS)
+    total = stats["rule_parses"] + stats["llm_parses"]
+    stats["hit_rate"] = stats["rule_parses"] / total if total else 0.0
+    return stats
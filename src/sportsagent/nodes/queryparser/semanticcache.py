@@ -0,0 +1,247 @@
+import math
+import threading
+import time
+import zlib
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from sportsagent.config import settings, setup_logging
+from sportsagent.models.parsedquery import ParsedQuery
+from sportsagent.nodes.queryparser.gazetteer import Gazetteer, get_gazetteer, tokenize
+from sportsagent.nodes.queryparser.parsecache import context_digest
+from sportsagent.nodes.queryparser.ruleparser import STOPWORDS, _extract_time_period, name_key
+
+logger = setup_logging(__name__)
+
+# Words that flip the meaning of an otherwise near-identical question ("most" vs "fewest",
+# "QBs" vs "WRs", a chart or not). They must match exactly for a cached parse to be reused.
+GUARD_TERMS = {
+    *"most top best highest leaders leading fewest least lowest worst bottom".split(),
+    *"qb qbs quarterback quarterbacks rb rbs wr wrs te tes kicker kickers".split(),
+    *"team teams player players rookie rookies playoffs postseason".split(),
+    *"chart plot graph visualize week weeks game games home away road per average".split(),
+    *"vs versus against compare instead add also not without".split(),
+}
+
+
+def query_features(user_query: str, gazetteer: Gazetteer) -> tuple[Counter, tuple]:
+    """
+    Bag of hashed-embedding features (content words and resolved entities) and
+    the entity signature that has to match exactly before a cached parse is reused.
+    """
+    tokenized = tokenize(user_query)
+    tokens = [token for token, _, _ in tokenized]
+    mentions = gazetteer.scan(user_query)
+    tp_fields, _ = _extract_time_period(name_key(user_query))
+
+    # Entity spans collapse to one canonical term, so "KC" and "chiefs" (or two stat
+    # spellings) embed alike
+    starts = {m.start: m for m in mentions}
+    content, skip_until = [], -1
+    for token, start, _ in tokenized:
+        if start < skip_until:
+            continue
+        mention = starts.get(start)
+        if mention is not None:
+            content.append(f"{mention.kind}={mention.value}")
+            skip_until = mention.end
+        elif token not in STOPWORDS:
+            content.append(token)
+
+    features = Counter(content)
+    signature = (
+        tuple(sorted({(m.kind, m.value) for m in mentions})),
+        tuple(tp_fields.get("seasons", [])),
+        tuple(sorted({t for t in tokens if t.isdigit()})),
+        tuple(sorted({t for t in tokens if t in GUARD_TERMS})),
+    )
+    return features, signature
+
+
+@dataclass
+class SemanticMatch:
+    entry_id: int
+    query: str
+    parsed_query: ParsedQuery
+    similarity: float
+
+
+class SemanticCache:
+    """
+    Approximate parse cache for paraphrased questions.
+
+    Queries are embedded locally as signed feature-hashed TF vectors; IDF weights come from
+    the cached queries themselves and are applied at lookup. Candidates come from a
+    random-hyperplane LSH index and are re-ranked by exact cosine similarity. A candidate
+    is reused only above ``threshold`` and when its entities, seasons, numbers, guard
+    words and conversation context all match.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: float = 3600.0,
+        threshold: float = 0.9,
+        dim: int = 1024,
+        n_tables: int = 16,
+        n_bits: int = 4,
+        gazetteer: Gazetteer | None = None,
+        seed: int = 0,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+        self.dim = dim
+        self._gazetteer = gazetteer
+        self._planes = (
+            np.random.default_rng(seed).standard_normal((dim, n_tables * n_bits)).astype(np.float32)
+        )
+        self._n_tables = n_tables
+        self._n_bits = n_bits
+        self._bit_weights = 1 << np.arange(n_bits)
+        self._buckets: list[dict[int, set[int]]] = [{} for _ in range(n_tables)]
+        # entry id -> (created_at, query, ParsedQuery JSON, signature, tf vector, bucket keys)
+        self._entries: OrderedDict[int, tuple] = OrderedDict()
+        self._df = np.zeros(dim, dtype=np.float32)
+        self._next_id = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.guard_rejections = 0
+        self.false_hits = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def lookup(self, user_query: str, context: dict[str, Any]) -> SemanticMatch | None:
+        try:
+            vector, signature = self._embed(user_query, context)
+            now = time.time()
+            with self._lock:
+                candidates = set()
+                for table, key in enumerate(self._bucket_keys(vector)):
+                    candidates |= self._buckets[table].get(key, set())
+                best, best_score, rejected = None, self.threshold, False
+                for entry_id in candidates:
+                    entry = self._entries[entry_id]
+                    if now - entry[0] > self.ttl_seconds:
+                        self._remove(entry_id)
+                        self.expirations += 1
+                        continue
+                    score = self._similarity(vector, entry[4])
+                    if score < best_score:
+                        continue
+                    if entry[3] != signature:
+                        rejected = True
+                        continue
+                    best, best_score = entry_id, score
+                if best is None:
+                    self.misses += 1
+                    self.guard_rejections += int(rejected)
+                    return None
+                self._entries.move_to_end(best)
+                self.hits += 1
+                entry = self._entries[best]
+            logger.info(f"Semantic cache hit ({best_score:.2f}) on {entry[1][:50]!r}")
+            return SemanticMatch(
+                entry_id=best,
+                query=entry[1],
+                parsed_query=ParsedQuery.model_validate_json(entry[2]),
+                similarity=round(float(best_score), 4),
+            )
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+
+    def add(self, user_query: str, context: dict[str, Any], parsed_query: ParsedQuery) -> None:
+        try:
+            vector, signature = self._embed(user_query, context)
+            keys = self._bucket_keys(vector)
+            with self._lock:
+                entry_id = self._next_id
+                self._next_id += 1
+                self._entries[entry_id] = (
+                    time.time(),
+                    user_query,
+                    parsed_query.model_dump_json(),
+                    signature,
+                    vector,
+                    keys,
+                )
+                for table, key in enumerate(keys):
+                    self._buckets[table].setdefault(key, set()).add(entry_id)
+                self._df += vector != 0
+                while len(self._entries) > self.max_entries:
+                    self._remove(next(iter(self._entries)))
+                    self.evictions += 1
+        except Exception as e:
+            logger.warning(f"Semantic cache write failed: {e}")
+
+    def report_false_hit(self, entry_id: int) -> None:
+        """A reused parse turned out wrong: count it and drop the entry."""
+        with self._lock:
+            self.false_hits += 1
+            if entry_id in self._entries:
+                self._remove(entry_id)
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "guard_rejections": self.guard_rejections,
+                "false_hits": self.false_hits,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "false_hit_rate": self.false_hits / self.hits if self.hits else 0.0,
+            }
+
+    def _embed(self, user_query: str, context: dict[str, Any]) -> tuple[np.ndarray, tuple]:
+        features, signature = query_features(user_query, self._gazetteer or get_gazetteer())
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature, count in features.items():
+            h = zlib.crc32(feature.encode())
+            vector[h % self.dim] += (1.0 if h & 0x80000000 else -1.0) * (1.0 + math.log(count))
+        return vector, (*signature, context_digest(context))
+
+    def _bucket_keys(self, vector: np.ndarray) -> tuple[int, ...]:
+        bits = (vector @ self._planes > 0).reshape(self._n_tables, self._n_bits)
+        return tuple(int(k) for k in bits @ self._bit_weights)
+
+    def _similarity(self, a: np.ndarray, b: np.ndarray) -> float:
+        idf = np.log((1.0 + len(self._entries)) / (1.0 + self._df)) + 1.0
+        a, b = a * idf, b * idf
+        norm = float(np.linalg.norm(a) * np.linalg.norm(b))
+        return float(a @ b) / norm if norm else 0.0
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        for table, key in enumerate(entry[5]):
+            bucket = self._buckets[table].get(key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self._buckets[table][key]
+        self._df -= entry[4] != 0
+
+
+_SEMANTIC_CACHE: SemanticCache | None = None
+_SEMANTIC_CACHE_LOCK = threading.Lock()
+
+
+def get_semantic_cache() -> SemanticCache:
+    global _SEMANTIC_CACHE
+    if _SEMANTIC_CACHE is None:
+        with _SEMANTIC_CACHE_LOCK:
+            if _SEMANTIC_CACHE is None:
+                _SEMANTIC_CACHE = SemanticCache(
+                    max_entries=int(settings.SEMANTIC_CACHE_SIZE),
+                    ttl_seconds=float(settings.PARSE_CACHE_TTL_SECONDS),
+                    threshold=float(settings.SEMANTIC_CACHE_THRESHOLD),
+                )
+    return _SEMANTIC_CACHE
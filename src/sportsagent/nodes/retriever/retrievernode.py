@@ -3,8 +3,9 @@ import asyncio
 import pandas as pd
 
 from sportsagent.config import setup_logging
-from sportsagent.constants import CURRENT_SEASON
+from sportsagent.constants import CURRENT_SEASON, NEXTGEN_POSITION_MAP, NEXTGEN_STATS_MAP
 from sportsagent.datasource import get_datasource
+from sportsagent.datasource.nextgen import NextGenStatType, nextgen_metric_columns
 from sportsagent.models.chatboterror import ChatbotError, ErrorStates
 from sportsagent.models.chatbotstate import ChatbotState
 from sportsagent.models.parsedquery import ChartSpec, PlayerStatsQuery, QueryFilters, TeamStatsQuery
@@ -15,6 +16,11 @@ logger = setup_logging(__name__)
 
 NFL_DATASOURCE = get_datasource()
 
+PLAYER_SPLIT_KEYS = ["player_id", "player_name", "player_display_name", "position", "season"]
+TEAM_SPLIT_KEYS = ["team", "season"]
+# Per-game rate columns are averaged rather than summed when collapsing to splits
+_RATE_STAT_MARKERS = ("share", "pacr", "racr", "wopr", "dakota", "rate", "pct", "percentage")
+
 
 async def retrieve_data(state: ChatbotState) -> ChatbotState:
     try:
@@ -42,6 +48,8 @@ async def retrieve_data(state: ChatbotState) -> ChatbotState:
                     retrieved_data.add_player_data(
                         [{str(k): v for k, v in record.items()} for record in records],
                     )
+                if psq.filters.situation:
+                    add_situational_splits(retrieved_data, psq, player_data)
 
             if tsq := pq.team_stats_query:
                 team_data = fetch_team_statistics(tsq)
@@ -50,6 +58,8 @@ async def retrieve_data(state: ChatbotState) -> ChatbotState:
                     retrieved_data.add_team_data(
                         [{str(k): v for k, v in record.items()} for record in records],
                     )
+                if tsq.filters.situation:
+                    add_situational_splits(retrieved_data, tsq, team_data)
 
             state.retrieved_data = retrieved_data
 
@@ -71,6 +81,41 @@ async def retrieve_data(state: ChatbotState) -> ChatbotState:
                     df = NFL_DATASOURCE.get_snap_counts(seasons=seasons)
                 elif dataset == "player_info":
                     df = NFL_DATASOURCE.get_player_data()
+                elif dataset == "participation":
+                    df = NFL_DATASOURCE.get_participation(seasons=seasons)
+                elif dataset == "schedules":
+                    teams = None
+                    if pq.team_stats_query:
+                        teams = pq.team_stats_query.teams
+                    elif pq.player_stats_query and pq.player_stats_query.teams:
+                        teams = pq.player_stats_query.teams
+                    df = NFL_DATASOURCE.get_schedules(seasons=seasons, teams=teams)
+                elif dataset == "nextgen_stats":
+                    psq = pq.player_stats_query
+                    stat_type = NEXTGEN_POSITION_MAP.get(
+                        psq.position if psq and psq.position else "QB", "passing"
+                    )
+                    df = NFL_DATASOURCE.get_nextgen_stats(
+                        stat_type=stat_type,
+                        seasons=seasons,
+                        players=psq.players if psq else None,
+                    )
+                    if state.retrieved_data.players:
+                        joined = NFL_DATASOURCE.join_nextgen_stats(
+                            pd.DataFrame(state.retrieved_data.players), stat_type
+                        )
+                        state.retrieved_data.players = [
+                            {str(k): v for k, v in record.items()}
+                            for record in joined.to_dict(orient="records")
+                        ]
+                elif dataset == "situational_splits":
+                    if psq := pq.player_stats_query:
+                        add_situational_splits(
+                            state.retrieved_data, psq, pd.DataFrame(state.retrieved_data.players)
+                        )
+                    if tsq := pq.team_stats_query:
+                        add_situational_splits(state.retrieved_data, tsq)
+                    continue
                 else:
                     continue
 
@@ -117,26 +162,27 @@ async def retrieve_data(state: ChatbotState) -> ChatbotState:
 
 def fetch_player_statistics(psq: PlayerStatsQuery) -> pd.DataFrame | None:
     try:
+        summary_level = "week" if psq.filters.splits_by_game else psq.tp.summary_level
         player_data = NFL_DATASOURCE.get_player_stats(
             players=psq.players,
             position=psq.position,
             seasons=psq.tp.seasons,
-            summary_level=psq.tp.summary_level,
+            summary_level=summary_level,
             stats=psq.stats_cols,
+            **psq.tp.game_window(),
         )
-
-        # if psq.time_period.specific_weeks:
-        #     specific_weeks = psq.time_period.specific_weeks
-        #     player_data = player_data[
-        #         player_data["week"].isin(specific_weeks)
-        #     ].copy()
+        if summary_level == "week":
+            player_data = NFL_DATASOURCE.join_schedules(player_data)
+        for stat_type in requested_nextgen_types(psq.statistics):
+            player_data = NFL_DATASOURCE.join_nextgen_stats(player_data, stat_type)
 
         # Normalize data format
         player_data = normalize_data_format(player_data)
 
-        # # Apply filters
-        # if pq.filters:
-        #     player_data = apply_filters(player_data, pq.filters)
+        if psq.filters.splits_by_game:
+            player_data = split_by_game_context(
+                player_data, psq.filters, psq.tp.summary_level, PLAYER_SPLIT_KEYS
+            )
 
         return player_data
     except Exception as e:
@@ -144,22 +190,101 @@ def fetch_player_statistics(psq: PlayerStatsQuery) -> pd.DataFrame | None:
         return None
 
 
+def requested_nextgen_types(statistics: list[str]) -> list[NextGenStatType]:
+    """Next Gen stat types that provide any of the requested statistics."""
+    requested = set(statistics)
+    return [
+        stat_type
+        for stat_type in NEXTGEN_STATS_MAP
+        if requested.intersection(nextgen_metric_columns(stat_type))
+    ]
+
+
 def fetch_team_statistics(tsq: TeamStatsQuery) -> pd.DataFrame | None:
     try:
+        summary_level = "week" if tsq.filters.splits_by_game else tsq.tp.summary_level
         team_data = NFL_DATASOURCE.get_team_stats(
             teams=tsq.teams,
             seasons=tsq.tp.seasons,
             stats=tsq.stats_cols,
-            summary_level=tsq.tp.summary_level,
+            summary_level=summary_level,
+            **tsq.tp.game_window(),
         )
+        if summary_level == "week":
+            team_data = NFL_DATASOURCE.join_schedules(team_data)
 
         team_data = normalize_data_format(team_data)
+
+        if tsq.filters.splits_by_game:
+            team_data = split_by_game_context(
+                team_data, tsq.filters, tsq.tp.summary_level, TEAM_SPLIT_KEYS
+            )
         return team_data
     except Exception as e:
         logger.error(f"Failed to retrieve data for team {tsq.queryName}: {e}")
         return None
 
 
+def situational_splits_key(sq: PlayerStatsQuery | TeamStatsQuery) -> str:
+    """Player and team splits have different columns, so they are stored separately."""
+    return (
+        "player_situational_splits"
+        if isinstance(sq, PlayerStatsQuery)
+        else "team_situational_splits"
+    )
+
+
+def add_situational_splits(
+    retrieved_data: RetrievedData,
+    sq: PlayerStatsQuery | TeamStatsQuery,
+    base: pd.DataFrame | None = None,
+) -> None:
+    splits = fetch_situational_splits(sq, base)
+    if splits is not None:
+        retrieved_data.set_dataset(
+            situational_splits_key(sq),
+            [{str(k): v for k, v in record.items()} for record in splits.to_dict(orient="records")],
+        )
+
+
+def fetch_situational_splits(
+    sq: PlayerStatsQuery | TeamStatsQuery,
+    base: pd.DataFrame | None = None,
+) -> pd.DataFrame | None:
+    """
+    Situational splits over the query's time window, for the players in ``base`` or the
+    query's teams. Player splits are skipped when ``base`` has no ``player_id`` column,
+    rather than returning every player in the league.
+    """
+    try:
+        if isinstance(sq, PlayerStatsQuery):
+            if base is None or "player_id" not in base.columns:
+                logger.warning(
+                    f"Skipping situational splits for {sq.queryName}: no player_id to filter on"
+                )
+                return None
+            player_ids = base["player_id"].dropna().unique().tolist()
+            if not player_ids:
+                return None
+            return NFL_DATASOURCE.get_situational_splits(
+                seasons=sq.tp.seasons,
+                situations=sq.filters.situation,
+                level="player",
+                player_ids=player_ids,
+                **sq.tp.game_window(),
+            )
+        return NFL_DATASOURCE.get_situational_splits(
+            seasons=sq.tp.seasons,
+            situations=sq.filters.situation,
+            level="team",
+            teams=sq.teams,
+            **sq.tp.game_window(),
+        )
+    except Exception as e:
+        logger.error(f"Failed to retrieve situational splits for {sq.queryName}: {e}")
+        return None
+
+
 def retrieve_data_sync(state: ChatbotState) -> ChatbotState:
     try:
         return asyncio.run(retrieve_data(state))
@@ -205,7 +330,7 @@ def apply_filters(df: pd.DataFrame, filters: QueryFilters) -> pd.DataFrame:
     if filters.opponent:
         opponent = filters.opponent
         if "opponent" in result.columns:
-            result = result[result["opponent"].str.contains(opponent, case=False, na=False)]
+            result = result[result["opponent"].astype(str).str.upper() == opponent.upper()]
 
     # Apply home/away filter
     if filters.home_away:
@@ -234,6 +359,57 @@ def apply_filters(df: pd.DataFrame, filters: QueryFilters) -> pd.DataFrame:
     return result
 
 
+def split_by_game_context(
+    df: pd.DataFrame,
+    filters: QueryFilters,
+    summary_level: str,
+    entity_keys: list[str],
+) -> pd.DataFrame:
+    """
+    Apply opponent/venue filters to schedule-joined weekly rows and, unless weekly rows
+    were asked for, collapse them to one split row per entity (and opponent/venue).
+    """
+    try:
+        result = apply_filters(
+            df, QueryFilters(opponent=filters.opponent, home_away=filters.home_away)
+        )
+        if summary_level == "week" or result.empty:
+            return result
+
+        if summary_level in ("reg", "post") and "season_type" in result.columns:
+            result = result[result["season_type"] == summary_level.upper()]
+
+        split_keys = []
+        if filters.opponent:
+            split_keys.append("opponent")
+        if filters.home_away:
+            split_keys.append("home_away")
+        keys = [c for c in [*entity_keys, *split_keys] if c in result.columns]
+        if not keys:
+            return result
+
+        result = result.assign(games=1)
+        if "game_result" in result.columns:
+            result = result.assign(wins=(result["game_result"] == "W").astype(int))
+
+        excluded = {*keys, "week", "rest_days", "games_played"}
+        numeric = [c for c in result.select_dtypes(include=["number"]).columns if c not in excluded]
+        rate_cols = [c for c in numeric if any(m in c for m in _RATE_STAT_MARKERS)]
+        sum_cols = [c for c in numeric if c not in rate_cols]
+
+        grouped = result.groupby(keys, observed=True, sort=False, dropna=False)
+        aggregated = grouped[sum_cols].sum()
+        if rate_cols:
+            aggregated = aggregated.join(grouped[rate_cols].mean())
+        aggregated = aggregated.reset_index()
+
+        logger.info(f"Collapsed {len(df)} weekly rows into {len(aggregated)} splits by {keys}")
+        return aggregated
+    except Exception as e:
+        logger.error(f"Failed to compute opponent/venue splits for {filters=}: {e}")
+        raise
+
+
 def normalize_data_format(df: pd.DataFrame) -> pd.DataFrame:
     """
     Normalize data formats across different sources.
@@ -0,0 +1,160 @@
+import re
+from pathlib import Path
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from sportsagent.config import setup_logging
+from sportsagent.models.parsedquery import ChartSpec
+from sportsagent.utils.visualization_helpers import encode_team_logo
+
+logger = setup_logging(__name__)
+
+TEAM_COLUMNS = ("team", "recent_team", "team_abbr", "posteam")
+LABEL_COLUMNS = ("player_display_name", "player_name", "team", "recent_team", "team_abbr")
+# Requests a fixed spec cannot express (filtered counts, derived ratios, logos, styling);
+# these keep going through LLM code generation
+FREE_FORM_PATTERN = re.compile(
+    r"(?:[<>]=?\s*\d|\b(?:over|under|more than|less than|at least|at most|per|ratio|"
+    r"percent(?:age)?|rate of|logos?|annotat\w*|highlight\w*|horizontal|stacked|"
+    r"log scale|trend ?line|regression|dual axis|subplots?|facet\w*|heat ?map|pie|"
+    r"histogram|box ?plot)\b)",
+    re.IGNORECASE,
+)
+_MAX_LOGOS = 40
+
+
+def native_chart_supported(spec: ChartSpec | None, df: pd.DataFrame, user_query: str) -> bool:
+    """
+    True when ``spec`` fully describes the chart: a known chart type, columns present in
+    ``df`` with numeric measures, and no free-form wording in the request.
+    """
+    if spec is None or spec.chart_type is None or df.empty:
+        return False
+    if FREE_FORM_PATTERN.search(user_query or ""):
+        return False
+    columns = {spec.x_axis, spec.y_axis} | ({spec.group_by} if spec.group_by else set())
+    if not columns <= set(df.columns):
+        return False
+    if spec.aggregation != "count" and not pd.api.types.is_numeric_dtype(df[spec.y_axis]):
+        return False
+    if spec.chart_type == "scatter" and not pd.api.types.is_numeric_dtype(df[spec.x_axis]):
+        return False
+    return True
+
+
+def build_chart(
+    df: pd.DataFrame,
+    spec: ChartSpec,
+    team_colors: dict[str, list[str]] | None = None,
+    team_logo_paths: dict[str, str] | None = None,
+) -> go.Figure:
+    """
+    Render a bar, line or scatter chart straight from ``spec``: aggregate, sort, and color
+    by team (first TEAM_COLORS entry) where the color column holds team abbreviations.
+    Team scatters get logos when TEAM_LOGO_PATHS files are available.
+    """
+    try:
+        x, y, group = spec.x_axis, spec.y_axis, spec.group_by
+        if group == x:
+            group = None
+        data = _aggregate(df, x, y, group, spec.aggregation)
+
+        category_orders = {}
+        if spec.chart_type == "bar" or spec.aggregation:
+            data = data.sort_values(y, ascending=False, kind="stable")
+            if spec.chart_type != "scatter":
+                category_orders[x] = list(dict.fromkeys(data[x].tolist()))
+        elif spec.chart_type == "line":
+            data = data.sort_values(x, kind="stable")
+
+        color = group or (x if x in TEAM_COLUMNS and spec.chart_type == "bar" else None)
+        color_map = _team_color_map(data[color], team_colors) if color else None
+        labels = {y: f"{y} ({spec.aggregation})" if spec.aggregation else y}
+        title = spec.title or f"{y} by {x}"
+
+        common = {
+            "x": x,
+            "y": y,
+            "color": color,
+            "color_discrete_map": color_map,
+            "category_orders": category_orders or None,
+            "labels": labels,
+            "title": title,
+        }
+        if spec.chart_type == "bar":
+            fig = px.bar(data, **common)
+            if color == x:
+                fig.update_layout(showlegend=False)
+        elif spec.chart_type == "line":
+            fig = px.line(data, markers=True, **common)
+        else:
+            label = next((c for c in LABEL_COLUMNS if c in data.columns and c not in (x, y)), None)
+            fig = px.scatter(data, text=label, hover_data=[label] if label else None, **common)
+            if label:
+                fig.update_traces(textposition="top center", textfont_size=10)
+            _add_team_logos(fig, data, x, y, team_logo_paths)
+        return fig
+    except Exception as e:
+        logger.error(f"Failed to build {spec.chart_type} chart for {spec.y_axis}: {e}")
+        raise
+
+
+def _aggregate(
+    df: pd.DataFrame, x: str, y: str, group: str | None, aggregation: str | None
+) -> pd.DataFrame:
+    keys = [x, group] if group else [x]
+    passthrough = [c for c in LABEL_COLUMNS if c in df.columns and c not in (x, y, group)]
+    if not aggregation:
+        return df[list(dict.fromkeys([*keys, y, *passthrough]))].dropna(subset=[y])
+    return df.groupby(keys, dropna=False, sort=False)[y].agg(aggregation).reset_index()
+
+
+def _team_color_map(
+    values: pd.Series, team_colors: dict[str, list[str]] | None
+) -> dict[str, str] | None:
+    if not team_colors:
+        return None
+    mapping = {v: team_colors[v][0] for v in values.dropna().unique() if team_colors.get(v)}
+    return mapping or None
+
+
+def _add_team_logos(
+    fig: go.Figure,
+    data: pd.DataFrame,
+    x: str,
+    y: str,
+    team_logo_paths: dict[str, str] | None,
+) -> None:
+    team_column = next((c for c in TEAM_COLUMNS if c in data.columns), None)
+    if not team_logo_paths or team_column is None or len(data) > _MAX_LOGOS:
+        return
+    x_span = float(data[x].max() - data[x].min()) or 1.0
+    y_span = float(data[y].max() - data[y].min()) or 1.0
+    added = 0
+    for team, x_value, y_value in data[[team_column, x, y]].itertuples(index=False):
+        path = team_logo_paths.get(team)
+        if not path or not Path(path).exists():
+            continue
+        try:
+            source = encode_team_logo(path)
+        except Exception as e:
+            logger.warning(f"Skipping logo for {team}: {e}")
+            continue
+        fig.add_layout_image(
+            source=source,
+            x=x_value,
+            y=y_value,
+            xref="x",
+            yref="y",
+            sizex=x_span * 0.08,
+            sizey=y_span * 0.08,
+            xanchor="center",
+            yanchor="middle",
+            layer="above",
+        )
+        added += 1
+    if added:
+        # Logos replace the markers; keep invisible points for hover
+        fig.update_traces(marker={"opacity": 0}, mode="markers")
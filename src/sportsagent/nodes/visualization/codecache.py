@@ -0,0 +1,122 @@
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import pandas as pd
+
+from sportsagent.config import settings, setup_logging
+from sportsagent.nodes.queryparser.gazetteer import get_gazetteer
+from sportsagent.nodes.queryparser.parsecache import normalize_query
+
+logger = setup_logging(__name__)
+
+_SEASON = re.compile(r"\b(?:19|20)\d{2}\b")
+
+
+def chart_intent(user_query: str) -> str:
+    """
+    The chart request with players, teams and seasons replaced by placeholders, so the
+    same chart asked for a different player set maps to the same code.
+    """
+    text = user_query
+    for mention in reversed(get_gazetteer().scan(user_query)):
+        if mention.kind in ("player", "team"):
+            text = f"{text[: mention.start]}<{mention.kind}>{text[mention.end :]}"
+    return normalize_query(_SEASON.sub("<season>", text))
+
+
+def code_is_reusable(code: str, user_query: str) -> bool:
+    """
+    False when the code hard-codes a player, team or season from the query (say in a
+    title): the key abstracts those away, so reusing it would mislabel another request.
+    """
+    literals = set(_SEASON.findall(user_query))
+    for mention in get_gazetteer().scan(user_query):
+        if mention.kind in ("player", "team"):
+            literals.update((mention.text, mention.value))
+    return not any(
+        re.search(rf"(?<!\w){re.escape(literal)}(?!\w)", code, re.IGNORECASE)
+        for literal in literals
+        if literal
+    )
+
+
+def viz_code_key(
+    user_query: str, chart_spec: dict[str, Any] | None, primary_df: pd.DataFrame
+) -> str:
+    """Key over the chart intent, the (resolved) ChartSpec and the dataset column schema."""
+    schema = sorted((str(c), primary_df[c].dtype.kind) for c in primary_df.columns)
+    material = json.dumps(
+        [chart_intent(user_query), chart_spec, schema, settings.OPENAI_MODEL],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode()).hexdigest()[:32]
+
+
+class VizCodeCache:
+    """
+    LRU cache of ``generate_plot`` code that executed successfully. Code whose execution
+    later fails is evicted, so the next request regenerates it.
+    """
+
+    def __init__(self, max_entries: int = 128) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.failures = 0
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            code = self._entries.get(key)
+            if code is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return code
+
+    def put(self, key: str, code: str) -> None:
+        with self._lock:
+            self._entries[key] = code
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def report_failure(self, key: str) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._entries.pop(key, None) is not None:
+                logger.info(f"Evicted visualization code {key} after a failed execution")
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "failures": self.failures,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+_VIZ_CODE_CACHE: VizCodeCache | None = None
+_VIZ_CODE_CACHE_LOCK = threading.Lock()
+
+
+def get_viz_code_cache() -> VizCodeCache:
+    global _VIZ_CODE_CACHE
+    if _VIZ_CODE_CACHE is None:
+        with _VIZ_CODE_CACHE_LOCK:
+            if _VIZ_CODE_CACHE is None:
+                _VIZ_CODE_CACHE = VizCodeCache(max_entries=int(settings.VIZ_CODE_CACHE_SIZE))
+    return _VIZ_CODE_CACHE
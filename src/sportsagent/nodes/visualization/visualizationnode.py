@@ -1,11 +1,23 @@
+import json
+from typing import Any
+
 import pandas as pd
+import plotly.io as pio
 from langchain_core.output_parsers import StrOutputParser
-from langchain_openai import ChatOpenAI
 
 from sportsagent.config import settings, setup_logging
 from sportsagent.datasource import get_datasource
+from sportsagent.llm import get_chat_model
 from sportsagent.models.chatbotstate import ChatbotState
+from sportsagent.models.parsedquery import ChartSpec
 from sportsagent.nodes.visualization import get_visualization_template
+from sportsagent.nodes.visualization.chartbuilder import build_chart, native_chart_supported
+from sportsagent.nodes.visualization.codecache import (
+    code_is_reusable,
+    get_viz_code_cache,
+    viz_code_key,
+)
+from sportsagent.utils.promptrender import render_frame_for_prompt
 from sportsagent.utils.visualization_helpers import encode_team_logo
 
 logger = setup_logging(__name__)
@@ -13,7 +25,8 @@ logger = setup_logging(__name__)
 
 def generate_visualization_node(state: ChatbotState) -> ChatbotState:
     """
-    Node that generates visualization code but does not execute it.
+    Node that generates visualization code but does not execute it. Charts fully described
+    by ChartSpec are built directly instead (see chartbuilder), with no code to execute.
     """
     if not state.needs_visualization:
         return state
@@ -23,60 +36,40 @@ def generate_visualization_node(state: ChatbotState) -> ChatbotState:
         return state
 
     logger.info("Generating visualization code...")
+    state.visualization = None
 
     try:
-        data_summary = ""
-        primary_df = None
-
-        if state.retrieved_data:
-            for key, records in state.retrieved_data.items():
-                if records:
-                    df = pd.DataFrame(records)
-                    data_summary += f"\n### Dataset: {key}\nColumns: {list(df.columns)}\nSample data (first 5 rows):\n{df.head().to_string()}\n"
-                    if primary_df is None:
-                        primary_df = df
-        else:
+        frames = {
+            key: pd.DataFrame(records) for key, records in state.retrieved_data.items() if records
+        }
+        if not frames:
             logger.warning("No retrieved data available for visualization.")
             return state
+        primary_df = _primary_frame(frames)
 
-        # Initialize LLM
-        llm = ChatOpenAI(model=settings.OPENAI_MODEL)
-
-        # Validate chart_spec columns exist in data if chart_spec is provided
         chart_spec_dict = None
         if state.parsed_query.chart_spec:
-            chart_spec = state.parsed_query.chart_spec
-            chart_spec_dict = chart_spec.model_dump()
+            chart_spec_dict = _resolve_chart_spec(state.parsed_query.chart_spec, primary_df)
+            if _build_native_chart(state, ChartSpec(**chart_spec_dict), primary_df):
+                return state
 
-            # Get available columns from primary dataset
-            available_columns = set(primary_df.columns) if primary_df is not None else set()
+        cached_code = get_viz_code_cache().get(
+            viz_code_key(state.user_query, chart_spec_dict, primary_df)
+        )
+        if cached_code is not None:
+            logger.info("Reusing cached visualization code for this chart and schema")
+            state.visualization_code = cached_code
+            return state
 
-            # Check if required columns exist
-            missing_columns = []
-            if chart_spec.x_axis and chart_spec.x_axis not in available_columns:
-                missing_columns.append(chart_spec.x_axis)
-            if chart_spec.y_axis and chart_spec.y_axis not in available_columns:
-                missing_columns.append(chart_spec.y_axis)
+        data_summary = ""
+        priority_columns = state.parsed_query.requested_columns if state.parsed_query else []
+        dataset_budget = settings.PROMPT_TOKEN_BUDGET // max(len(frames), 1)
+        for key, df in frames.items():
+            rendered = render_frame_for_prompt(df, dataset_budget, priority_columns, name=key)
+            data_summary += f"\n### Dataset: {key}\nColumns: {list(df.columns)}\n{rendered}\n"
 
-            if missing_columns:
-                logger.warning(
-                    f"Chart spec references missing columns: {missing_columns}. "
-                    f"Available columns: {list(available_columns)}"
-                )
-                # Try to find similar column names (fuzzy matching)
-                for missing_col in missing_columns[:]:
-                    similar = [
-                        col
-                        for col in available_columns
-                        if missing_col.replace("_", "").lower() in col.replace("_", "").lower()
-                    ]
-                    if similar:
-                        logger.info(f"Found similar column for '{missing_col}': {similar[0]}")
-                        # Update chart_spec_dict with corrected column name
-                        if chart_spec.x_axis == missing_col:
-                            chart_spec_dict["x_axis"] = similar[0]
-                        if chart_spec.y_axis == missing_col:
-                            chart_spec_dict["y_axis"] = similar[0]
+        # Initialize LLM
+        llm = get_chat_model(settings.OPENAI_MODEL)
 
         template = get_visualization_template("visualization_instruction.j2")
         prompt_text = template.render(
@@ -109,12 +102,88 @@ def generate_visualization_node(state: ChatbotState) -> ChatbotState:
     return state
 
 
+def _primary_frame(datasets: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    if "players" in datasets:
+        return datasets["players"]
+    if "teams" in datasets:
+        return datasets["teams"]
+    return next(iter(datasets.values()), pd.DataFrame())
+
+
+def _resolve_chart_spec(chart_spec: ChartSpec, primary_df: pd.DataFrame) -> dict[str, Any]:
+    """ChartSpec as a dict, with axis columns missing from the data fuzzily corrected."""
+    chart_spec_dict = chart_spec.model_dump()
+    available_columns = set(primary_df.columns)
+
+    # Check if required columns exist
+    missing_columns = []
+    if chart_spec.x_axis and chart_spec.x_axis not in available_columns:
+        missing_columns.append(chart_spec.x_axis)
+    if chart_spec.y_axis and chart_spec.y_axis not in available_columns:
+        missing_columns.append(chart_spec.y_axis)
+
+    if missing_columns:
+        logger.warning(
+            f"Chart spec references missing columns: {missing_columns}. "
+            f"Available columns: {list(available_columns)}"
+        )
+        # Try to find similar column names (fuzzy matching)
+        for missing_col in missing_columns:
+            similar = [
+                col
+                for col in available_columns
+                if missing_col.replace("_", "").lower() in col.replace("_", "").lower()
+            ]
+            if similar:
+                logger.info(f"Found similar column for '{missing_col}': {similar[0]}")
+                # Update chart_spec_dict with corrected column name
+                if chart_spec.x_axis == missing_col:
+                    chart_spec_dict["x_axis"] = similar[0]
+                if chart_spec.y_axis == missing_col:
+                    chart_spec_dict["y_axis"] = similar[0]
+    return chart_spec_dict
+
+
+def _build_native_chart(state: ChatbotState, spec: ChartSpec, primary_df: pd.DataFrame) -> bool:
+    """Render a fully specified chart without LLM code generation; False to fall back."""
+    if not settings.NATIVE_CHARTS_ENABLED or not native_chart_supported(
+        spec, primary_df, state.user_query
+    ):
+        return False
+    try:
+        datasource = get_datasource()
+        fig = build_chart(
+            primary_df,
+            spec,
+            team_colors=datasource.TEAM_COLORS,
+            team_logo_paths=datasource.TEAM_LOGO_PATHS,
+        )
+        state.visualization = _serialize_figure(fig)
+        state.visualization_code = None
+        logger.info(f"Built {spec.chart_type} chart natively from ChartSpec")
+        return True
+    except Exception as e:
+        logger.warning(f"Native chart build failed; falling back to generated code: {e}")
+        return False
+
+
+def _serialize_figure(fig: Any) -> dict[str, Any]:
+    # Convert to dict for serialization (msgpack compatibility)
+    fig_json = pio.to_json(fig)
+    if not fig_json:
+        raise ValueError("Failed to serialize figure to JSON")
+    return json.loads(fig_json)
+
+
 def execute_visualization_node(state: ChatbotState) -> ChatbotState:
     """
     Node that executes the generated visualization code.
     """
     if not state.visualization_code:
-        logger.warning("No visualization code to execute.")
+        if state.visualization is not None:
+            logger.info("Chart already built natively; nothing to execute.")
+        else:
+            logger.warning("No visualization code to execute.")
         return state
 
     logger.info("Executing visualization code...")
@@ -128,16 +197,18 @@ def execute_visualization_node(state: ChatbotState) -> ChatbotState:
                 if records:
                     datasets[key] = pd.DataFrame(records)
 
-            if "players" in datasets:
-                primary_df = datasets["players"]
-            elif "teams" in datasets:
-                primary_df = datasets["teams"]
-            elif datasets:
-                primary_df = list(datasets.values())[0]
+            primary_df = _primary_frame(datasets)
         else:
             logger.warning("No retrieved data available for execution.")
             return state
 
+        chart_spec = state.parsed_query.chart_spec if state.parsed_query else None
+        cache_key = viz_code_key(
+            state.user_query,
+            _resolve_chart_spec(chart_spec, primary_df) if chart_spec else None,
+            primary_df,
+        )
+
         local_vars = {}
         datasource = get_datasource()
         global_vars = {
@@ -153,25 +224,23 @@ def execute_visualization_node(state: ChatbotState) -> ChatbotState:
             if generate_plot and callable(generate_plot):
                 fig = generate_plot(primary_df)
                 if fig:
-                    # Convert to dict for serialization (msgpack compatibility)
-                    import json
-
-                    import plotly.io as pio
-
-                    fig_json = pio.to_json(fig)
-                    if not fig_json:
-                        raise ValueError("Failed to serialize figure to JSON")
-                    state.visualization = json.loads(fig_json)
+                    state.visualization = _serialize_figure(fig)
                     logger.info("Visualization generated and serialized successfully.")
+                    # Only code that produced a figure, and names nothing from this query, is reused
+                    if code_is_reusable(state.visualization_code, state.user_query):
+                        get_viz_code_cache().put(cache_key, state.visualization_code)
                 else:
                     logger.warning("Function 'generate_plot' returned None.")
+                    get_viz_code_cache().report_failure(cache_key)
             else:
                 logger.warning(
                     "Code executed but function 'generate_plot' not found or not callable."
                 )
+                get_viz_code_cache().report_failure(cache_key)
 
         except Exception as exec_error:
             logger.error(f"Error executing visualization code: {exec_error}")
+            get_viz_code_cache().report_failure(cache_key)
 
     except Exception as e:
         logger.error(f"Visualization execution failed: {e}")
@@ -1,5 +1,6 @@
-from sportsagent.config import setup_logging
+from sportsagent.config import settings, setup_logging
 from sportsagent.models.chatbotstate import ChatbotState
+from sportsagent.models.conversationmemory import ConversationMemory
 
 logger = setup_logging(__name__)
 
@@ -35,6 +36,11 @@ def exit_node(state: ChatbotState) -> ChatbotState:
         if state.parsed_query and state.parsed_query.team_stats_query
         else [],
     }
+    if state.conversation_memory.turns_seen < len(state.conversation_history):
+        # History handed in by a client without its memory (CLI, Streamlit): rebuild once
+        state.conversation_memory = ConversationMemory.from_history(state.conversation_history)
+    state.conversation_memory.update(new_turn)
     state.conversation_history.append(new_turn)
+    del state.conversation_history[: -settings.CONVERSATION_HISTORY_MAX_TURNS]
 
     return state
@@ -3,6 +3,7 @@ from typing import Literal
 from sportsagent.config import setup_logging
 from sportsagent.models.chatboterror import ErrorStates
 from sportsagent.models.chatbotstate import ChatbotState
+from sportsagent.nodes.fastanswer.fastanswernode import plan_fast_answer
 
 logger = setup_logging(__name__)
 
@@ -56,7 +57,7 @@ def should_continue_after_parser(
 
 def should_continue_after_retriever(
     state: ChatbotState,
-) -> Literal["AnalyzerReactAgent", "exit"]:
+) -> Literal["fast_answer", "AnalyzerReactAgent", "exit"]:
     # Check for retrieval errors
     if state.error and "retriever" in state.error:
         logger.info("Retriever -> Exit (retrieval error)")
@@ -73,6 +74,10 @@ def should_continue_after_retriever(
             )
         return "exit"
 
+    if plan_fast_answer(state) is not None:
+        logger.info("Retriever -> Fast Answer (deterministic sort/lookup)")
+        return "fast_answer"
+
     logger.info("Retriever -> AnalyzerReactAgent")
     return "AnalyzerReactAgent"
 
@@ -92,4 +97,28 @@ def should_continue_after_analyzer(
     return "save_report"
 
 
+def should_continue_after_fast_answer(
+    state: ChatbotState,
+) -> Literal["generate_visualization", "save_report", "exit"]:
+    if state.error:
+        logger.info("Fast Answer -> Exit (error)")
+        return "exit"
 
+    if state.needs_visualization:
+        logger.info("Fast Answer -> Generate Visualization")
+        return "generate_visualization"
+
+    logger.info("Fast Answer -> Save Report")
+    return "save_report"
+
+
+def should_continue_after_generate_visualization(
+    state: ChatbotState,
+) -> Literal["execute_visualization", "save_report"]:
+    if state.visualization is not None and not state.visualization_code:
+        # Built natively from the ChartSpec: there is no code to review or execute
+        logger.info("Generate Visualization -> Save Report (native chart)")
+        return "save_report"
+
+    logger.info("Generate Visualization -> Execute Visualization")
+    return "execute_visualization"
@@ -1,5 +1,6 @@
 import asyncio
 import uuid
+from collections.abc import AsyncIterator, Iterable, Iterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -9,6 +10,7 @@ from langchain_core.runnables import RunnableConfig
 from sportsagent.config import setup_logging
 from sportsagent.models.chatbotstate import ChatbotState
 from sportsagent.models.parsedquery import ParsedQuery
+from sportsagent.models.streamevent import StreamEvent
 from sportsagent.workflow import compile_workflow
 
 logger = setup_logging(__name__)
@@ -20,6 +22,11 @@ class RunResult:
     pending: list[str]
 
 
+type RunStreamItem = StreamEvent | RunResult
+
+STREAM_MODES = ["updates", "custom"]
+
+
 class WorkflowRunner:
     base_config: RunnableConfig
 
@@ -51,21 +58,83 @@ class WorkflowRunner:
         retrieved_data: Any | None = None,
     ) -> RunResult:
         try:
-            state = ChatbotState(
-                session_id=self.session_id,
-                user_query=user_query,
-                generated_response="",
-                conversation_history=conversation_history or [],
-                retrieved_data=retrieved_data,
-                parsed_query=ParsedQuery(parse_status="unparsed"),
-            )
-            return self._drive(state)
+            return _final_result(self.stream(user_query, conversation_history, retrieved_data))
         except Exception as exc:  # pragma: no cover - runtime guard
             logger.error(f"WorkflowRunner.run failed: {exc}")
             raise
 
+    def stream(
+        self,
+        user_query: str,
+        conversation_history: list[dict[str, Any]] | None = None,
+        retrieved_data: Any | None = None,
+    ) -> Iterator[RunStreamItem]:
+        """
+        Run a turn, yielding StreamEvents (answer tokens, tool calls, finished nodes)
+        as they happen and the RunResult as the last item.
+        """
+        state = self._initial_state(user_query, conversation_history, retrieved_data)
+        yield from self._drive_events(state)
+
+    async def arun(
+        self,
+        user_query: str,
+        conversation_history: list[dict[str, Any]] | None = None,
+        retrieved_data: Any | None = None,
+    ) -> RunResult:
+        """Async ``run``: the graph executes on the caller's event loop (no worker thread)."""
+        try:
+            result = None
+            async for item in self.astream(user_query, conversation_history, retrieved_data):
+                if isinstance(item, RunResult):
+                    result = item
+            if result is None:
+                raise ValueError("Workflow stream ended without a result")
+            return result
+        except Exception as exc:  # pragma: no cover - runtime guard
+            logger.error(f"WorkflowRunner.arun failed: {exc}")
+            raise
+
+    async def astream(
+        self,
+        user_query: str,
+        conversation_history: list[dict[str, Any]] | None = None,
+        retrieved_data: Any | None = None,
+    ) -> AsyncIterator[RunStreamItem]:
+        """Async ``stream``; cancelling the consumer cancels the in-flight node."""
+        state = self._initial_state(user_query, conversation_history, retrieved_data)
+        async for item in self._adrive_events(state):
+            yield item
+
     def resume_with_approval(self, decision: str) -> RunResult:
         """Resume workflow with user's approval decision."""
+        try:
+            return _final_result(self.stream_approval(decision))
+        except Exception as exc:  # pragma: no cover - runtime guard
+            logger.error(f"WorkflowRunner.resume_with_approval failed: {exc}")
+            raise
+
+    def stream_approval(self, decision: str) -> Iterator[RunStreamItem]:
+        """Streaming counterpart of resume_with_approval."""
+        self._apply_approval(decision)
+        yield from self._drive_events(None)
+
+    def _initial_state(
+        self,
+        user_query: str,
+        conversation_history: list[dict[str, Any]] | None,
+        retrieved_data: Any | None,
+    ) -> ChatbotState:
+        return ChatbotState(
+            session_id=self.session_id,
+            user_query=user_query,
+            generated_response="",
+            conversation_history=conversation_history or [],
+            retrieved_data=retrieved_data,
+            parsed_query=ParsedQuery(parse_status="unparsed"),
+        )
+
+    def _apply_approval(self, decision: str) -> None:
         try:
             if decision not in ("approved", "denied"):
                 raise ValueError(f"Invalid approval decision: {decision}")
@@ -107,10 +176,8 @@ class WorkflowRunner:
                     approval_result=decision,
                 )
                 self.graph.update_state(self.base_config, minimal_state)
-
-            return self._drive(None)
         except Exception as exc:  # pragma: no cover - runtime guard
-            logger.error(f"WorkflowRunner.resume_with_approval failed: {exc}")
+            logger.error(f"WorkflowRunner approval update failed: {exc}")
             raise
 
     def _coerce_state(self, values: Any) -> ChatbotState:
@@ -159,53 +226,107 @@ class WorkflowRunner:
             logger.error(f"Interrupt handling failed: {exc}")
             raise
 
-    def _drive(self, initial_state: ChatbotState | None) -> RunResult:
-        try:
-            next_input = initial_state
-            pending: list[str] = []
-            state_obj: ChatbotState | None = None
+    def _run_config(self, next_input: ChatbotState | None) -> RunnableConfig:
+        config = RunnableConfig(self.base_config)
+        config["run_name"] = "Start Workflow" if next_input else "Resume Workflow"
+        return config
 
-            while True:
-                config = RunnableConfig(self.base_config)
-                config["run_name"] = "Start Workflow" if next_input else "Resume Workflow"
-                stream = self.graph.stream(next_input, config=config, stream_mode="updates")
-                for _ in stream:
-                    continue
+    def _settle(self, snapshot: Any) -> RunResult | None:
+        """Result of a finished graph pass, or ``None`` when the run should resume."""
+        state_obj = self._coerce_state(snapshot.values)
+        pending = list(snapshot.next or [])
 
-                snapshot = self.graph.get_state(self.base_config)
-                state_obj = self._coerce_state(snapshot.values)
-                pending = list(snapshot.next or [])
+        approval_result = self._handle_approval(state_obj)
+        if approval_result is not None:
+            return approval_result
 
-                approval_result = self._handle_approval(state_obj)
-                if approval_result is not None:
-                    return approval_result
+        if pending:
+            if self._handle_interrupts(pending):
+                return None
+            return RunResult(state=state_obj, pending=pending)
 
-                if pending:
-                    should_resume = self._handle_interrupts(pending)
-                    next_input = None
-                    if should_resume:
-                        continue
-                    return RunResult(state=state_obj, pending=pending)
+        return RunResult(state=state_obj, pending=[])
 
-                if state_obj is None:
-                    raise ValueError("State unavailable after workflow run")
+    def _drive_events(self, initial_state: ChatbotState | None) -> Iterator[RunStreamItem]:
+        try:
+            next_input = initial_state
 
-                if self.session_manager:
-                    import asyncio
+            while True:
+                stream = self.graph.stream(
+                    next_input, config=self._run_config(next_input), stream_mode=STREAM_MODES
+                )
+                for mode, payload in stream:
+                    yield from _stream_events(mode, payload)
 
+                result = self._settle(self.graph.get_state(self.base_config))
+                next_input = None
+                if result is None:
+                    continue
+
+                if not result.pending and self.session_manager:
                     try:
-                        asyncio.create_task(self.session_manager.save_session(state_obj))
+                        asyncio.create_task(self.session_manager.save_session(result.state))
                     except RuntimeError:
                         # Handle case where event loop is not running
                         try:
-                            asyncio.run(self.session_manager.save_session(state_obj))
+                            asyncio.run(self.session_manager.save_session(result.state))
                         except RuntimeError:
                             # Handle case where event loop is already running
                             nest_asyncio.apply()
                             loop = asyncio.get_event_loop()
-                            loop.run_until_complete(self.session_manager.save_session(state_obj))
+                            loop.run_until_complete(self.session_manager.save_session(result.state))
+
+                yield result
+                return
+        except Exception as exc:  # pragma: no cover - runtime guard
+            logger.error(f"WorkflowRunner._drive_events failed: {exc}")
+            raise
+
+    async def _adrive_events(
+        self, initial_state: ChatbotState | None
+    ) -> AsyncIterator[RunStreamItem]:
+        try:
+            next_input = initial_state
+
+            while True:
+                stream = self.graph.astream(
+                    next_input, config=self._run_config(next_input), stream_mode=STREAM_MODES
+                )
+                async for mode, payload in stream:
+                    for event in _stream_events(mode, payload):
+                        yield event
 
-                return RunResult(state=state_obj, pending=[])
+                result = self._settle(await self.graph.aget_state(self.base_config))
+                next_input = None
+                if result is None:
+                    continue
+
+                if not result.pending and self.session_manager:
+                    await self.session_manager.save_session(result.state)
+
+                yield result
+                return
         except Exception as exc:  # pragma: no cover - runtime guard
-            logger.error(f"WorkflowRunner._drive failed: {exc}")
+            logger.error(f"WorkflowRunner._adrive_events failed: {exc}")
             raise
+
+
+def _stream_events(mode: str, payload: Any) -> Iterable[StreamEvent]:
+    """StreamEvents for one ``graph.stream`` item (custom events and finished nodes)."""
+    if mode == "custom" and isinstance(payload, StreamEvent):
+        yield payload
+    elif mode == "updates" and isinstance(payload, dict):
+        for node in payload:
+            if not node.startswith("__"):
+                yield StreamEvent(kind="status", content=node, node=node)
+
+
+def _final_result(items: Iterator[RunStreamItem]) -> RunResult:
+    """Drain a run stream, discarding incremental events, and return its RunResult."""
+    result = None
+    for item in items:
+        if isinstance(item, RunResult):
+            result = item
+    if result is None:
+        raise ValueError("Workflow stream ended without a result")
+    return result
@@ -1,17 +1,28 @@
-import io
-from typing import Annotated
+from typing import Annotated, Literal
 
+import numpy as np
 import pandas as pd
 from langchain.tools import tool
 from langgraph.prebuilt import InjectedState
 
+from sportsagent.config import settings, setup_logging
+from sportsagent.datasource import get_datasource
+from sportsagent.models.chatboterror import RetrievalError
 from sportsagent.models.comparisonmetric import ComparisionMetrics, ComparisonMetric
+from sportsagent.utils.dataprofile import get_profile
+from sportsagent.utils.frameregistry import get_frame_registry
+from sportsagent.utils.promptrender import render_frame_for_prompt
+
+logger = setup_logging(__name__)
+
+COMPARISON_EXCLUDED_COLUMNS = {"season", "week", "games_played"}
+MISSING_FRAME_MESSAGE = "The analysis dataset is no longer available; request the data again."
 
 
 @tool(response_format="content")
 def explain_data(
-    data_raw: Annotated[dict, InjectedState("data_raw")],
-    n_sample: int = 30,
+    data_handle: Annotated[str, InjectedState("data_handle")],
+    n_sample: int = 10,
     skip_stats: bool = False,
 ):
     """
@@ -21,8 +32,8 @@ def explain_data(
         missing value percentages, unique counts, sample rows, and (if not skipped) descriptive stats/info.
 
     Parameters:
-        data_raw (dict): Raw data.
-        n_sample (int, default=30): Number of rows to display.
+        data_handle (str): Frame registry handle injected from state.
+        n_sample (int, default=10): Maximum number of rows to display (token budgeted).
         skip_stats (bool, default=False): If True, omit descriptive stats/info.
 
     LLM Guidance:
@@ -32,13 +43,18 @@ def explain_data(
         str: Detailed DataFrame summary.
     """
     print("    * Tool: explain_data")
-    result = get_dataframe_summary(pd.DataFrame(data_raw), n_sample=n_sample, skip_stats=skip_stats)
+    df = _resolve_frame(data_handle)
+    if df is None:
+        return MISSING_FRAME_MESSAGE
+    result = get_dataframe_summary(
+        df, n_sample=n_sample, skip_stats=skip_stats, fingerprint=data_handle
+    )
     return result
 
 
 @tool(response_format="content_and_artifact")
 def describe_dataset(
-    data_raw: Annotated[dict, InjectedState("data_raw")],
+    data_handle: Annotated[str, InjectedState("data_handle")],
 ) -> tuple[str, dict]:
     """
     Tool: describe_dataset
@@ -48,8 +64,8 @@ def describe_dataset(
 
     Parameters:
     -----------
-    data_raw : dict
-        The raw data in dictionary format.
+    data_handle : str
+        Frame registry handle injected from state.
 
     LLM Selection Guidance:
     ------------------------
@@ -66,7 +82,9 @@ def describe_dataset(
     """
     print("    * Tool: describe_dataset")
 
-    df = pd.DataFrame(data_raw)
+    df = _resolve_frame(data_handle)
+    if df is None:
+        return MISSING_FRAME_MESSAGE, {}
     description_df = df.describe(include="all")
     content = "Summary statistics computed using pandas describe()."
     artifact = {"describe_df": description_df.to_dict()}
@@ -75,7 +93,9 @@ def describe_dataset(
 
 @tool(response_format="content_and_artifact")
 def compare_performance(
-    data_raw: Annotated[dict, InjectedState("data_raw")],
+    data_handle: Annotated[str, InjectedState("data_handle")],
+    group_by: Literal["player", "team"] | None = None,
+    aggregation: Literal["sum", "mean"] = "sum",
 ) -> tuple[str, dict]:
     """
     Tool: compare_performance
@@ -84,70 +104,25 @@ def compare_performance(
         Identifies leaders and trailers for each numeric statistic.
 
     Parameters:
-        data_raw (dict): Raw data injected from state.
+        data_handle (str): Frame registry handle injected from state.
+        group_by ("player" | "team", optional): Combine rows per player/team first. Use when the
+            data holds several rows per player (multiple seasons or weekly game logs).
+        aggregation ("sum" | "mean", default "sum"): How grouped rows are combined.
 
     Returns:
         tuple[str, dict]: A summary string and the comparison metrics artifact.
     """
     print("    * Tool: compare_performance")
-    df = pd.DataFrame(data_raw)
+    df = _resolve_frame(data_handle)
+    if df is None:
+        return MISSING_FRAME_MESSAGE, {}
 
-    if df.empty or len(df) < 2:
+    metrics = compute_comparisons(df, group_by=group_by, aggregation=aggregation)
+    if metrics is None:
         return "Insufficient data for comparison (need at least 2 records).", {}
 
-    metrics = ComparisionMetrics(player_count=len(df), comparisons=[])
-
-    # Get numeric columns for comparison
-    numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
-    stat_cols = [col for col in numeric_cols if col not in ["season", "week", "games_played"]]
-
-    # Calculate differences for each stat
-    for stat in stat_cols:
-        if stat in df.columns and df[stat].notna().any():
-            values = df[stat].dropna()
-            if len(values) >= 2:
-                max_val = values.max()
-                min_val = values.min()
-                if max_val > 0:  # Avoid division by zero and irrelevant stats
-                    pct_diff = ((max_val - min_val) / max_val) * 100
-
-                    # Find players with max and min values
-                    # Handle potential duplicates by taking the first one
-                    max_players = df.loc[df[stat] == max_val, "player_name"]
-                    max_player = (
-                        max_players.iloc[0]
-                        if isinstance(max_players, pd.Series)
-                        and not max_players.empty
-                        and "player_name" in df.columns
-                        else "Unknown"
-                    )
-
-                    min_players = df.loc[df[stat] == min_val, "player_name"]
-                    min_player = (
-                        min_players.iloc[0]
-                        if isinstance(min_players, pd.Series)
-                        and not min_players.empty
-                        and "player_name" in df.columns
-                        else "Unknown"
-                    )
-
-                    metrics.comparisons.append(
-                        ComparisonMetric(
-                            stat=stat,
-                            max_value=max_val,
-                            min_value=min_val,
-                            difference=max_val - min_val,
-                            percent_difference=pct_diff,
-                            leader=max_player,
-                            trailing=min_player,
-                        )
-                    )
-
-    # Sort comparisons by percent difference to highlight biggest gaps
-    metrics.comparisons.sort(key=lambda x: x.percent_difference, reverse=True)
-
     # Generate summary string
-    summary_lines = [f"Comparison across {len(df)} players:"]
+    summary_lines = [f"Comparison across {metrics.player_count} players:"]
     for comp in metrics.comparisons[:5]:  # Top 5 differences
         stat_name = comp.stat.replace("_", " ").title()
         summary_lines.append(
@@ -158,10 +133,202 @@ def compare_performance(
     return "\n".join(summary_lines), metrics.model_dump()
 
 
+@tool(response_format="content_and_artifact")
+def league_context(
+    data_handle: Annotated[str, InjectedState("data_handle")],
+    stats: list[str] | None = None,
+) -> tuple[str, dict]:
+    """
+    Tool: league_context
+    Description:
+        Ranks each player in the dataset against the league: percentile (0-100, share of
+        qualified players at the same position and season at or below the value) and z-score
+        for each stat, using cached per-season, per-position distributions.
+
+    Parameters:
+        data_handle (str): Frame registry handle injected from state.
+        stats (list[str], optional): Stat columns to rank. Defaults to every numeric stat.
+
+    LLM Guidance:
+        Use for statements like "92nd percentile among QBs" or "two standard deviations above
+        average" instead of reasoning over raw rows. Requires season-level (not weekly) rows.
+
+    Returns:
+        tuple[str, dict]: A compact table and the full context rows as an artifact.
+    """
+    print("    * Tool: league_context")
+    df = _resolve_frame(data_handle)
+    if df is None:
+        return MISSING_FRAME_MESSAGE, {}
+    if "week" in df.columns and df["week"].nunique(dropna=True) > 1:
+        return "League context compares season totals; the dataset holds weekly rows.", {}
+
+    context = get_datasource().get_league_context(df, stats)
+    ranked = [c for c in context.columns if c.endswith("_pctl")]
+    if not ranked:
+        return "No league reference distribution is available for these stats.", {}
+
+    content = render_frame_for_prompt(
+        context,
+        settings.PROMPT_TOKEN_BUDGET,
+        priority_columns=[c for s in ranked for c in (s, s.removesuffix("_pctl") + "_z")],
+        name="League context (percentile 0-100, z-score vs position and season)",
+        decimals=1,
+    )
+    return content, {"league_context": context.to_dict(orient="records")}
+
+
+@tool(response_format="content_and_artifact")
+def find_similar_players(
+    player_name: str,
+    season: int,
+    k: int = 5,
+    compare_seasons: list[int] | None = None,
+) -> tuple[str, dict]:
+    """
+    Tool: find_similar_players
+    Description:
+        Finds the player-seasons whose statistical profile most resembles the given player's
+        season: cosine similarity of per-game stats standardized within each season and
+        position, searched across recent seasons at the same position.
+
+    Parameters:
+        player_name (str): Player display name or player id; a partial name must be unique.
+        season (int): Season of the player's profile.
+        k (int, default=5): Number of comparable player-seasons to return.
+        compare_seasons (list[int], optional): Seasons to search. Defaults to recent history.
+
+    LLM Guidance:
+        Use for "who does X compare to", "similar players" or historical comps. Similarity
+        is relative to each season's league, so comps across eras are meaningful.
+
+    Returns:
+        tuple[str, dict]: A ranked table of comparable player-seasons and the rows as artifact.
+    """
+    print("    * Tool: find_similar_players")
+    try:
+        similar = get_datasource().get_similar_players(
+            player_name, season, k=k, seasons=compare_seasons
+        )
+    except (RetrievalError, ValueError) as e:
+        # Ambiguous names list their candidates; hand them back so the agent can retry
+        logger.warning(f"find_similar_players failed for {player_name!r}: {e}")
+        return (
+            f"Could not look up {player_name} ({season}): {e}. "
+            "If several players matched, call again with one of the full names listed.",
+            {},
+        )
+    if similar.empty:
+        return f"No {season} statistical profile found for {player_name}.", {}
+
+    content = render_frame_for_prompt(
+        similar,
+        settings.PROMPT_TOKEN_BUDGET,
+        priority_columns=["similarity"],
+        name=f"Player-seasons most similar to {player_name} ({season}), similarity 0-1",
+        decimals=3,
+    )
+    return content, {"similar_players": similar.to_dict(orient="records")}
+
+
+def compute_comparisons(
+    df: pd.DataFrame,
+    group_by: Literal["player", "team"] | None = None,
+    aggregation: Literal["sum", "mean"] = "sum",
+) -> ComparisionMetrics | None:
+    """
+    Leader/trailer for every numeric stat in one pass: the numeric block is reduced
+    column-wise with nanargmax/nanargmin instead of per-stat masks and lookups.
+    """
+    try:
+        if group_by is not None:
+            df = _group_for_comparison(df, group_by, aggregation)
+        if df.empty or len(df) < 2:
+            return None
+
+        numeric_cols = df.select_dtypes(include=["number"]).columns
+        stat_cols = [col for col in numeric_cols if col not in COMPARISON_EXCLUDED_COLUMNS]
+        metrics = ComparisionMetrics(player_count=len(df), comparisons=[])
+        if not stat_cols:
+            return metrics
+
+        block = df[stat_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        comparable = (~np.isnan(block)).sum(axis=0) >= 2
+        block = block[:, comparable]
+        stats = np.asarray(stat_cols, dtype=object)[comparable]
+        if not len(stats):
+            return metrics
+
+        columns = np.arange(block.shape[1])
+        max_idx = np.nanargmax(block, axis=0)
+        min_idx = np.nanargmin(block, axis=0)
+        max_vals = block[max_idx, columns]
+        min_vals = block[min_idx, columns]
+
+        # Skip all-zero / all-negative stats where a percent gap is meaningless
+        keep = max_vals > 0
+        diff = max_vals - min_vals
+        pct = np.divide(diff, max_vals, out=np.zeros_like(diff), where=keep) * 100
+
+        names = _comparison_names(df)
+        order = np.argsort(-pct[keep], kind="stable")
+        kept = np.flatnonzero(keep)[order]
+        metrics.comparisons = [
+            ComparisonMetric(
+                stat=str(stats[i]),
+                max_value=float(max_vals[i]),
+                min_value=float(min_vals[i]),
+                difference=float(diff[i]),
+                percent_difference=float(pct[i]),
+                leader=str(names[max_idx[i]]),
+                trailing=str(names[min_idx[i]]),
+            )
+            for i in kept
+        ]
+        return metrics
+    except Exception as e:
+        logger.error(f"Failed to compute comparisons shape={df.shape} {group_by=}: {e}")
+        raise
+
+
+def _comparison_names(df: pd.DataFrame) -> np.ndarray:
+    for col in ("player_name", "player_display_name", "team"):
+        if col in df.columns:
+            return df[col].astype(str).to_numpy()
+    return np.full(len(df), "Unknown", dtype=object)
+
+
+def _group_for_comparison(
+    df: pd.DataFrame, group_by: Literal["player", "team"], aggregation: Literal["sum", "mean"]
+) -> pd.DataFrame:
+    if group_by == "player":
+        keys = [c for c in ("player_id", "player_name", "player_display_name") if c in df.columns]
+    else:
+        keys = ["team"] if "team" in df.columns else []
+    if not keys:
+        return df
+
+    numeric_cols = df.select_dtypes(include=["number"]).columns
+    stat_cols = [c for c in numeric_cols if c not in COMPARISON_EXCLUDED_COLUMNS and c not in keys]
+    grouped = df.groupby(keys, sort=False, observed=True, dropna=False)[stat_cols]
+    return (grouped.sum(min_count=1) if aggregation == "sum" else grouped.mean()).reset_index()
+
+
+def _resolve_frame(data_handle: str | None) -> pd.DataFrame | None:
+    if not data_handle:
+        return None
+    try:
+        return get_frame_registry().resolve(data_handle)
+    except KeyError as e:
+        logger.warning(str(e))
+        return None
+
+
 def get_dataframe_summary(
     dataframes: pd.DataFrame | list[pd.DataFrame] | dict[str, pd.DataFrame],
-    n_sample: int = 30,
+    n_sample: int = 10,
     skip_stats: bool = False,
+    fingerprint: str | None = None,
 ) -> list[str]:
     """
     Generate a summary for one or more DataFrames. Accepts a single DataFrame, a list of DataFrames,
@@ -173,10 +340,13 @@ def get_dataframe_summary(
         - Single DataFrame: produce a single summary (returned within a one-element list).
         - List of DataFrames: produce a summary for each DataFrame, using index-based names.
         - Dictionary of DataFrames: produce a summary for each DataFrame, using dictionary keys as names.
-    n_sample : int, default 30
-        Number of rows to display in the "Data (first 30 rows)" section.
+    n_sample : int, default 10
+        Maximum number of rows rendered in the "Data" section, within PROMPT_TOKEN_BUDGET.
     skip_stats : bool, default False
         If True, skip the descriptive statistics and DataFrame info sections.
+    fingerprint : str, optional
+        Known content fingerprint (e.g. a frame registry handle) of a single DataFrame,
+        used to look up its cached profile without rehashing.
 
     Example:
     --------
@@ -200,7 +370,7 @@ def get_dataframe_summary(
         - Column data types
         - Missing value percentage
         - Unique value counts
-        - First 30 rows
+        - Up to ``n_sample`` rows, rendered within PROMPT_TOKEN_BUDGET
         - Descriptive statistics
         - DataFrame info output
     """
@@ -214,7 +384,11 @@ def get_dataframe_summary(
 
     # --- Single DataFrame Case ---
     elif isinstance(dataframes, pd.DataFrame):
-        summaries.append(_summarize_dataframe(dataframes, "Single_Dataset", n_sample, skip_stats))
+        summaries.append(
+            _summarize_dataframe(
+                dataframes, "Single_Dataset", n_sample, skip_stats, fingerprint=fingerprint
+            )
+        )
 
     # --- List of DataFrames Case ---
     elif isinstance(dataframes, list):
@@ -230,34 +404,47 @@ def get_dataframe_summary(
     return summaries
 
 
-def _summarize_dataframe(df: pd.DataFrame, dataset_name: str, n_sample=30, skip_stats=False) -> str:
-    """Generate a summary string for a single DataFrame."""
-    # 1. Convert dictionary-type cells to strings
-    #    This prevents unhashable dict errors during df.nunique().
-    df = df.apply(lambda col: col.map(lambda x: str(x) if isinstance(x, dict) else x))
+def _summarize_dataframe(
+    df: pd.DataFrame,
+    dataset_name: str,
+    n_sample=10,
+    skip_stats=False,
+    fingerprint: str | None = None,
+) -> str:
+    """Generate a summary string for a single DataFrame from its cached profile."""
+    profile = get_profile(df, fingerprint)
 
-    # 2. Capture df.info() output
-    buffer = io.StringIO()
-    df.info(buf=buffer)
-    info_text = buffer.getvalue()
+    column_types = "\n".join([f"{col}: {dtype}" for col, dtype in profile.dtypes.items()])
+    sample = render_frame_for_prompt(df, settings.PROMPT_TOKEN_BUDGET, max_rows=n_sample)
 
-    # 3. Calculate missing value stats
-    missing_stats = (df.isna().sum() / len(df) * 100).sort_values(ascending=False)
-    missing_summary = "\n".join([f"{col}: {val:.2f}%" for col, val in missing_stats.items()])
+    if skip_stats:
+        summary_text = f"""
+        Dataset Name: {dataset_name}
+        ----------------------------
+        Shape: {profile.row_count} rows x {len(profile.columns)} columns
 
-    # 4. Get column data types
-    column_types = "\n".join([f"{col}: {dtype}" for col, dtype in df.dtypes.items()])
+        Column Data Types:
+        {column_types}
 
-    # 5. Get unique value counts
-    unique_counts = df.nunique()  # Will no longer fail on unhashable dict
-    unique_counts_summary = "\n".join([f"{col}: {count}" for col, count in unique_counts.items()])
+        Data:
+        {sample}
+        """
+        return summary_text.strip()
 
-    # 6. Generate the summary text
-    if not skip_stats:
-        summary_text = f"""
+    missing_stats = profile.missing_pct.sort_values(ascending=False)
+    missing_summary = "\n".join([f"{col}: {val:.2f}%" for col, val in missing_stats.items()])
+    unique_counts_summary = "\n".join(
+        [f"{col}: {count}" for col, count in profile.unique_counts.items()]
+    )
+    non_null = profile.row_count - profile.null_counts
+    info_text = "\n".join(
+        [f"{col}: {count} non-null {profile.dtypes[str(col)]}" for col, count in non_null.items()]
+    )
+
+    summary_text = f"""
         Dataset Name: {dataset_name}
         ----------------------------
-        Shape: {df.shape[0]} rows x {df.shape[1]} columns
+        Shape: {profile.row_count} rows x {len(profile.columns)} columns
 
         Column Data Types:
         {column_types}
@@ -268,27 +455,15 @@ def _summarize_dataframe(df: pd.DataFrame, dataset_name: str, n_sample=30, skip_
         Unique Value Counts:
         {unique_counts_summary}
 
-        Data (first {n_sample} rows):
-        {df.head(n_sample).to_string()}
+        Data:
+        {sample}
 
         Data Description:
-        {df.describe().to_string()}
+        {profile.stats_frame().T.round(2).to_csv(index_label="column").strip()}
 
         Data Info:
         {info_text}
         """
-    else:
-        summary_text = f"""
-        Dataset Name: {dataset_name}
-        ----------------------------
-        Shape: {df.shape[0]} rows x {df.shape[1]} columns
-
-        Column Data Types:
-        {column_types}
-
-        Data (first {n_sample} rows):
-        {df.head(n_sample).to_string()}
-        """
 
     return summary_text.strip()
 
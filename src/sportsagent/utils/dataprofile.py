@@ -0,0 +1,201 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from sportsagent.config import setup_logging
+from sportsagent.utils.frameregistry import frame_fingerprint, row_hashes
+
+logger = setup_logging(__name__)
+
+
+@dataclass
+class DatasetProfile:
+    """
+    Column-level profile built from vectorized reductions. Sums, squared sums, extrema,
+    null counts and per-column unique value hashes are all mergeable, so appended rows
+    can be folded in without rescanning the original rows.
+    """
+
+    fingerprint: str
+    row_count: int
+    dtypes: dict[str, str]
+    null_counts: pd.Series
+    unique_hashes: dict[str, np.ndarray]
+    numeric_columns: list[str]
+    count: pd.Series
+    total: pd.Series
+    total_sq: pd.Series
+    minimum: pd.Series
+    maximum: pd.Series
+    row_hashes: np.ndarray = field(repr=False)
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self.dtypes)
+
+    @property
+    def unique_counts(self) -> pd.Series:
+        return pd.Series({col: len(h) for col, h in self.unique_hashes.items()}, dtype="int64")
+
+    @property
+    def missing_pct(self) -> pd.Series:
+        if self.row_count == 0:
+            return self.null_counts.astype(float)
+        return self.null_counts / self.row_count * 100
+
+    @property
+    def mean(self) -> pd.Series:
+        return self.total / self.count.replace(0, np.nan)
+
+    @property
+    def std(self) -> pd.Series:
+        n = self.count.replace({0: np.nan, 1: np.nan})
+        variance = (self.total_sq - self.total**2 / n) / (n - 1)
+        return np.sqrt(variance.clip(lower=0))
+
+    def stats_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "count": self.count,
+                "mean": self.mean,
+                "std": self.std,
+                "min": self.minimum,
+                "max": self.maximum,
+            }
+        ).T
+
+
+def _column_value_hashes(series: pd.Series) -> np.ndarray:
+    values = series.dropna()
+    try:
+        hashed = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    except TypeError:
+        hashed = pd.util.hash_pandas_object(values.astype(str), index=False).to_numpy()
+    return np.unique(hashed)
+
+
+def _partial_profile(df: pd.DataFrame, fingerprint: str, hashes: np.ndarray) -> DatasetProfile:
+    numeric_columns = [
+        c for c in df.columns if pd.api.types.is_numeric_dtype(df[c]) and df[c].dtype != bool
+    ]
+    block = df[numeric_columns].astype("float64")
+    return DatasetProfile(
+        fingerprint=fingerprint,
+        row_count=len(df),
+        dtypes={str(c): str(t) for c, t in df.dtypes.items()},
+        null_counts=df.isna().sum(),
+        unique_hashes={str(c): _column_value_hashes(df[c]) for c in df.columns},
+        numeric_columns=numeric_columns,
+        count=block.count(),
+        total=block.sum(),
+        total_sq=(block**2).sum(),
+        minimum=block.min(),
+        maximum=block.max(),
+        row_hashes=hashes,
+    )
+
+
+def build_profile(df: pd.DataFrame, fingerprint: str | None = None) -> DatasetProfile:
+    try:
+        hashes = row_hashes(df)
+        return _partial_profile(df, fingerprint or frame_fingerprint(df, hashes), hashes)
+    except Exception as e:
+        logger.error(f"Failed to profile frame shape={df.shape}: {e}")
+        raise
+
+
+def extend_profile(
+    base: DatasetProfile, appended: pd.DataFrame, fingerprint: str, hashes: np.ndarray
+) -> DatasetProfile:
+    """Fold rows appended after ``base`` into a new profile without touching old rows."""
+    try:
+        delta = _partial_profile(appended, fingerprint, hashes[base.row_count :])
+        return DatasetProfile(
+            fingerprint=fingerprint,
+            row_count=base.row_count + delta.row_count,
+            dtypes=base.dtypes,
+            null_counts=base.null_counts + delta.null_counts,
+            unique_hashes={
+                col: np.union1d(base.unique_hashes[col], delta.unique_hashes[col])
+                for col in base.unique_hashes
+            },
+            numeric_columns=base.numeric_columns,
+            count=base.count + delta.count,
+            total=base.total + delta.total,
+            total_sq=base.total_sq + delta.total_sq,
+            minimum=pd.concat([base.minimum, delta.minimum], axis=1).min(axis=1),
+            maximum=pd.concat([base.maximum, delta.maximum], axis=1).max(axis=1),
+            row_hashes=hashes,
+        )
+    except Exception as e:
+        logger.error(f"Failed to extend profile {base.fingerprint}: {e}")
+        raise
+
+
+class ProfileCache:
+    """LRU of dataset profiles keyed by frame fingerprint, with append detection."""
+
+    def __init__(self, max_entries: int = 32) -> None:
+        self.max_entries = max_entries
+        self._profiles: OrderedDict[str, DatasetProfile] = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.incremental = 0
+        self.full = 0
+
+    def get_profile(self, df: pd.DataFrame, fingerprint: str | None = None) -> DatasetProfile:
+        with self._lock:
+            if fingerprint and fingerprint in self._profiles:
+                self.hits += 1
+                self._profiles.move_to_end(fingerprint)
+                return self._profiles[fingerprint]
+
+        hashes = row_hashes(df)
+        fingerprint = fingerprint or frame_fingerprint(df, hashes)
+        with self._lock:
+            if fingerprint in self._profiles:
+                self.hits += 1
+                self._profiles.move_to_end(fingerprint)
+                return self._profiles[fingerprint]
+            base = self._find_prefix(df, hashes)
+
+        if base is not None:
+            profile = extend_profile(base, df.iloc[base.row_count :], fingerprint, hashes)
+            self.incremental += 1
+            logger.info(
+                f"Extended profile {base.fingerprint} by {len(df) - base.row_count} appended rows"
+            )
+        else:
+            profile = _partial_profile(df, fingerprint, hashes)
+            self.full += 1
+
+        with self._lock:
+            self._profiles[fingerprint] = profile
+            while len(self._profiles) > self.max_entries:
+                self._profiles.popitem(last=False)
+        return profile
+
+    def _find_prefix(self, df: pd.DataFrame, hashes: np.ndarray) -> DatasetProfile | None:
+        dtypes = {str(c): str(t) for c, t in df.dtypes.items()}
+        for profile in reversed(self._profiles.values()):
+            if (
+                0 < profile.row_count < len(df)
+                and profile.dtypes == dtypes
+                and np.array_equal(profile.row_hashes, hashes[: profile.row_count])
+            ):
+                return profile
+        return None
+
+
+_PROFILE_CACHE = ProfileCache()
+
+
+def get_profile(df: pd.DataFrame, fingerprint: str | None = None) -> DatasetProfile:
+    return _PROFILE_CACHE.get_profile(df, fingerprint)
+
+
+def get_profile_cache() -> ProfileCache:
+    return _PROFILE_CACHE
@@ -0,0 +1,88 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from sportsagent.config import settings, setup_logging
+
+logger = setup_logging(__name__)
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """Per-row uint64 hashes; unhashable cells (dicts/lists) are hashed by their repr."""
+    try:
+        return pd.util.hash_pandas_object(df, index=False).to_numpy()
+    except TypeError:
+        hashable = df.copy(deep=False)
+        for col in [c for c, t in hashable.dtypes.items() if pd.api.types.is_object_dtype(t)]:
+            hashable[col] = hashable[col].map(
+                lambda x: str(x) if isinstance(x, dict | list | set) else x
+            )
+        return pd.util.hash_pandas_object(hashable, index=False).to_numpy()
+
+
+def frame_fingerprint(df: pd.DataFrame, hashes: np.ndarray | None = None) -> str:
+    """Content fingerprint over column names, dtypes and row hashes."""
+    digest = hashlib.sha256()
+    digest.update("|".join(f"{c}:{t}" for c, t in df.dtypes.items()).encode())
+    digest.update((row_hashes(df) if hashes is None else hashes).tobytes())
+    return digest.hexdigest()[:24]
+
+
+class FrameRegistry:
+    """
+    LRU registry mapping content fingerprints to DataFrames.
+
+    Graph state carries only the handle; tools resolve it to a shallow (copy-on-write)
+    view of the registered frame, so no per-call rebuild or dict round trip is needed.
+    """
+
+    def __init__(self, max_entries: int = 32) -> None:
+        self.max_entries = max_entries
+        self._frames: OrderedDict[str, pd.DataFrame] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def register(self, df: pd.DataFrame) -> str:
+        try:
+            handle = frame_fingerprint(df)
+            with self._lock:
+                if handle not in self._frames:
+                    self._frames[handle] = df.copy(deep=False)
+                self._frames.move_to_end(handle)
+                while len(self._frames) > self.max_entries:
+                    evicted, _ = self._frames.popitem(last=False)
+                    logger.debug(f"Evicted frame {evicted} from registry")
+            return handle
+        except Exception as e:
+            logger.error(f"Failed to register frame shape={df.shape}: {e}")
+            raise
+
+    def resolve(self, handle: str) -> pd.DataFrame:
+        with self._lock:
+            if handle not in self._frames:
+                raise KeyError(f"Unknown or evicted frame handle: {handle}")
+            self._frames.move_to_end(handle)
+            return self._frames[handle].copy(deep=False)
+
+    def __contains__(self, handle: str) -> bool:
+        with self._lock:
+            return handle in self._frames
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._frames)
+
+
+_REGISTRY: FrameRegistry | None = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_frame_registry() -> FrameRegistry:
+    global _REGISTRY
+    if _REGISTRY is None:
+        with _REGISTRY_LOCK:
+            if _REGISTRY is None:
+                _REGISTRY = FrameRegistry(max_entries=int(settings.FRAME_REGISTRY_SIZE))
+    return _REGISTRY
@@ -0,0 +1,213 @@
+import math
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from sportsagent.config import setup_logging
+
+logger = setup_logging(__name__)
+
+type PromptFormat = Literal["csv", "markdown"]
+
+CHARS_PER_TOKEN = 4
+IDENTITY_COLUMNS = [
+    "player_display_name",
+    "player_name",
+    "team",
+    "position",
+    "season",
+    "week",
+    "opponent",
+    "situation",
+]
+_MAX_AGGREGATE_COLUMNS = 12
+_MAX_LISTED_OMITTED = 40
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token) used for prompt budgeting."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def select_prompt_columns(df: pd.DataFrame, priority_columns: list[str] | None = None) -> list[str]:
+    """Identity columns, then requested stats, then the remaining informative columns."""
+    informative = [c for c in df.columns if _varies(df[c])]
+    ordered = [
+        *[c for c in IDENTITY_COLUMNS if c in df.columns],
+        *[c for c in (priority_columns or []) if c in df.columns],
+        *informative,
+    ]
+    # Identity/priority columns are kept even if constant (e.g. a single season)
+    return list(dict.fromkeys(ordered))
+
+
+def _varies(series: pd.Series) -> bool:
+    values = series.dropna()
+    try:
+        return values.nunique() > 1
+    except TypeError:
+        # Nested dict/list cells from enrichment payloads
+        return values.astype(str).nunique() > 1
+
+
+def render_frame_for_prompt(
+    df: pd.DataFrame,
+    token_budget: int,
+    priority_columns: list[str] | None = None,
+    fmt: PromptFormat = "csv",
+    name: str | None = None,
+    max_rows: int | None = None,
+    decimals: int = 2,
+) -> str:
+    """
+    Render a DataFrame for an LLM prompt within ``token_budget``.
+
+    Columns are chosen by relevance (identity, requested stats, then anything that varies),
+    numbers are rounded, and column aggregates are included so the model sees the whole
+    frame's shape even when only a few rows fit. Rows are ordered by the first requested
+    stat so the most relevant ones survive truncation.
+    """
+    try:
+        header = f"{name}: " if name else ""
+        header += f"{len(df)} rows x {len(df.columns)} columns"
+        if df.empty:
+            return header
+
+        columns = select_prompt_columns(df, priority_columns)
+        sort_col = next(
+            (
+                c
+                for c in priority_columns or []
+                if c in df.columns and pd.api.types.is_numeric_dtype(df[c])
+            ),
+            None,
+        )
+        rows = df.sort_values(sort_col, ascending=False, kind="stable") if sort_col else df
+        if max_rows is not None:
+            rows = rows.head(max_rows)
+
+        aggregates = _render_aggregates(df, columns, priority_columns, decimals)
+
+        # Drop trailing columns until the header and one row fit, estimating widths from
+        # a sample row so the table is rendered only once
+        widths = _column_widths(rows, columns, fmt, decimals)
+        width = sum(widths)
+        while True:
+            omitted = [c for c in df.columns if c not in columns]
+            preamble = _preamble(header, omitted, aggregates, sort_col, fmt)
+            remaining = token_budget - estimate_tokens(preamble)
+            if len(columns) <= 1 or math.ceil(width / CHARS_PER_TOKEN) <= remaining:
+                break
+            columns = columns[:-1]
+            width -= widths[len(columns)]
+        table = _render_rows(rows, columns, fmt, decimals)
+
+        lines = table.split("\n")
+        # csv has a header line; markdown adds the |---| separator under it
+        header_lines = 1 if fmt == "csv" else 2
+        budget_chars = max(remaining, 0) * CHARS_PER_TOKEN
+        used, kept = 0, 0
+        for line in lines:
+            if used + len(line) + 1 > budget_chars and kept > header_lines:
+                break
+            used += len(line) + 1
+            kept += 1
+
+        shown_rows = max(kept - header_lines, 0)
+        body = "\n".join(lines[:kept])
+        # Compare with the whole frame: max_rows truncation is also unseen by the model
+        if shown_rows < len(df):
+            body += f"\n... {len(df) - shown_rows} more rows not shown"
+        return f"{preamble}\n{body}"
+    except Exception as e:
+        logger.error(f"Failed to render frame for prompt shape={df.shape}: {e}")
+        raise
+
+
+def _preamble(
+    header: str,
+    omitted: list[str],
+    aggregates: str,
+    sort_col: str | None,
+    fmt: PromptFormat,
+) -> str:
+    parts = [header]
+    if omitted:
+        listed = ", ".join(omitted[:_MAX_LISTED_OMITTED])
+        more = (
+            f" (+{len(omitted) - _MAX_LISTED_OMITTED} more)"
+            if len(omitted) > _MAX_LISTED_OMITTED
+            else ""
+        )
+        parts.append(f"Other columns (not shown): {listed}{more}")
+    if aggregates:
+        parts.append(f"Column aggregates:\n{aggregates}")
+    parts.append(f"Rows{f' (sorted by {sort_col} desc)' if sort_col else ''} as {fmt}:")
+    return "\n".join(parts)
+
+
+def _render_aggregates(
+    df: pd.DataFrame,
+    columns: list[str],
+    priority_columns: list[str] | None,
+    decimals: int,
+) -> str:
+    numeric = [
+        c
+        for c in dict.fromkeys([*(priority_columns or []), *columns])
+        if c in df.columns
+        and pd.api.types.is_numeric_dtype(df[c])
+        and df[c].dtype != bool
+        and c not in ("season", "week")
+    ][:_MAX_AGGREGATE_COLUMNS]
+    if not numeric or len(df) < 2:
+        return ""
+    block = df[numeric].astype("float64")
+    stats = pd.DataFrame(
+        {
+            "min": block.min(),
+            "mean": block.mean(),
+            "max": block.max(),
+            "sum": block.sum(),
+        }
+    ).round(decimals)
+    return stats.to_csv(index_label="column").strip()
+
+
+def _rounded(rows: pd.DataFrame, columns: list[str], decimals: int) -> pd.DataFrame:
+    frame = rows[columns]
+    numeric = frame.select_dtypes(include=[np.number]).columns
+    if len(numeric):
+        frame = frame.assign(**{c: frame[c].round(decimals) for c in numeric})
+    return frame
+
+
+def _column_widths(
+    rows: pd.DataFrame, columns: list[str], fmt: PromptFormat, decimals: int
+) -> list[int]:
+    """Characters each column adds to the header line plus the first row."""
+    sample = _rounded(rows.head(1), columns, decimals)
+    cells = sample.astype(object).where(sample.notna(), "").astype(str)
+    # csv adds a comma per cell on each line; markdown a " | " per cell on each line
+    separator = 2 if fmt == "csv" else 6
+    return [len(str(c)) + (len(cells[c].iloc[0]) if len(cells) else 0) + separator for c in columns]
+
+
+def _render_rows(rows: pd.DataFrame, columns: list[str], fmt: PromptFormat, decimals: int) -> str:
+    frame = _rounded(rows, columns, decimals)
+    if fmt == "csv":
+        return frame.to_csv(index=False).strip()
+
+    return markdown_table(frame)
+
+
+def markdown_table(frame: pd.DataFrame) -> str:
+    """Plain markdown table without the optional ``tabulate`` dependency."""
+    values = frame.astype(object).where(frame.notna(), "").astype(str).to_numpy()
+    lines = [
+        "| " + " | ".join(map(str, frame.columns)) + " |",
+        "|" + "|".join(["---"] * len(frame.columns)) + "|",
+    ]
+    lines.extend("| " + " | ".join(row) + " |" for row in values)
+    return "\n".join(lines)
@@ -0,0 +1,22 @@
+from langgraph.config import get_stream_writer
+from langgraph.types import StreamWriter
+
+from sportsagent.config import setup_logging
+from sportsagent.models.streamevent import StreamEvent
+
+logger = setup_logging(__name__)
+
+
+def workflow_stream_writer() -> StreamWriter | None:
+    """Writer for the enclosing workflow's custom stream, or None outside a workflow run."""
+    try:
+        return get_stream_writer()
+    except (RuntimeError, KeyError):
+        return None
+
+
+def emit_stream_event(event: StreamEvent) -> None:
+    """Push ``event`` to streaming clients of the current workflow run, if any."""
+    writer = workflow_stream_writer()
+    if writer is not None:
+        writer(event)
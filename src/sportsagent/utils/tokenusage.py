@@ -0,0 +1,62 @@
+import threading
+from typing import Any
+
+from langchain_core.messages import AIMessage
+
+from sportsagent.config import setup_logging
+
+logger = setup_logging(__name__)
+
+
+def usage_from_message(message: Any) -> dict[str, int]:
+    """Input, output and provider prompt-cache read tokens of one chat model response."""
+    usage = getattr(message, "usage_metadata", None) if isinstance(message, AIMessage) else None
+    if not usage:
+        return {"input_tokens": 0, "output_tokens": 0, "cache_read_tokens": 0}
+    details = usage.get("input_token_details") or {}
+    return {
+        "input_tokens": int(usage.get("input_tokens", 0)),
+        "output_tokens": int(usage.get("output_tokens", 0)),
+        "cache_read_tokens": int(details.get("cache_read", 0) or 0),
+    }
+
+
+class TokenUsageStats:
+    """Running token totals for one LLM call site, including prompt-cache reads."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._totals = {"calls": 0, "input_tokens": 0, "output_tokens": 0, "cache_read_tokens": 0}
+        self._lock = threading.Lock()
+
+    def record(self, message: Any) -> dict[str, int]:
+        usage = usage_from_message(message)
+        with self._lock:
+            self._totals["calls"] += 1
+            for key, value in usage.items():
+                self._totals[key] += value
+        if usage["input_tokens"]:
+            logger.info(
+                f"{self.name} tokens: input={usage['input_tokens']} "
+                f"(cached {usage['cache_read_tokens']}), output={usage['output_tokens']}"
+            )
+        return usage
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            stats: dict[str, float] = dict(self._totals)
+        stats["cache_hit_rate"] = (
+            stats["cache_read_tokens"] / stats["input_tokens"] if stats["input_tokens"] else 0.0
+        )
+        return stats
+
+
+_USAGE: dict[str, TokenUsageStats] = {}
+_USAGE_LOCK = threading.Lock()
+
+
+def get_token_usage(name: str) -> TokenUsageStats:
+    with _USAGE_LOCK:
+        if name not in _USAGE:
+            _USAGE[name] = TokenUsageStats(name)
+        return _USAGE[name]
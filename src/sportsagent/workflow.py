@@ -1,3 +1,4 @@
+from langchain_core.runnables import RunnableLambda
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
@@ -7,7 +8,8 @@ from sportsagent import routing
 from sportsagent.config import setup_logging
 from sportsagent.models.chatbotstate import ChatbotState
 from sportsagent.nodes.analyzer.analyzernode import analyzer_node
-from sportsagent.nodes.queryparser.queryparsernode import query_parser_node
+from sportsagent.nodes.fastanswer.fastanswernode import fast_answer_node
+from sportsagent.nodes.queryparser.queryparsernode import aquery_parser_node, query_parser_node
 from sportsagent.nodes.retriever.retrievernode import retriever_node
 from sportsagent.nodes.visualization.visualizationnode import (
     execute_visualization_node,
@@ -23,9 +25,11 @@ logger = setup_logging(__name__)
 NODES = {
     "entry": entry_node,
     "exit": exit_node,
-    "query_parser": query_parser_node,
+    # Sync graph runs use the blocking parser; astream/ainvoke await the native async one
+    "query_parser": RunnableLambda(query_parser_node, afunc=aquery_parser_node),
     "retriever": retriever_node,
     "AnalyzerReactAgent": analyzer_node,
+    "fast_answer": fast_answer_node,
     "generate_visualization": generate_visualization_node,
     "execute_visualization": execute_visualization_node,
     "save_report": save_report_node,
@@ -45,13 +49,23 @@ CONDITIONAL_EDGES = [
     (
         "retriever",
         routing.should_continue_after_retriever,
-        ["AnalyzerReactAgent", "exit"],
+        ["fast_answer", "AnalyzerReactAgent", "exit"],
     ),
     (
         "AnalyzerReactAgent",
         routing.should_continue_after_analyzer,
         ["generate_visualization", "save_report", "exit"],
     ),
+    (
+        "fast_answer",
+        routing.should_continue_after_fast_answer,
+        ["generate_visualization", "save_report", "exit"],
+    ),
+    (
+        "generate_visualization",
+        routing.should_continue_after_generate_visualization,
+        ["execute_visualization", "save_report"],
+    ),
 ]
 
 
@@ -70,7 +84,6 @@ def create_workflow() -> StateGraph:
         logger.info(f"Adding conditional edge from {source} to {targets}")
         workflow.add_conditional_edges(source, condition_func, targets)
 
-    workflow.add_edge("generate_visualization", "execute_visualization")
     workflow.add_edge("execute_visualization", "save_report")
     workflow.add_edge("save_report", "exit")
     workflow.add_edge("exit", END)
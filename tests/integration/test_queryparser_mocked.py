@@ -47,7 +47,7 @@ def test_query_parser_node_sets_pending_action_and_visualization_flag_for_retrie
     )
 
     with patch(
-        "sportsagent.nodes.queryparser.queryparsernode.ChatOpenAI",
+        "sportsagent.nodes.queryparser.queryparsernode.get_chat_model",
         return_value=_DummyStructuredLLM(parsed),
     ):
         state = query_parser_node(_state("Show me Josh Allen passing yards 2024 as a chart"))
@@ -70,7 +70,7 @@ def test_query_parser_node_overrides_rechart_if_it_includes_stats_query() -> Non
     )
 
     with patch(
-        "sportsagent.nodes.queryparser.queryparsernode.ChatOpenAI",
+        "sportsagent.nodes.queryparser.queryparsernode.get_chat_model",
         return_value=_DummyStructuredLLM(parsed),
     ):
         state = query_parser_node(_state("Instead show Josh Allen passing yards 2024"))
@@ -93,7 +93,7 @@ def test_query_parser_node_overrides_rechart_to_enrich_if_enrichment_present() -
     )
 
     with patch(
-        "sportsagent.nodes.queryparser.queryparsernode.ChatOpenAI",
+        "sportsagent.nodes.queryparser.queryparsernode.get_chat_model",
         return_value=_DummyStructuredLLM(parsed),
     ):
         state = query_parser_node(_state("Add snap counts and rechart"))
@@ -1,15 +1,31 @@
 import logging
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterator
 from typing import Any
 
 import pytest
 
 from sportsagent.models.chatbotstate import ChatbotState
+from sportsagent.nodes.queryparser import gazetteer, semanticcache
+from sportsagent.nodes.visualization import codecache
 from sportsagent.runner import RunResult
 
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture(autouse=True)
+def isolated_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Fresh paraphrase and visualization code caches, and a player-free gazetteer (no
+    datasource load), for every test.
+    """
+    empty = gazetteer.build_gazetteer()
+    monkeypatch.setattr(gazetteer, "_GAZETTEER", empty)
+    monkeypatch.setattr(
+        semanticcache, "_SEMANTIC_CACHE", semanticcache.SemanticCache(gazetteer=empty)
+    )
+    monkeypatch.setattr(codecache, "_VIZ_CODE_CACHE", codecache.VizCodeCache())
+
+
 @pytest.fixture
 def make_chat_state() -> Callable[..., ChatbotState]:
     def _make_chat_state(
@@ -74,10 +90,37 @@ def fake_runner_factory(
                 self.run_calls.append((user_query, conversation_history, retrieved_data))
                 return self._next_response()
 
+            async def arun(
+                self,
+                user_query: str,
+                conversation_history: list[dict[str, Any]] | None = None,
+                retrieved_data: Any | None = None,
+            ) -> RunResult:
+                return self.run(user_query, conversation_history, retrieved_data)
+
             def resume_with_approval(self, decision: str) -> RunResult:
                 self.resume_calls.append(decision)
                 return self._next_response()
 
+            def stream(
+                self,
+                user_query: str,
+                conversation_history: list[dict[str, Any]] | None = None,
+                retrieved_data: Any | None = None,
+            ) -> Iterator[RunResult]:
+                yield self.run(user_query, conversation_history, retrieved_data)
+
+            async def astream(
+                self,
+                user_query: str,
+                conversation_history: list[dict[str, Any]] | None = None,
+                retrieved_data: Any | None = None,
+            ) -> AsyncIterator[RunResult]:
+                yield self.run(user_query, conversation_history, retrieved_data)
+
+            def stream_approval(self, decision: str) -> Iterator[RunResult]:
+                yield self.resume_with_approval(decision)
+
         return FakeRunner
 
     return _factory
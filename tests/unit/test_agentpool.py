@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sportsagent.agents.baseagent import clear_graph_pool, pool_stats
+from sportsagent.nodes.analyzer.analyzeragent import AnalyzerAgent
+
+
+@pytest.fixture(autouse=True)
+def _empty_pool():
+    clear_graph_pool()
+    yield
+    clear_graph_pool()
+
+
+@patch("sportsagent.agents.baseagent.get_chat_model")
+@patch("sportsagent.agents.baseagent.create_agent")
+def test_analyzer_agents_share_compiled_graph(mock_create_agent, mock_get_chat_model):
+    mock_create_agent.return_value.with_config.side_effect = lambda _: MagicMock()
+
+    first = AnalyzerAgent()
+    second = AnalyzerAgent()
+
+    assert first._compiled_graph is second._compiled_graph
+    mock_create_agent.assert_called_once()
+    stats = pool_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+
+@patch("sportsagent.agents.baseagent.get_chat_model")
+@patch("sportsagent.agents.baseagent.create_agent")
+def test_graph_pool_keys_on_settings(mock_create_agent, mock_get_chat_model):
+    mock_create_agent.return_value.with_config.side_effect = lambda _: MagicMock()
+
+    default = AnalyzerAgent()
+    shallow = AnalyzerAgent(recursion_limit=5)
+    with patch("sportsagent.agents.baseagent.settings.LLM_MODEL", "openai:other-model"):
+        other_model = AnalyzerAgent()
+
+    assert default._compiled_graph is not shallow._compiled_graph
+    assert other_model._compiled_graph is not default._compiled_graph
+    assert mock_create_agent.call_count == 3
+    assert mock_get_chat_model.call_args_list[-1].args == ("openai:other-model",)
@@ -97,3 +97,30 @@ def test_analyzer_node_handles_missing_structured_output(mock_agent_cls):
 
     assert state.analyzer_output is None
     assert state.generated_response == "Analysis complete."
+
+
+@patch("sportsagent.nodes.analyzer.analyzernode.AnalyzerAgent")
+def test_analyzer_node_persists_tool_memo(mock_agent_cls):
+    mock_agent = MagicMock()
+    mock_agent.get_tool_calls.return_value = []
+    mock_agent.get_ai_message.return_value = "Done."
+    mock_agent.response = None
+
+    def fake_invoke(**kwargs):
+        kwargs["tool_memo"].pop("stale", None)
+        kwargs["tool_memo"]["frame:describe_dataset:abc"] = "summary"
+
+    mock_agent.invoke_agent.side_effect = fake_invoke
+    mock_agent_cls.return_value = mock_agent
+
+    state = ChatbotState(
+        session_id="test",
+        user_query="analyze this",
+        retrieved_data=RetrievedData(players=[{"name": "P1", "yards": 100}]),
+        generated_response="",
+        tool_memo={"stale": "old"},
+    )
+
+    analyzer_node(state)
+
+    assert state.tool_memo == {"frame:describe_dataset:abc": "summary"}
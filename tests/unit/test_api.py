@@ -5,6 +5,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from sportsagent import api
+from sportsagent.models.streamevent import StreamEvent
 from sportsagent.runner import RunResult
 
 logger = logging.getLogger(__name__)
@@ -77,3 +78,35 @@ def test_approve_resumes_runner(
     # Check the runner instance created by the API endpoint (not the manually created one)
     api_runner = FakeRunner.instances[-1]  # The API should have created the last instance
     assert api_runner.resume_calls == ["approved"]
+
+
+def test_chat_stream_emits_tokens_then_result(
+    monkeypatch: pytest.MonkeyPatch,
+    client: TestClient,
+    fake_runner_factory: Callable[[list[RunResult]], type],
+    make_run_result: Callable[..., RunResult],
+) -> None:
+    run_result = make_run_result()
+    BaseRunner = fake_runner_factory([run_result])
+
+    class StreamingRunner(BaseRunner):
+        async def astream(self, user_query, conversation_history=None, retrieved_data=None):
+            yield StreamEvent(kind="token", content="Hel", node="analyzer")
+            yield StreamEvent(kind="token", content="lo", node="analyzer")
+            async for item in super().astream(user_query, conversation_history, retrieved_data):
+                yield item
+
+    monkeypatch.setattr(api, "WorkflowRunner", StreamingRunner)
+
+    response = client.post("/chat/stream", json={"user_query": "hello"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block for block in response.text.split("\n\n") if block]
+    assert [e.split("\n")[0] for e in events] == [
+        "event: token",
+        "event: token",
+        "event: result",
+    ]
+    assert '"content":"Hel"' in events[0]
+    assert f'"generated_response":"{run_result.state.generated_response}"' in events[2]
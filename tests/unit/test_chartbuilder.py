@@ -0,0 +1,81 @@
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from sportsagent.models.chatbotstate import ChatbotState
+from sportsagent.models.parsedquery import ChartSpec, ParsedQuery
+from sportsagent.nodes.visualization.chartbuilder import build_chart, native_chart_supported
+from sportsagent.nodes.visualization.visualizationnode import (
+    execute_visualization_node,
+    generate_visualization_node,
+)
+
+TEAM_COLORS = {"KC": ["#E31837", "#FFB612"], "BUF": ["#00338D", "#C60C30"]}
+WEEKLY = pd.DataFrame(
+    {
+        "player_name": ["P. Mahomes", "J. Allen", "P. Mahomes", "J. Allen"],
+        "team": ["KC", "BUF", "KC", "BUF"],
+        "week": [2, 1, 1, 2],
+        "passing_yards": [250, 300, 320, 180],
+        "passing_tds": [2, 3, 1, 1],
+    }
+)
+
+
+def test_bar_aggregates_sorts_and_uses_team_colors():
+    spec = ChartSpec(chart_type="bar", x_axis="team", y_axis="passing_yards", aggregation="sum")
+
+    fig = build_chart(WEEKLY, spec, team_colors=TEAM_COLORS)
+
+    assert [(t.name, list(t.y)) for t in fig.data] == [("KC", [570]), ("BUF", [480])]
+    assert [t.marker.color for t in fig.data] == ["#E31837", "#00338D"]
+    assert list(fig.layout.xaxis.categoryarray) == ["KC", "BUF"]
+
+
+def test_line_sorts_by_x_and_scatter_labels_points():
+    line = build_chart(
+        WEEKLY,
+        ChartSpec(chart_type="line", x_axis="week", y_axis="passing_yards", group_by="team"),
+        team_colors=TEAM_COLORS,
+    )
+    scatter = build_chart(
+        WEEKLY, ChartSpec(chart_type="scatter", x_axis="passing_yards", y_axis="passing_tds")
+    )
+
+    assert {t.name: list(t.x) for t in line.data} == {"KC": [1, 2], "BUF": [1, 2]}
+    assert list(scatter.data[0].text) == WEEKLY["player_name"].tolist()
+
+
+def test_free_form_or_unresolvable_specs_use_generated_code():
+    spec = ChartSpec(chart_type="bar", x_axis="player_name", y_axis="passing_yards")
+
+    assert native_chart_supported(spec, WEEKLY, "bar chart of passing yards")
+    assert not native_chart_supported(spec, WEEKLY, "games with over 300 passing yards")
+    assert not native_chart_supported(spec.model_copy(update={"chart_type": None}), WEEKLY, "")
+    assert not native_chart_supported(
+        spec.model_copy(update={"y_axis": "rushing_yards"}), WEEKLY, "bar chart"
+    )
+
+
+@patch("sportsagent.nodes.visualization.visualizationnode.get_datasource")
+@patch("sportsagent.nodes.visualization.visualizationnode.get_chat_model")
+def test_node_builds_specified_chart_without_the_llm(mock_get_chat_model, mock_get_datasource):
+    mock_get_datasource.return_value = MagicMock(TEAM_COLORS=TEAM_COLORS, TEAM_LOGO_PATHS={})
+    state = ChatbotState(
+        session_id="s",
+        user_query="bar chart of passing yards by team",
+        generated_response="",
+        needs_visualization=True,
+        retrieved_data={"players": WEEKLY.to_dict("records")},
+        parsed_query=ParsedQuery(
+            chart_spec=ChartSpec(
+                chart_type="bar", x_axis="team", y_axis="passing_yard", aggregation="sum"
+            )
+        ),
+    )
+
+    state = execute_visualization_node(generate_visualization_node(state))
+
+    mock_get_chat_model.assert_not_called()
+    assert state.visualization_code is None
+    assert [t["name"] for t in state.visualization["data"]] == ["KC", "BUF"]
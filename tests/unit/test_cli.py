@@ -5,6 +5,7 @@ from collections.abc import Callable
 import pytest
 
 from sportsagent import cli
+from sportsagent.models.streamevent import StreamEvent
 from sportsagent.runner import RunResult
 
 logger = logging.getLogger(__name__)
@@ -74,3 +75,19 @@ def test_run_chat_handles_approval(
     runner = FakeRunner.instances[-1]
     assert runner.resume_calls == ["approved"]
     assert runner.run_calls[0][0] == "question"
+
+
+def test_consume_stream_prints_tokens_incrementally(
+    capsys: pytest.CaptureFixture[str],
+    make_run_result: Callable[..., RunResult],
+) -> None:
+    result = make_run_result()
+    items = [
+        StreamEvent(kind="status", content="retriever", node="retriever"),
+        StreamEvent(kind="token", content="Joe Burrow ", node="analyzer"),
+        StreamEvent(kind="token", content="led the league.", node="analyzer"),
+        result,
+    ]
+
+    assert cli._consume_stream(items) is result
+    assert capsys.readouterr().out == "Assistant: Joe Burrow led the league.\n"
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sportsagent.tools.dataframe import compute_comparisons
+
+
+def _season_rows() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "player_id": ["QB1", "QB1", "QB2", "QB2", "QB3"],
+            "player_name": ["Mahomes", "Mahomes", "Allen", "Allen", "Burrow"],
+            "season": [2023, 2024, 2023, 2024, 2024],
+            "passing_yards": [4183, 3928, 4306, 4306, 4918],
+            "passing_interceptions": [14, 11, 18, 6, 9],
+            "rushing_epa": [np.nan, np.nan, np.nan, np.nan, 1.5],
+            "sacks_suffered": [0, 0, 0, 0, 0],
+        }
+    )
+
+
+def test_compute_comparisons_finds_leaders_and_trailers_per_stat():
+    metrics = compute_comparisons(_season_rows())
+    by_stat = {c.stat: c for c in metrics.comparisons}
+
+    assert metrics.player_count == 5
+    # Fewer than two values, or no positive max: not comparable
+    assert set(by_stat) == {"passing_yards", "passing_interceptions"}
+    assert by_stat["passing_yards"].leader == "Burrow"
+    assert by_stat["passing_yards"].trailing == "Mahomes"
+    assert by_stat["passing_interceptions"].percent_difference == pytest.approx(100 * 12 / 18)
+    assert [c.stat for c in metrics.comparisons] == ["passing_interceptions", "passing_yards"]
+
+
+def test_compute_comparisons_groups_multi_season_rows_by_player():
+    metrics = compute_comparisons(_season_rows(), group_by="player")
+    yards = next(c for c in metrics.comparisons if c.stat == "passing_yards")
+
+    assert metrics.player_count == 3
+    assert (yards.leader, yards.max_value) == ("Allen", 8612)
+    assert (yards.trailing, yards.min_value) == ("Burrow", 4918)
+
+
+def test_compute_comparisons_requires_two_rows():
+    assert compute_comparisons(_season_rows().head(1)) is None
@@ -0,0 +1,56 @@
+from sportsagent.models.chatbotstate import ChatbotState
+from sportsagent.models.conversationmemory import ConversationMemory
+from sportsagent.models.parsedquery import ParsedQuery, PlayerStatsQuery
+from sportsagent.nodes.queryparser.queryparsernode import (
+    _build_context_prompt,
+    _conversation_context,
+)
+from sportsagent.nodes.workflow.exitnode import exit_node
+
+
+def _turn(state: ChatbotState, i: int) -> ChatbotState:
+    state.user_query = f"How many passing yards did Player {i} have this season?"
+    state.generated_response = f"Player {i} threw for {3000 + i} yards. " * 40
+    state.parsed_query = ParsedQuery(
+        player_stats_query=PlayerStatsQuery(players=[f"Player {i}"], statistics=["passing_yards"])
+    )
+    return exit_node(state)
+
+
+def test_context_stays_bounded_over_a_long_session():
+    state = ChatbotState(session_id="s", user_query="", generated_response="")
+    sizes = []
+    for i in range(60):
+        state = _turn(state, i)
+        sizes.append(len(_build_context_prompt(_conversation_context(state))))
+
+    memory = state.conversation_memory
+    assert len(state.conversation_history) == 20
+    assert (len(memory.recent_turns), len(memory.summary), len(memory.players)) == (3, 6, 8)
+    assert memory.players[0] == "Player 59" and memory.older_turns == 57
+    assert memory.stats == ["passing_yards"]
+    assert max(sizes[20:]) - min(sizes[20:]) < 10
+    assert all(len(t["response"]) <= 300 for t in memory.recent_turns)
+
+
+def test_context_is_rebuilt_from_history_passed_without_memory():
+    history = [
+        {"content": f"q{i}", "response": "a", "mentioned_players": [f"P{i}"]} for i in range(5)
+    ]
+    state = ChatbotState(
+        session_id="s", user_query="and him?", generated_response="", conversation_history=history
+    )
+
+    context = _conversation_context(state)
+
+    assert context == ConversationMemory.from_history(history).to_context()
+    assert context["recent_players"][0] == "P4"
+    assert context["messages"] == [
+        "User: q2",
+        "Assistant: a",
+        "User: q3",
+        "Assistant: a",
+        "User: q4",
+        "Assistant: a",
+    ]
+    assert context["summary"].startswith("2 earlier turns")
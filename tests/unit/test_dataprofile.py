@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sportsagent.tools.dataframe import get_dataframe_summary
+from sportsagent.utils.dataprofile import ProfileCache, build_profile
+
+
+def _weekly(weeks: range) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    n = len(weeks) * 2
+    return pd.DataFrame(
+        {
+            "player_name": ["Mahomes", "Allen"] * len(weeks),
+            "week": np.repeat(list(weeks), 2),
+            "passing_yards": rng.integers(150, 400, n).astype(float),
+            "passing_epa": rng.normal(0, 5, n),
+            "meta": [{"src": "nfl"}] * n,
+        }
+    )
+
+
+def test_profile_matches_pandas_reductions():
+    df = _weekly(range(1, 9))
+    df.loc[3, "passing_epa"] = np.nan
+
+    profile = build_profile(df)
+
+    assert profile.row_count == len(df)
+    assert profile.null_counts["passing_epa"] == 1
+    assert profile.unique_counts.to_dict() == {
+        "player_name": 2,
+        "week": 8,
+        "passing_yards": df["passing_yards"].nunique(),
+        "passing_epa": df["passing_epa"].nunique(),
+        "meta": 1,
+    }
+    pd.testing.assert_series_equal(
+        profile.std, df[profile.numeric_columns].std(), check_names=False
+    )
+    assert profile.maximum["passing_yards"] == df["passing_yards"].max()
+
+
+def test_appended_rows_update_profile_incrementally():
+    cache = ProfileCache()
+    early = _weekly(range(1, 6))
+    full = pd.concat([early, _weekly(range(6, 9))], ignore_index=True)
+
+    cache.get_profile(early)
+    incremental = cache.get_profile(full)
+    again = cache.get_profile(full, fingerprint=incremental.fingerprint)
+    rebuilt = build_profile(full)
+
+    assert (cache.full, cache.incremental, cache.hits) == (1, 1, 1)
+    assert again is incremental
+    assert incremental.fingerprint == rebuilt.fingerprint
+    assert incremental.unique_counts.equals(rebuilt.unique_counts)
+    for stat in ("count", "total", "minimum", "maximum"):
+        pd.testing.assert_series_equal(getattr(incremental, stat), getattr(rebuilt, stat))
+    assert incremental.mean["passing_epa"] == pytest.approx(rebuilt.mean["passing_epa"])
+
+
+def test_summary_renders_from_profile():
+    summary = get_dataframe_summary(_weekly(range(1, 4)), n_sample=2)[0]
+
+    assert "Shape: 6 rows x 5 columns" in summary
+    assert "passing_yards: 0.00%" in summary
+    assert "meta: 6 non-null object" in summary
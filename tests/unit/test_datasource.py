@@ -1,6 +1,9 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pandas as pd
+import pytest
+
 from sportsagent.datasource import get_datasource
 
 
@@ -142,3 +145,288 @@ def test_nflreadpy_caching_disabled(mock_settings, mock_update_config):
     mock_update_config.assert_not_called()
 
     assert ds.settings is mock_settings_instance
+
+
+def _weekly_player_stats() -> pd.DataFrame:
+    rows = []
+    for season in (2023, 2024):
+        for week in range(18, 0, -1):
+            for player_id, name in (("00-1", "Travis Kelce"), ("00-2", "Josh Allen")):
+                rows.append(
+                    {
+                        "player_id": player_id,
+                        "player_display_name": name,
+                        "position": "TE" if player_id == "00-1" else "QB",
+                        "season": season,
+                        "week": week,
+                        "receiving_yards": season - 2000 + week,
+                    }
+                )
+    return pd.DataFrame(rows)
+
+
+def _offline_datasource(mock_settings, mock_nfl):
+    from sportsagent.datasource.nflreadpy import NFLReadPyDataSource
+
+    mock_settings_instance = MagicMock()
+    mock_settings_instance.NFLREADPY_CACHE_MODE = "off"
+    mock_settings_instance.DATASOURCE_FRAME_CACHE_SIZE = 8
+    mock_settings.return_value = mock_settings_instance
+    mock_nfl.load_teams.side_effect = RuntimeError("offline")
+    return NFLReadPyDataSource()
+
+
+@patch("sportsagent.datasource.nflreadpy.Settings")
+@patch("sportsagent.datasource.nflreadpy.nfl")
+def test_get_player_stats_week_range_pushdown(mock_nfl, mock_settings):
+    mock_nfl.load_player_stats.return_value.to_pandas.return_value = _weekly_player_stats()
+    ds = _offline_datasource(mock_settings, mock_nfl)
+
+    df = ds.get_player_stats(seasons=[2024], players=["Travis Kelce"], start_week=10, end_week=14)
+
+    assert list(df["week"]) == [10, 11, 12, 13, 14]
+    assert set(df["season"]) == {2024}
+    mock_nfl.load_player_stats.assert_called_once_with(seasons=[2024], summary_level="week")
+
+    ds.get_player_stats(seasons=[2024], players=["Josh Allen"], start_week=1, end_week=2)
+    assert mock_nfl.load_player_stats.call_count == 1
+
+
+@patch("sportsagent.datasource.nflreadpy.Settings")
+@patch("sportsagent.datasource.nflreadpy.nfl")
+def test_get_player_stats_last_n_games_across_seasons(mock_nfl, mock_settings):
+    mock_nfl.load_player_stats.return_value.to_pandas.return_value = _weekly_player_stats()
+    ds = _offline_datasource(mock_settings, mock_nfl)
+
+    df = ds.get_player_stats(seasons=[2023, 2024], last_n_games=3)
+
+    assert len(df) == 6
+    kelce = df[df["player_id"] == "00-1"]
+    assert list(zip(kelce["season"], kelce["week"], strict=True)) == [
+        (2024, 16),
+        (2024, 17),
+        (2024, 18),
+    ]
+
+
+@patch("sportsagent.datasource.nflreadpy.Settings")
+@patch("sportsagent.datasource.nflreadpy.nfl")
+def test_get_player_stats_date_window_uses_schedule_weeks(mock_nfl, mock_settings):
+    from datetime import date
+
+    mock_nfl.load_player_stats.return_value.to_pandas.return_value = _weekly_player_stats()
+    mock_nfl.load_schedules.return_value.to_pandas.return_value = pd.DataFrame(
+        {
+            "season": [2024, 2024, 2024, 2024],
+            "week": [9, 10, 11, 12],
+            "gameday": ["2024-10-31", "2024-11-07", "2024-11-14", "2024-11-21"],
+        }
+    )
+    ds = _offline_datasource(mock_settings, mock_nfl)
+
+    df = ds.get_player_stats(
+        seasons=[2024],
+        players=["Travis Kelce"],
+        start_date=date(2024, 11, 1),
+        end_date=date(2024, 11, 15),
+    )
+
+    assert list(df["week"]) == [10, 11]
+
+
+def test_time_period_game_window_forces_weekly_rows():
+    from datetime import date
+
+    from sportsagent.models.parsedquery import TimePeriod
+
+    tp = TimePeriod(seasons=[2024], start_week=14, end_week=10)
+    assert tp.summary_level == "week"
+    assert (tp.start_week, tp.end_week) == (10, 14)
+    assert tp.label == "2024_wk10-14"
+
+    dated = TimePeriod(start_date=date(2025, 1, 5), end_date=date(2024, 12, 1))
+    assert dated.seasons == [2024]
+    assert dated.game_window()["start_date"] == date(2024, 12, 1)
+
+
+@patch("sportsagent.datasource.nflreadpy.Settings")
+@patch("sportsagent.datasource.nflreadpy.nfl")
+def test_get_pbp_reads_projected_columns_with_participation(mock_nfl, mock_settings, tmp_path):
+    import polars as pl
+
+    mock_nfl.load_pbp.return_value = pl.DataFrame(
+        {
+            "game_id": ["2024_01_KC_BAL"] * 3,
+            "play_id": [1, 2, 3],
+            "season": [2024] * 3,
+            "week": [1] * 3,
+            "posteam": ["KC", "BAL", "KC"],
+            "defteam": ["BAL", "KC", "BAL"],
+            "epa": [0.5, -0.1, 1.2],
+            "desc": ["a", "b", "c"],
+        }
+    )
+    mock_nfl.load_participation.return_value = pl.DataFrame(
+        {
+            "nflverse_game_id": ["2024_01_KC_BAL"] * 2,
+            "play_id": [1, 3],
+            "possession_team": ["KC", "KC"],
+            "was_pressure": [True, False],
+        }
+    )
+    ds = _offline_datasource(mock_settings, mock_nfl)
+    ds.pbp_store.root = tmp_path
+
+    df = ds.get_pbp(
+        seasons=[2024],
+        columns=["epa"],
+        teams=["kc"],
+        filters={"posteam": "KC"},
+        include_participation=True,
+    )
+
+    assert "desc" not in df.columns
+    assert sorted(df["play_id"]) == [1, 3]
+    assert df.sort_values("play_id")["was_pressure"].tolist() == [True, False]
+    assert len(ds.get_pbp(seasons=[2024], teams=["KC"])) == 3
+    mock_nfl.load_pbp.assert_called_once()
+
+
+@patch("sportsagent.datasource.nflreadpy.Settings")
+@patch("sportsagent.datasource.nflreadpy.nfl")
+def test_get_situational_splits_cached_per_season_and_situation_set(mock_nfl, mock_settings):
+    ds = _offline_datasource(mock_settings, mock_nfl)
+    pbp = pd.DataFrame(
+        {
+            "posteam": ["KC", "KC"],
+            "down": [3, 1],
+            "ydstogo": [4, 10],
+            "yardline_100": [12, 70],
+            "half_seconds_remaining": [600, 600],
+            "pass": [1, 1],
+            "epa": [0.5, -0.2],
+            "passer_player_id": ["QB1", "QB1"],
+            "passer_player_name": ["P.One", "P.One"],
+        }
+    )
+
+    with patch.object(ds, "get_pbp", return_value=pbp) as mock_get_pbp:
+        first = ds.get_situational_splits(seasons=[2024], situations="red_zone,third_down")
+        again = ds.get_situational_splits(
+            seasons=[2024], situations=["third_down", "red zone"], player_ids=["QB1"]
+        )
+
+    mock_get_pbp.assert_called_once()
+    assert set(first["situation"]) == {"all", "red_zone", "third_down"}
+    assert (again["season"] == 2024).all()
+    assert again.set_index("situation").loc["red_zone", "plays"] == 1
+
+
+@patch("sportsagent.datasource.nflreadpy.Settings")
+@patch("sportsagent.datasource.nflreadpy.nfl")
+def test_join_nextgen_stats_uses_prebuilt_index(mock_nfl, mock_settings):
+    import polars as pl
+
+    mock_nfl.load_nextgen_stats.return_value = pl.DataFrame(
+        {
+            "season": [2024, 2024, 2024],
+            "season_type": ["REG", "REG", "REG"],
+            "week": [0, 1, 2],
+            "player_display_name": ["Patrick Mahomes"] * 3,
+            "player_position": ["QB"] * 3,
+            "team_abbr": ["KC"] * 3,
+            "avg_time_to_throw": [2.7, 2.5, 2.9],
+            "attempts": [581, 28, 37],
+            "player_gsis_id": ["00-0033873"] * 3,
+            "some_unlisted_column": [1, 2, 3],
+        }
+    )
+    ds = _offline_datasource(mock_settings, mock_nfl)
+
+    ngs = ds.get_nextgen_stats("passing", seasons=[2024])
+    weekly = pd.DataFrame(
+        {
+            "player_id": ["00-0033873", "00-0033873", "00-0000000"],
+            "season": [2024, 2024, 2024],
+            "week": [2, 1, 1],
+            "attempts": [37, 28, 10],
+        }
+    )
+    joined = ds.join_nextgen_stats(weekly, "passing")
+    season = ds.join_nextgen_stats(
+        pd.DataFrame({"player_id": ["00-0033873"], "season": [2024]}), "passing"
+    )
+
+    assert "some_unlisted_column" not in ngs.columns
+    assert ngs["team_abbr"].dtype == "category"
+    assert joined["avg_time_to_throw"].round(2).tolist()[:2] == [2.9, 2.5]
+    assert pd.isna(joined.loc[2, "avg_time_to_throw"])
+    assert joined["ngs_attempts"].tolist()[:2] == [37, 28]
+    assert season.loc[0, "avg_time_to_throw"] == pytest.approx(2.7)
+    assert list(ds.join_nextgen_stats(joined, "passing").columns) == list(joined.columns)
+    mock_nfl.load_nextgen_stats.assert_called_once()
+
+
+@patch("sportsagent.datasource.nflreadpy.Settings")
+@patch("sportsagent.datasource.nflreadpy.nfl")
+def test_league_context_builds_distributions_once_per_season(mock_nfl, mock_settings):
+    mock_nfl.load_player_stats.return_value.to_pandas.return_value = pd.DataFrame(
+        {
+            "player_display_name": ["A", "B", "C", "D"],
+            "position": ["QB", "QB", "QB", "QB"],
+            "season": [2024] * 4,
+            "passing_yards": [1000, 2000, 3000, 4000],
+        }
+    )
+    ds = _offline_datasource(mock_settings, mock_nfl)
+    players = pd.DataFrame({"position": ["QB"], "season": [2024], "passing_yards": [3000]})
+
+    first = ds.get_league_context(players, stats=["passing_yards"])
+    second = ds.get_league_context(players)
+
+    assert first.loc[0, "passing_yards_pctl"] == pytest.approx(75.0)
+    assert second.loc[0, "passing_yards_pctl"] == pytest.approx(75.0)
+    mock_nfl.load_player_stats.assert_called_once_with(seasons=[2024], summary_level="reg")
+
+
+@patch("sportsagent.datasource.nflreadpy.time")
+@patch("sportsagent.datasource.nflreadpy.Settings")
+@patch("sportsagent.datasource.nflreadpy.nfl")
+def test_similar_players_rebuilds_only_the_live_season(mock_nfl, mock_settings, mock_time):
+    from sportsagent.constants import CURRENT_SEASON
+
+    def season_totals(seasons, summary_level):
+        season = seasons[0]
+        frame = pd.DataFrame(
+            {
+                "player_id": ["a", "b", "c", "d"],
+                "player_display_name": ["Alpha", "Bravo", "Charlie", "Delta"],
+                "position": "RB",
+                "season": season,
+                "games": 17,
+                "carries": [300, 280, 120, 100],
+                "rushing_yards": [1500, 1400, 500, 450],
+            }
+        )
+        result = MagicMock()
+        result.to_pandas.return_value = frame
+        return result
+
+    mock_nfl.load_player_stats.side_effect = season_totals
+    mock_time.time.return_value = 0.0
+    ds = _offline_datasource(mock_settings, mock_nfl)
+    ds.settings.SIMILARITY_REFRESH_HOURS = 1.0
+    seasons = [CURRENT_SEASON - 1, CURRENT_SEASON]
+
+    similar = ds.get_similar_players("alpha", CURRENT_SEASON, k=2, seasons=seasons)
+    ds.get_similar_players("alpha", CURRENT_SEASON, k=2, seasons=seasons)
+    assert mock_nfl.load_player_stats.call_count == 2
+
+    mock_time.time.return_value = 7200.0
+    ds.get_similar_players("alpha", CURRENT_SEASON, k=2, seasons=seasons)
+
+    assert list(similar["player_display_name"]) == ["Bravo", "Bravo"]
+    assert similar["similarity"].iloc[0] == pytest.approx(1.0, abs=1e-3)
+    assert mock_nfl.load_player_stats.call_count == 3
+    assert mock_nfl.load_player_stats.call_args.kwargs["seasons"] == [CURRENT_SEASON]
+    assert ds.get_similar_players("Nobody", CURRENT_SEASON, seasons=seasons).empty
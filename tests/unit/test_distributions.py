@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sportsagent.datasource.distributions import StatDistributions, league_context
+
+
+def _season_totals() -> pd.DataFrame:
+    qbs = pd.DataFrame(
+        {
+            "player_display_name": [f"QB {i}" for i in range(10)],
+            "position": "QB",
+            "season": 2024,
+            "games": 17,
+            "passing_epa": np.arange(10, dtype=float) * 10,
+        }
+    )
+    rbs = pd.DataFrame(
+        {
+            "player_display_name": [f"RB {i}" for i in range(4)],
+            "position": "RB",
+            "season": 2024,
+            "games": 16,
+            "passing_epa": [0.0, 0.0, 1.0, 2.0],
+        }
+    )
+    backup = pd.DataFrame(
+        {
+            "player_display_name": ["Backup QB"],
+            "position": "QB",
+            "season": 2024,
+            "games": 1,
+            "passing_epa": [-500.0],
+        }
+    )
+    return pd.concat([qbs, rbs, backup], ignore_index=True)
+
+
+def test_distributions_exclude_low_volume_players():
+    dist = StatDistributions(_season_totals(), 2024)
+
+    assert dist.pool_size("passing_epa", "QB") == 10
+    assert dist.pool_size("passing_epa") == 14
+    assert "games" not in dist.stats
+
+
+def test_league_context_ranks_against_position_and_season():
+    dist = StatDistributions(_season_totals(), 2024)
+    players = pd.DataFrame(
+        {
+            "player_display_name": ["Josh Allen", "Rookie", "Fullback", "Other Year"],
+            "position": ["QB", "QB", "FB", "QB"],
+            "season": [2024, 2024, 2024, 2023],
+            "passing_epa": [85.0, np.nan, 2.0, 50.0],
+        }
+    )
+
+    context = league_context(players, {2024: dist}, stats=["passing_epa"])
+
+    qb_values = np.arange(10) * 10.0
+    assert context.loc[0, "passing_epa_pctl"] == pytest.approx(90.0)
+    assert context.loc[0, "passing_epa_z"] == pytest.approx(
+        (85 - qb_values.mean()) / qb_values.std(ddof=1)
+    )
+    assert pd.isna(context.loc[1, "passing_epa_pctl"])
+    # Unknown positions fall back to the league-wide pool
+    assert context.loc[2, "passing_epa_pctl"] == pytest.approx(5 / 14 * 100)
+    # Seasons without a distribution are left unranked
+    assert pd.isna(context.loc[3, "passing_epa_pctl"])
+    assert list(context.columns[:3]) == ["player_display_name", "position", "season"]
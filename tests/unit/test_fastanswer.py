@@ -0,0 +1,124 @@
+from sportsagent import routing
+from sportsagent.models.chatbotstate import ChatbotState
+from sportsagent.models.parsedquery import (
+    ParsedQuery,
+    PlayerStatsQuery,
+    QueryFilters,
+    TeamStatsQuery,
+    TimePeriod,
+)
+from sportsagent.models.retrieveddata import RetrievedData
+from sportsagent.nodes.fastanswer.fastanswernode import fast_answer_node, plan_fast_answer
+
+QB_ROWS = [
+    {"player_display_name": "Joe Burrow", "team": "CIN", "season": 2024, "passing_yards": 4918},
+    {"player_display_name": "Jared Goff", "team": "DET", "season": 2024, "passing_yards": 4629},
+    {"player_display_name": "Baker Mayfield", "team": "TB", "season": 2024, "passing_yards": 4500},
+    {"player_display_name": "Patrick Mahomes", "team": "KC", "season": 2024, "passing_yards": 3928},
+]
+
+
+def _state(query: str, psq: PlayerStatsQuery, rows=None, **kwargs) -> ChatbotState:
+    return ChatbotState(
+        session_id="test",
+        user_query=query,
+        parsed_query=ParsedQuery(player_stats_query=psq, parse_status="parsed", **kwargs),
+        retrieved_data=RetrievedData(players=rows if rows is not None else QB_ROWS),
+        generated_response="",
+    )
+
+
+def _ranking_query(**kwargs) -> PlayerStatsQuery:
+    fields = {"position": "QB", "statistics": ["passing_yards"], "tp": TimePeriod(seasons=[2024])}
+    return PlayerStatsQuery(**(fields | kwargs))
+
+
+def test_ranking_query_is_answered_without_llm():
+    state = _state("top 3 QBs by passing yards 2024", _ranking_query(limit=3))
+
+    assert routing.should_continue_after_retriever(state) == "fast_answer"
+    result = fast_answer_node(state)
+
+    assert result.error is None
+    assert result.generated_response.startswith(
+        "**Joe Burrow** (CIN) leads all QBs in passing yards for 2024 with 4,918."
+    )
+    assert "3. Baker Mayfield (TB): 4,500 passing yards" in result.generated_response
+    assert "Patrick Mahomes" not in result.generated_response
+    assert result.analyzer_output.judgment == result.generated_response
+    assert "| player_display_name | team | season | passing_yards |" in (
+        result.analyzer_output.analysis
+    )
+    assert routing.should_continue_after_fast_answer(result) == "save_report"
+
+
+def test_ascending_ranking():
+    state = _state("fewest passing yards", _ranking_query(limit=1, sort_order="asc"))
+
+    result = fast_answer_node(state)
+
+    assert result.generated_response.startswith("**Patrick Mahomes** (KC) has the fewest")
+
+
+def test_player_lookup_matches_partial_names():
+    psq = PlayerStatsQuery(
+        players=["Mahomes"], statistics=["passing_yards"], tp=TimePeriod(seasons=[2024])
+    )
+    state = _state("Mahomes passing yards 2024", psq)
+
+    result = fast_answer_node(state)
+
+    assert result.generated_response == "**Patrick Mahomes** (KC), 2024: 3,928 passing yards"
+
+
+def test_unmatched_lookup_falls_back_to_rows_sorted_by_stat():
+    psq = PlayerStatsQuery(
+        players=["Lamar Jackson"], statistics=["passing_yards"], tp=TimePeriod(seasons=[2024])
+    )
+    state = _state("Lamar Jackson passing yards 2024", psq, rows=list(reversed(QB_ROWS)))
+
+    result = fast_answer_node(state)
+
+    assert result.generated_response.startswith("**Joe Burrow** (CIN)")
+
+
+def test_team_ranking():
+    tsq = TeamStatsQuery(teams=["ALL"], statistics=["points"], limit=2)
+    state = ChatbotState(
+        session_id="test",
+        user_query="most points by a team",
+        parsed_query=ParsedQuery(team_stats_query=tsq, query_intent="team_stats"),
+        retrieved_data=RetrievedData(
+            teams=[
+                {"team": "DET", "season": 2025, "points": 564},
+                {"team": "BUF", "season": 2025, "points": 525},
+                {"team": "KC", "season": 2025, "points": 385},
+            ]
+        ),
+        generated_response="",
+    )
+
+    result = fast_answer_node(state)
+
+    assert result.generated_response.startswith(
+        "**DET** leads all teams in points for 2025 with 564."
+    )
+    assert "2. BUF: 525 points" in result.generated_response
+
+
+def test_analytical_or_complex_queries_use_agent():
+    weekly = [{**QB_ROWS[0], "week": w} for w in (1, 2)]
+    cases = [
+        _state("why is Burrow better than Goff?", _ranking_query()),
+        _state("top QBs", _ranking_query(statistics=["passing_air_yards"])),
+        _state("top QBs", _ranking_query(), rows=weekly),
+        _state(
+            "top QBs on third down",
+            _ranking_query(filters=QueryFilters(situation="third_down")),
+        ),
+        _state("top QBs", _ranking_query(), enrichment_datasets=["player_info"]),
+    ]
+
+    for state in cases:
+        assert plan_fast_answer(state) is None
+        assert routing.should_continue_after_retriever(state) == "AnalyzerReactAgent"
@@ -0,0 +1,56 @@
+import pandas as pd
+import pytest
+
+from sportsagent.tools.dataframe import compare_performance, describe_dataset
+from sportsagent.utils.frameregistry import FrameRegistry, frame_fingerprint, get_frame_registry
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "player_name": ["Mahomes", "Allen"],
+            "passing_yards": [4183, 3731],
+            "meta": [{"k": 1}, {"k": 2}],
+        }
+    )
+
+
+def test_fingerprint_is_content_based_and_handles_unhashable_cells():
+    df = _frame()
+
+    assert frame_fingerprint(df) == frame_fingerprint(df.copy())
+    changed = df.assign(passing_yards=[4183, 3732])
+    assert frame_fingerprint(changed) != frame_fingerprint(df)
+
+
+def test_registry_resolves_shared_frame_without_leaking_mutations():
+    registry = FrameRegistry(max_entries=2)
+    handle = registry.register(_frame())
+
+    view = registry.resolve(handle)
+    view.loc[0, "passing_yards"] = 0
+
+    assert registry.register(_frame()) == handle
+    assert registry.resolve(handle).loc[0, "passing_yards"] == 4183
+
+
+def test_registry_evicts_least_recently_used():
+    registry = FrameRegistry(max_entries=1)
+    first = registry.register(_frame())
+    registry.register(_frame().head(1))
+
+    assert first not in registry
+    with pytest.raises(KeyError):
+        registry.resolve(first)
+
+
+def test_tools_resolve_handles_from_shared_registry():
+    handle = get_frame_registry().register(_frame().drop(columns=["meta"]))
+
+    _, describe_artifact = describe_dataset.func(data_handle=handle)
+    summary, _ = compare_performance.func(data_handle=handle)
+    missing, artifact = compare_performance.func(data_handle="not-a-handle")
+
+    assert "passing_yards" in describe_artifact["describe_df"]
+    assert "Mahomes" in summary
+    assert "no longer available" in missing and artifact == {}
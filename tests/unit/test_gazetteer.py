@@ -0,0 +1,46 @@
+from unittest.mock import patch
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from sportsagent.nodes.queryparser import gazetteer
+from sportsagent.nodes.queryparser.gazetteer import build_gazetteer
+from sportsagent.nodes.queryparser.queryparsernode import _build_parser_messages
+
+EMPTY_CONTEXT = {"recent_players": [], "recent_stats": [], "recent_teams": [], "messages": []}
+PLAYERS = ["Josh Allen", "Allen Robinson", "A.J. Brown", "Amon-Ra St. Brown"]
+
+
+def _found(query: str) -> list[tuple[str, str, str]]:
+    return [(m.kind, m.value, query[m.start : m.end]) for m in build_gazetteer(PLAYERS).scan(query)]
+
+
+def test_scan_returns_all_entities_with_offsets():
+    query = "Compare Josh Allen's passing yards vs the Bills and KC in 2024"
+
+    assert _found(query) == [
+        ("player", "Josh Allen", "Josh Allen's"),
+        ("stat", "passing_yards", "passing yards"),
+        ("team", "BUF", "Bills"),
+        ("team", "KC", "KC"),
+    ]
+
+
+def test_scan_prefers_longest_match_and_whole_tokens():
+    assert _found("amon-ra st. brown and A.J. Brown rushing tds for the Tennessee Titans") == [
+        ("player", "Amon-Ra St. Brown", "amon-ra st. brown"),
+        ("player", "A.J. Brown", "A.J. Brown"),
+        ("stat", "rushing_tds", "rushing tds"),
+        ("team", "TEN", "Tennessee Titans"),
+    ]
+    # Lower-case "no"/"was" are words, not the Saints or Commanders
+    assert _found("no one was better") == []
+
+
+def test_parser_messages_carry_resolved_entities():
+    with patch.object(gazetteer, "_GAZETTEER", build_gazetteer(PLAYERS)):
+        messages = _build_parser_messages("josh allen passing yards vs the bills", EMPTY_CONTEXT)
+
+    assert [type(m) for m in messages] == [SystemMessage, SystemMessage, HumanMessage]
+    assert "- Players: Josh Allen" in messages[1].content
+    assert '- Teams: BUF ("bills")' in messages[1].content
+    assert '- Statistics: passing_yards ("passing yards")' in messages[1].content
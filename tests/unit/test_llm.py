@@ -0,0 +1,72 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from sportsagent import llm
+from sportsagent.llm import close_llm_clients, get_chat_model, get_http_client, llm_client_stats
+
+
+@pytest.fixture(autouse=True)
+def _fresh_clients():
+    close_llm_clients()
+    with patch.dict(llm._STATS, {"models_created": 0, "requests": 0, "connections_opened": 0}):
+        yield
+    close_llm_clients()
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+def test_chat_models_are_shared_per_model_and_options():
+    with patch.object(llm.settings, "OPENAI_API_KEY", "sk-test"):
+        parser = get_chat_model("gpt-4o")
+        again = get_chat_model("openai:gpt-4o")
+        tuned = get_chat_model("gpt-4o", temperature=0)
+
+    assert parser is again
+    assert tuned is not parser
+    assert parser.http_client is tuned.http_client is get_http_client()
+    assert llm_client_stats()["models"] == 2
+
+
+def test_pooled_client_reuses_keepalive_connections():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = get_http_client()
+        for _ in range(3):
+            assert client.get(f"http://127.0.0.1:{server.server_port}/").text == "ok"
+    finally:
+        server.shutdown()
+
+    stats = llm_client_stats()
+    assert (stats["requests"], stats["connections_opened"], stats["connections_reused"]) == (
+        3,
+        1,
+        2,
+    )
+
+
+def test_aclose_closes_both_pools():
+    import asyncio
+
+    from sportsagent.llm import aclose_llm_clients, get_async_http_client
+
+    sync_client, async_client = get_http_client(), get_async_http_client()
+
+    asyncio.run(aclose_llm_clients())
+
+    assert sync_client.is_closed and async_client.is_closed
+    assert get_async_http_client() is not async_client
@@ -0,0 +1,106 @@
+from unittest.mock import MagicMock, patch
+
+from sportsagent.config import settings
+from sportsagent.models.chatbotstate import ChatbotState
+from sportsagent.models.parsedquery import ParsedQuery, PlayerStatsQuery, TimePeriod
+from sportsagent.nodes.queryparser import parsecache
+from sportsagent.nodes.queryparser.parsecache import ParseCache, parse_cache_key
+from sportsagent.nodes.queryparser.queryparsernode import query_parser_node
+
+EMPTY_CONTEXT = {"recent_players": [], "recent_stats": [], "recent_teams": [], "messages": []}
+
+
+def _parsed(player: str = "Josh Allen") -> ParsedQuery:
+    return ParsedQuery(
+        workflowIntent="retrieve",
+        query_intent="player_stats",
+        player_stats_query=PlayerStatsQuery(
+            players=[player], statistics=["passing_yards"], timePeriod=TimePeriod(seasons=[2024])
+        ),
+    )
+
+
+def test_key_normalizes_text_and_includes_context():
+    key = parse_cache_key("Josh Allen passing yards 2024?", EMPTY_CONTEXT)
+
+    assert key == parse_cache_key("  josh allen   PASSING yards 2024 ", EMPTY_CONTEXT)
+    assert key != parse_cache_key(
+        "Josh Allen passing yards 2024", EMPTY_CONTEXT | {"recent_players": ["Lamar Jackson"]}
+    )
+
+
+def test_key_keeps_case_of_team_abbreviations():
+    assert parse_cache_key("KC points 2024", EMPTY_CONTEXT) != parse_cache_key(
+        "kc points 2024", EMPTY_CONTEXT
+    )
+    assert parse_cache_key("WHO WAS best in 2024", EMPTY_CONTEXT) != parse_cache_key(
+        "who was best in 2024", EMPTY_CONTEXT
+    )
+    assert parse_cache_key("WHO led KC", EMPTY_CONTEXT) == parse_cache_key(
+        "who led KC", EMPTY_CONTEXT
+    )
+
+
+def test_lru_and_ttl_bounds(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(parsecache.time, "time", lambda: clock[0])
+    cache = ParseCache(max_entries=2, ttl_seconds=60)
+
+    cache.put("a", _parsed("A"))
+    cache.put("b", _parsed("B"))
+    assert cache.get("a") is not None
+    cache.put("c", _parsed("C"))
+
+    assert cache.get("b") is None
+    clock[0] += 61
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["expirations"]) == (
+        1,
+        2,
+        1,
+        1,
+    )
+
+
+def test_hits_return_independent_copies():
+    cache = ParseCache()
+    cache.put("k", _parsed())
+
+    first = cache.get("k")
+    first.player_stats_query.players.append("Someone Else")
+
+    assert cache.get("k") == _parsed()
+
+
+def test_disk_tier_survives_new_instances(tmp_path):
+    db_path = tmp_path / "parse_cache.sqlite"
+    ParseCache(db_path=db_path).put("k", _parsed())
+
+    cache = ParseCache(db_path=db_path)
+
+    assert cache.get("k") == _parsed()
+    assert cache.get("k") == _parsed()
+    assert (cache.disk_hits, cache.hits) == (1, 1)
+
+
+def test_repeat_query_skips_parser_llm():
+    llm = MagicMock()
+    llm.with_structured_output.return_value.invoke.return_value = _parsed()
+
+    def state(query: str) -> ChatbotState:
+        return ChatbotState(session_id="s", user_query=query, generated_response="")
+
+    with (
+        patch.object(settings, "RULE_PARSER_ENABLED", False),
+        patch.object(parsecache, "_PARSE_CACHE", ParseCache()),
+        patch(
+            "sportsagent.nodes.queryparser.queryparsernode.get_chat_model", return_value=llm
+        ) as chat,
+    ):
+        first = query_parser_node(state("Josh Allen passing yards 2024"))
+        second = query_parser_node(state("josh allen passing yards 2024?"))
+
+    assert chat.call_count == 1
+    assert second.parsed_query == first.parsed_query
+    assert second.pending_action == "retrieve"
@@ -0,0 +1,80 @@
+from pathlib import Path
+
+import polars as pl
+
+from sportsagent.datasource.pbpstore import PBPStore, build_predicates
+
+
+def _fake_pbp(season: int) -> pl.DataFrame:
+    weeks = [1, 1, 2, 2, 3, 3]
+    return pl.DataFrame(
+        {
+            "game_id": [f"{season}_{w:02d}_KC_BUF" for w in weeks],
+            "play_id": list(range(len(weeks))),
+            "season": [season] * len(weeks),
+            "week": weeks,
+            "posteam": ["KC", "BUF"] * 3,
+            "defteam": ["BUF", "KC"] * 3,
+            "yardline_100": [15, 60, 8, 45, 20, 75],
+            "epa": [0.1, -0.2, 0.3, 0.4, -0.5, 0.6],
+            "desc": ["play"] * len(weeks),
+        }
+    )
+
+
+def test_pbp_store_ingests_once_and_writes_week_partitions(tmp_path: Path) -> None:
+    calls: list[int] = []
+
+    def loader(season: int) -> pl.DataFrame:
+        calls.append(season)
+        return _fake_pbp(season)
+
+    store = PBPStore(root=tmp_path, loader=loader, row_group_size=2)
+    store.ensure_seasons([2022, 2022])
+    store.ensure_seasons([2022])
+
+    assert calls == [2022]
+    assert sorted(p.name for p in store.season_dir(2022).glob("week=*")) == [
+        "week=1",
+        "week=2",
+        "week=3",
+    ]
+
+
+def test_pbp_store_scan_prunes_columns_and_rows(tmp_path: Path) -> None:
+    store = PBPStore(root=tmp_path, loader=_fake_pbp)
+    store.ensure_seasons([2021, 2022])
+
+    df = store.scan(
+        seasons=[2022],
+        columns=["posteam", "epa"],
+        start_week=2,
+        end_week=3,
+        predicates=build_predicates({"posteam": ["KC"]}),
+    )
+
+    assert df.columns == ["season", "week", "posteam", "epa"]
+    assert df["season"].to_list() == [2022, 2022]
+    assert df["week"].to_list() == [2, 3]
+    assert set(df["posteam"].to_list()) == {"KC"}
+
+
+def test_pbp_store_scan_missing_season_returns_empty(tmp_path: Path) -> None:
+    store = PBPStore(root=tmp_path, loader=_fake_pbp)
+
+    assert store.scan(seasons=[1999]).is_empty()
+
+
+def test_pbp_store_marks_empty_seasons_so_they_are_not_refetched(tmp_path: Path) -> None:
+    calls: list[int] = []
+
+    def loader(season: int) -> pl.DataFrame:
+        calls.append(season)
+        return pl.DataFrame()
+
+    store = PBPStore(root=tmp_path, loader=loader)
+    store.ensure_seasons([2023])
+    store.ensure_seasons([2023])
+
+    assert calls == [2023]
+    assert store.scan(seasons=[2023]).is_empty()
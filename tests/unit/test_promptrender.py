@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+
+from sportsagent.utils.promptrender import (
+    estimate_tokens,
+    render_frame_for_prompt,
+    select_prompt_columns,
+)
+
+
+def _wide_stats(rows: int = 200, extra: int = 60) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    data = {
+        "player_display_name": [f"Player {i}" for i in range(rows)],
+        "team": ["KC"] * rows,
+        "season": [2024] * rows,
+        "passing_yards": rng.uniform(0, 5000, rows),
+        "passing_tds": rng.integers(0, 50, rows),
+        "constant_col": [1.0] * rows,
+        "empty_col": [np.nan] * rows,
+    }
+    data.update({f"stat_{i}": rng.normal(size=rows) for i in range(extra)})
+    return pd.DataFrame(data)
+
+
+def test_select_columns_orders_identity_then_requested():
+    df = _wide_stats(extra=3)
+
+    columns = select_prompt_columns(df, ["passing_tds", "missing_stat"])
+
+    assert columns[:4] == ["player_display_name", "team", "season", "passing_tds"]
+    assert "passing_yards" in columns
+    assert "constant_col" not in columns
+    assert "empty_col" not in columns
+
+
+def test_render_respects_budget_and_keeps_requested_stats():
+    df = _wide_stats()
+
+    rendered = render_frame_for_prompt(df, 400, ["passing_tds"], name="players")
+
+    assert estimate_tokens(rendered) <= 420
+    assert rendered.startswith("players: 200 rows x 67 columns")
+    assert "Rows (sorted by passing_tds desc) as csv:" in rendered
+    header = rendered.split("as csv:\n")[1].split("\n")[0]
+    assert header.startswith("player_display_name,team,season,passing_tds")
+    assert "more rows not shown" in rendered
+    assert "Other columns (not shown):" in rendered
+
+
+def test_render_includes_rounded_aggregates():
+    df = pd.DataFrame(
+        {
+            "player_display_name": ["A", "B", "C"],
+            "passing_yards": [100.123456, 200.987654, 300.5],
+        }
+    )
+
+    rendered = render_frame_for_prompt(df, 1000, ["passing_yards"])
+
+    assert "Column aggregates:" in rendered
+    assert "passing_yards,100.12,200.54,300.5,601.61" in rendered
+    assert "C,300.5" in rendered
+    assert "100.123456" not in rendered
+    assert "more rows not shown" not in rendered
+
+
+def test_render_markdown_and_empty_frames():
+    df = pd.DataFrame({"team": ["KC", "BUF"], "points": [30, 27]})
+
+    rendered = render_frame_for_prompt(df, 500, ["points"], fmt="markdown")
+
+    assert "| team | points |" in rendered
+    assert "| KC | 30 |" in rendered
+    assert render_frame_for_prompt(pd.DataFrame(), 500) == "0 rows x 0 columns"
+
+
+def test_render_counts_hidden_rows_per_format_and_past_max_rows():
+    df = pd.DataFrame({"team": [f"T{i}" for i in range(40)], "points": range(40)})
+
+    for fmt in ("csv", "markdown"):
+        rendered = render_frame_for_prompt(df, 60, ["points"], fmt=fmt)
+        shown = sum(line.startswith(("T", "| T")) for line in rendered.split("\n"))
+        assert 0 < shown < len(df)
+        assert f"... {len(df) - shown} more rows not shown" in rendered
+
+    capped = render_frame_for_prompt(df, 5000, ["points"], max_rows=10)
+    assert "... 30 more rows not shown" in capped
+
+
+def test_render_fits_columns_with_a_single_table_render():
+    from unittest.mock import patch
+
+    from sportsagent.utils import promptrender
+
+    df = _wide_stats()
+    with patch.object(promptrender, "_render_rows", wraps=promptrender._render_rows) as render_rows:
+        rendered = render_frame_for_prompt(df, 300, ["passing_tds"])
+
+    render_rows.assert_called_once()
+    shown = render_rows.call_args.args[1]
+    assert 1 < len(shown) < 67
+    assert estimate_tokens(rendered) <= 320
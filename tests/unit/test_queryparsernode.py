@@ -0,0 +1,134 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from sportsagent.config import settings
+from sportsagent.models.chatbotstate import ChatbotState
+from sportsagent.models.parsedquery import ParsedQuery
+from sportsagent.nodes.queryparser import parsecache
+from sportsagent.nodes.queryparser.parsecache import ParseCache
+from sportsagent.nodes.queryparser.queryparsernode import (
+    _build_parser_messages,
+    aquery_parser_node,
+    query_parser_node,
+)
+from sportsagent.utils import tokenusage
+
+EMPTY_CONTEXT = {"recent_players": [], "recent_stats": [], "recent_teams": [], "messages": []}
+
+
+def test_static_prefix_is_shared_and_context_is_a_separate_message():
+    with patch.object(settings, "ENTITY_HINTS_ENABLED", False):
+        fresh = _build_parser_messages("Josh Allen passing yards", EMPTY_CONTEXT)
+        follow_up = _build_parser_messages(
+            "what about his rushing yards?",
+            EMPTY_CONTEXT | {"recent_players": ["Josh Allen"], "messages": ["User: Josh Allen"]},
+        )
+
+    assert [type(m) for m in fresh] == [SystemMessage, HumanMessage]
+    assert [type(m) for m in follow_up] == [SystemMessage, SystemMessage, HumanMessage]
+    assert fresh[0].content == follow_up[0].content
+    assert "Josh Allen" not in fresh[0].content and "{{" not in fresh[0].content
+    assert "Recently mentioned players: Josh Allen" in follow_up[1].content
+    assert follow_up[-1].content == "what about his rushing yards?"
+
+
+def test_parser_records_prompt_cache_reads():
+    raw = AIMessage(
+        content="",
+        usage_metadata={
+            "input_tokens": 1800,
+            "output_tokens": 60,
+            "total_tokens": 1860,
+            "input_token_details": {"cache_read": 1536},
+        },
+    )
+    llm = MagicMock()
+    llm.with_structured_output.return_value.invoke.return_value = {
+        "raw": raw,
+        "parsed": ParsedQuery(workflowIntent="retrieve"),
+        "parsing_error": None,
+    }
+
+    with (
+        patch.object(settings, "RULE_PARSER_ENABLED", False),
+        patch.object(parsecache, "_PARSE_CACHE", ParseCache()),
+        patch.dict(tokenusage._USAGE, clear=True),
+        patch("sportsagent.nodes.queryparser.queryparsernode.get_chat_model", return_value=llm),
+    ):
+        state = query_parser_node(
+            ChatbotState(session_id="s", user_query="best deep threats", generated_response="")
+        )
+        stats = tokenusage.get_token_usage("query_parser").stats()
+
+    assert state.parsed_query.workflow_intent == "retrieve"
+    assert llm.with_structured_output.call_args.kwargs["include_raw"] is True
+    assert stats["calls"] == 1
+    assert stats["cache_read_tokens"] == 1536
+    assert stats["cache_hit_rate"] == 1536 / 1800
+
+
+def _async_parser_llm(ainvoke: AsyncMock) -> MagicMock:
+    llm = MagicMock()
+    llm.with_structured_output.return_value.ainvoke = ainvoke
+    llm.with_structured_output.return_value.invoke.side_effect = AssertionError("blocking call")
+    return llm
+
+
+def test_async_node_awaits_the_parser_llm():
+    ainvoke = AsyncMock(return_value=ParsedQuery(workflowIntent="retrieve"))
+
+    async def parse_concurrently() -> list[ChatbotState]:
+        return await asyncio.gather(
+            *(
+                aquery_parser_node(
+                    ChatbotState(session_id="s", user_query=query, generated_response="")
+                )
+                for query in ("best deep threats", "most efficient slot receivers")
+            )
+        )
+
+    with (
+        patch.object(settings, "RULE_PARSER_ENABLED", False),
+        patch.object(parsecache, "_PARSE_CACHE", ParseCache()),
+        patch(
+            "sportsagent.nodes.queryparser.queryparsernode.get_chat_model",
+            return_value=_async_parser_llm(ainvoke),
+        ),
+    ):
+        states = asyncio.run(parse_concurrently())
+
+    assert ainvoke.await_count == 2
+    assert [s.pending_action for s in states] == ["retrieve", "retrieve"]
+    assert all(s.error is None for s in states)
+
+
+def test_async_node_propagates_cancellation():
+    started = asyncio.Event()
+
+    async def slow_parse(*args, **kwargs):
+        started.set()
+        await asyncio.sleep(60)
+
+    async def cancel_mid_parse() -> None:
+        task = asyncio.create_task(
+            aquery_parser_node(
+                ChatbotState(session_id="s", user_query="best deep threats", generated_response="")
+            )
+        )
+        await started.wait()
+        task.cancel()
+        await task
+
+    with (
+        patch.object(settings, "RULE_PARSER_ENABLED", False),
+        patch.object(parsecache, "_PARSE_CACHE", ParseCache()),
+        patch(
+            "sportsagent.nodes.queryparser.queryparsernode.get_chat_model",
+            return_value=_async_parser_llm(AsyncMock(side_effect=slow_parse)),
+        ),
+        pytest.raises(asyncio.CancelledError),
+    ):
+        asyncio.run(cancel_mid_parse())
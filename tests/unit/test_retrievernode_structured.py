@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 
 from sportsagent.models.chatbotstate import ChatbotState
 from sportsagent.models.parsedquery import (
@@ -101,3 +102,81 @@ def test_retrieve_data_append_mode(monkeypatch):
     players = [r["player_name"] for r in new_state.retrieved_data.players]
     assert "Mahomes" in players
     assert "Allen" in players
+
+
+def test_split_by_game_context_collapses_home_away_splits():
+    from sportsagent.models.parsedquery import QueryFilters
+    from sportsagent.nodes.retriever.retrievernode import PLAYER_SPLIT_KEYS, split_by_game_context
+
+    weekly = pd.DataFrame(
+        {
+            "player_id": ["QB1"] * 4,
+            "player_display_name": ["Patrick Mahomes"] * 4,
+            "season": [2024] * 4,
+            "week": [1, 2, 3, 19],
+            "season_type": ["REG", "REG", "REG", "POST"],
+            "opponent": ["BAL", "CIN", "ATL", "HOU"],
+            "home_away": ["home", "home", "away", "home"],
+            "game_result": ["W", "L", "W", "W"],
+            "passing_yards": [291, 151, 217, 177],
+            "target_share": [0.1, 0.2, 0.3, 0.4],
+        }
+    )
+
+    splits = split_by_game_context(weekly, QueryFilters(home_away="HOME"), "reg", PLAYER_SPLIT_KEYS)
+
+    assert len(splits) == 1
+    row = splits.iloc[0]
+    assert row["home_away"] == "home"
+    assert row["passing_yards"] == 442
+    assert row["games"] == 2 and row["wins"] == 1
+    assert row["target_share"] == pytest.approx(0.15)
+
+
+def test_query_filters_normalize_opponent_names():
+    from sportsagent.models.parsedquery import QueryFilters
+
+    assert QueryFilters(opponent="chiefs").opponent == "KC"
+    assert QueryFilters(opponent="buf").opponent == "BUF"
+    assert QueryFilters(home_away="Road").home_away == "away"
+    assert QueryFilters(home_away="on the road").home_away == "away"
+    assert QueryFilters(home_away="away games").home_away == "away"
+    assert QueryFilters(home_away="at Buffalo").home_away == "away"
+    assert QueryFilters(home_away="home games").home_away == "home"
+    assert QueryFilters(home_away="at home").home_away == "home"
+    assert QueryFilters(home_away="neutral site").home_away is None
+
+
+def test_situational_splits_use_time_window_and_separate_keys(monkeypatch):
+    from sportsagent.models.parsedquery import QueryFilters, TeamStatsQuery, TimePeriod
+    from sportsagent.nodes.retriever import retrievernode
+
+    calls = []
+
+    def mock_get_situational_splits(**kwargs):
+        calls.append(kwargs)
+        return pd.DataFrame([{"situation": "red_zone", "plays": 3}])
+
+    monkeypatch.setattr(
+        retrievernode.NFL_DATASOURCE, "get_situational_splits", mock_get_situational_splits
+    )
+    window = TimePeriod(seasons=[2024], start_week=10, end_week=14)
+    psq = PlayerStatsQuery(
+        players=["Josh Allen"], tp=window, filters=QueryFilters(situation="red_zone")
+    )
+    tsq = TeamStatsQuery(teams=["BUF"], tp=window, filters=QueryFilters(situation="red_zone"))
+    retrieved = RetrievedData()
+
+    retrievernode.add_situational_splits(retrieved, psq, pd.DataFrame({"player_id": ["P1"]}))
+    retrievernode.add_situational_splits(retrieved, tsq)
+
+    assert [(c["level"], c["start_week"], c["end_week"]) for c in calls] == [
+        ("player", 10, 14),
+        ("team", 10, 14),
+    ]
+    assert calls[0]["player_ids"] == ["P1"]
+    assert set(retrieved.extra) == {"player_situational_splits", "team_situational_splits"}
+
+    # Without player ids the splits would cover the whole league, so they are skipped
+    assert retrievernode.fetch_situational_splits(psq, pd.DataFrame({"player": ["x"]})) is None
+    assert len(calls) == 2
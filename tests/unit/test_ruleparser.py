@@ -0,0 +1,108 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sportsagent.config import settings
+from sportsagent.constants import CURRENT_SEASON
+from sportsagent.models.chatbotstate import ChatbotState
+from sportsagent.nodes.queryparser import parsecache, ruleparser
+from sportsagent.nodes.queryparser.parsecache import ParseCache
+from sportsagent.nodes.queryparser.queryparsernode import _rule_parse, query_parser_node
+from sportsagent.nodes.queryparser.ruleparser import build_player_name_index, rule_parse
+
+PLAYERS = build_player_name_index(["Josh Allen", "Lamar Jackson", "A.J. Brown", "Tyreek Hill"])
+
+
+def test_player_lookup_with_season():
+    result = rule_parse("How many passing yards did Josh Allen have in 2024?", PLAYERS)
+
+    psq = result.parsed_query.player_stats_query
+    assert result.confidence == 1.0
+    assert result.parsed_query.query_intent == "player_stats"
+    assert psq.players == ["Josh Allen"]
+    assert psq.statistics == ["passing_yards"]
+    assert psq.tp.seasons == [2024]
+
+
+def test_leaderboard_with_position_range_and_order():
+    result = rule_parse("bottom 5 QBs by passing interceptions 2021-2023", PLAYERS)
+
+    psq = result.parsed_query.player_stats_query
+    assert (psq.position, psq.limit, psq.sort_order) == ("QB", 5, "asc")
+    assert psq.statistics == ["passing_interceptions"]
+    assert psq.tp.seasons == [2021, 2022, 2023]
+
+
+def test_names_with_punctuation_and_multiple_stats():
+    result = rule_parse(
+        "AJ Brown and tyreek hill's receiving yards and receiving touchdowns", PLAYERS
+    )
+
+    psq = result.parsed_query.player_stats_query
+    assert psq.players == ["A.J. Brown", "Tyreek Hill"]
+    assert psq.statistics == ["receiving_yards", "receiving_tds"]
+    assert psq.tp.seasons == [CURRENT_SEASON]
+
+
+def test_team_queries():
+    named = rule_parse("Chiefs and BUF passing yards last season", PLAYERS)
+    league = rule_parse("which team had the most rushing yards in the playoffs", PLAYERS)
+
+    assert named.parsed_query.team_stats_query.teams == ["BUF", "KC"]
+    assert named.parsed_query.team_stats_query.tp.seasons == [CURRENT_SEASON - 1]
+    tsq = league.parsed_query.team_stats_query
+    assert tsq.teams == ["ALL"] and tsq.tp.summary_level == "post"
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "plot Josh Allen passing yards 2024",
+        "Josh Allen passing yards against the Jets",
+        "Josh Allen passing yards in week 5",
+        "what about his rushing yards?",
+        "Josh Allen in 2024",
+    ],
+)
+def test_unsupported_shapes_defer_to_llm(query):
+    assert rule_parse(query, PLAYERS) is None
+
+
+def test_unexplained_words_lower_confidence():
+    result = rule_parse("Josh Allen passing yards when trailing late 2024", PLAYERS)
+
+    assert result.unexplained == ["when", "trailing", "late"]
+    assert result.confidence < settings.RULE_PARSER_MIN_CONFIDENCE
+
+
+def test_multi_word_phrases_count_once():
+    result = rule_parse("most passing yards by a rookie in 2023", PLAYERS)
+
+    assert result.unexplained == ["rookie"]
+    assert result.confidence == 0.75
+    with patch.object(ruleparser, "_PLAYER_INDEX", PLAYERS):
+        assert _rule_parse("most passing yards by a rookie in 2023") is None
+        assert _rule_parse("most passing yards in 2023") is not None
+
+
+def test_parser_node_skips_llm_for_confident_rule_parses():
+    llm = MagicMock()
+    with (
+        patch.object(ruleparser, "_PLAYER_INDEX", PLAYERS),
+        patch.object(ruleparser, "_RULE_STATS", {"rule_parses": 0, "llm_parses": 0}),
+        patch.object(parsecache, "_PARSE_CACHE", ParseCache()),
+        patch(
+            "sportsagent.nodes.queryparser.queryparsernode.get_chat_model", return_value=llm
+        ) as chat,
+    ):
+        state = query_parser_node(
+            ChatbotState(
+                session_id="s", user_query="Lamar Jackson rushing yards 2024", generated_response=""
+            )
+        )
+        stats = ruleparser.rule_parser_stats()
+
+    chat.assert_not_called()
+    assert state.parsed_query.player_stats_query.players == ["Lamar Jackson"]
+    assert state.pending_action == "retrieve"
+    assert stats == {"rule_parses": 1, "llm_parses": 0, "hit_rate": 1.0}
@@ -0,0 +1,57 @@
+import pandas as pd
+
+from sportsagent.datasource.schedules import TeamGameIndex, optimize_schedules
+
+
+def _schedules() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "game_id": ["2024_01_BAL_KC", "2024_02_KC_CIN", "2024_03_KC_ATL"],
+            "season": [2024, 2024, 2024],
+            "game_type": ["REG", "REG", "REG"],
+            "week": [1, 2, 3],
+            "gameday": ["2024-09-05", "2024-09-15", "2024-09-22"],
+            "away_team": ["BAL", "CIN", "KC"],
+            "away_score": [20, 25, None],
+            "home_team": ["KC", "KC", "ATL"],
+            "home_score": [27, 26, None],
+            "location": ["Home", "Home", "Home"],
+            "away_rest": [7, 10, 7],
+            "home_rest": [7, 10, 6],
+            "old_game_id": ["a", "b", "c"],
+        }
+    )
+
+
+def test_optimize_schedules_projects_and_downcasts():
+    df = optimize_schedules(_schedules())
+
+    assert "old_game_id" not in df.columns
+    assert df["home_team"].dtype == "category"
+    assert df["week"].dtype == "int16"
+    assert df["away_score"].dtype == "float32"
+
+
+def test_team_game_index_joins_both_sides_of_each_game():
+    index = TeamGameIndex(optimize_schedules(_schedules()))
+    weekly = pd.DataFrame(
+        {
+            "season": [2024, 2024, 2024, 2024, 2024],
+            "week": [1, 1, 2, 3, 4],
+            "team": ["KC", "BAL", "KC", "KC", "KC"],
+            "passing_yards": [291, 273, 151, 0, 0],
+        }
+    )
+
+    joined = index.join(weekly)
+
+    assert len(index) == 6
+    assert joined["opponent"].tolist()[:4] == ["BAL", "KC", "CIN", "ATL"]
+    assert joined["home_away"].tolist()[:4] == ["home", "away", "home", "away"]
+    assert joined["game_result"].tolist()[:3] == ["W", "L", "W"]
+    assert joined.loc[1, "point_diff"] == -7
+    assert joined.loc[2, "rest_days"] == 10
+    # Unplayed game has no result; week without a game stays unmatched
+    assert pd.isna(joined.loc[3, "game_result"])
+    assert pd.isna(joined.loc[4, "opponent"])
+    assert joined["passing_yards"].tolist() == weekly["passing_yards"].tolist()
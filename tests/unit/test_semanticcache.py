@@ -0,0 +1,105 @@
+from unittest.mock import MagicMock, patch
+
+from sportsagent.config import settings
+from sportsagent.models.chatbotstate import ChatbotState
+from sportsagent.models.parsedquery import ParsedQuery, PlayerStatsQuery, TimePeriod
+from sportsagent.nodes.queryparser import parsecache, semanticcache
+from sportsagent.nodes.queryparser.gazetteer import build_gazetteer
+from sportsagent.nodes.queryparser.parsecache import ParseCache
+from sportsagent.nodes.queryparser.queryparsernode import query_parser_node
+from sportsagent.nodes.queryparser.semanticcache import SemanticCache
+
+EMPTY_CONTEXT = {
+    "recent_players": [],
+    "recent_stats": [],
+    "recent_teams": [],
+    "messages": [],
+    "summary": "",
+}
+GAZETTEER = build_gazetteer(["Patrick Mahomes", "Josh Allen"])
+
+
+def _parsed(player: str = "Patrick Mahomes", season: int = 2024) -> ParsedQuery:
+    return ParsedQuery(
+        workflowIntent="retrieve",
+        query_intent="player_stats",
+        player_stats_query=PlayerStatsQuery(
+            players=[player],
+            statistics=["passing_yards"],
+            timePeriod=TimePeriod(seasons=[season]),
+        ),
+    )
+
+
+def _cache(**kwargs) -> SemanticCache:
+    cache = SemanticCache(gazetteer=GAZETTEER, **kwargs)
+    cache.add("Patrick Mahomes passing yards in 2024", EMPTY_CONTEXT, _parsed())
+    return cache
+
+
+def test_paraphrase_reuses_parse_above_threshold():
+    cache = _cache()
+
+    match = cache.lookup("how many passing yards did Patrick Mahomes have in 2024?", EMPTY_CONTEXT)
+
+    assert match is not None and match.similarity >= cache.threshold
+    assert match.parsed_query == _parsed()
+    assert (
+        cache.lookup("Patrick Mahomes passing yards 2024 splits by quarter", EMPTY_CONTEXT) is None
+    )
+
+
+def test_entity_guard_blocks_similar_queries_about_other_entities():
+    cache = _cache()
+
+    for query in (
+        "Josh Allen passing yards in 2024",
+        "Patrick Mahomes passing yards in 2023",
+        "Patrick Mahomes passing touchdowns in 2024",
+        "Patrick Mahomes passing yards in 2024 playoffs",
+    ):
+        assert cache.lookup(query, EMPTY_CONTEXT) is None, query
+    follow_up = EMPTY_CONTEXT | {"recent_players": ["Josh Allen"]}
+    assert cache.lookup("Patrick Mahomes passing yards in 2024", follow_up) is None
+    assert cache.stats()["hits"] == 0
+
+
+def test_lru_eviction_and_metrics():
+    cache = _cache(max_entries=2)
+    cache.add("Josh Allen passing yards in 2024", EMPTY_CONTEXT, _parsed("Josh Allen"))
+    assert cache.lookup("Patrick Mahomes passing yards 2024", EMPTY_CONTEXT) is not None
+    cache.add("Josh Allen passing yards in 2023", EMPTY_CONTEXT, _parsed("Josh Allen", 2023))
+
+    assert cache.lookup("Josh Allen passing yards 2024", EMPTY_CONTEXT) is None
+    match = cache.lookup("Patrick Mahomes passing yards 2024", EMPTY_CONTEXT)
+    cache.report_false_hit(match.entry_id)
+
+    assert cache.lookup("Patrick Mahomes passing yards 2024", EMPTY_CONTEXT) is None
+    stats = cache.stats()
+    assert (stats["entries"], stats["evictions"]) == (1, 1)
+    assert (stats["hits"], stats["misses"], stats["false_hits"]) == (2, 2, 1)
+    assert stats["false_hit_rate"] == 0.5
+
+
+def test_audited_hit_that_disagrees_with_the_parser_is_a_false_hit():
+    cache = _cache()
+    llm = MagicMock()
+    llm.with_structured_output.return_value.invoke.return_value = _parsed("Josh Allen")
+
+    with (
+        patch.object(settings, "RULE_PARSER_ENABLED", False),
+        patch.object(settings, "SEMANTIC_CACHE_AUDIT_RATE", 1.0),
+        patch.object(parsecache, "_PARSE_CACHE", ParseCache()),
+        patch.object(semanticcache, "_SEMANTIC_CACHE", cache),
+        patch("sportsagent.nodes.queryparser.queryparsernode.get_chat_model", return_value=llm),
+    ):
+        state = query_parser_node(
+            ChatbotState(
+                session_id="s",
+                user_query="what were Patrick Mahomes' passing yards during 2024",
+                generated_response="",
+            )
+        )
+
+    assert state.parsed_query == _parsed("Josh Allen")
+    assert cache.stats()["false_hits"] == 1
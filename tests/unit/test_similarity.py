@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sportsagent.datasource.similarity import SimilarityIndex, build_season_block
+
+
+def _receivers(season: int, scale: float = 1.0) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "player_id": [f"wr{i}" for i in range(5)],
+            "player_display_name": ["Deep Threat", "Slot Man", "Possession", "Deep Two", "Backup"],
+            "position": "WR",
+            "season": season,
+            "games": [17, 17, 16, 8, 1],
+            "receptions": np.array([60, 110, 95, 30, 1]) * scale,
+            "receiving_yards": np.array([1200, 1100, 1000, 600, 5]) * scale,
+            "target_share": [0.20, 0.30, 0.26, 0.20, 0.01],
+        }
+    )
+
+
+def test_block_uses_per_game_rates_and_unit_vectors():
+    block = build_season_block(_receivers(2024), "WR", 2024)
+
+    assert block is not None
+    # The one-game backup falls below the qualification threshold
+    assert list(block.meta["player_display_name"]) == [
+        "Deep Threat",
+        "Slot Man",
+        "Possession",
+        "Deep Two",
+    ]
+    assert block.features == ["receptions", "receiving_yards", "target_share"]
+    assert block.vectors.dtype == np.float32 and block.vectors.flags["C_CONTIGUOUS"]
+    assert np.linalg.norm(block.vectors, axis=1) == pytest.approx(np.ones(4), abs=1e-6)
+    # Per game, the 8-game deep threat is the closest profile to the 17-game one
+    similarities = block.vectors @ block.vectors[0]
+    assert int(np.argsort(similarities)[-2]) == 3
+    assert build_season_block(_receivers(2024), "QB", 2024) is None
+
+
+def test_most_similar_searches_across_seasons_and_excludes_same_player():
+    index = SimilarityIndex()
+    index.add_season(2023, _receivers(2023, scale=0.8), version="final")
+    index.add_season(2024, _receivers(2024), version="final")
+
+    position, row = index.locate("deep threat", 2024)
+    neighbours = index.most_similar(position, [row], k=2)[0]
+
+    assert position == "WR"
+    assert list(neighbours["player_id"]) == ["wr3", "wr3"]
+    assert set(neighbours["season"]) == {2023, 2024}
+    assert "wr0" not in set(neighbours["player_id"])
+    assert neighbours["similarity"].is_monotonic_decreasing
+
+    only_2023 = index.most_similar(position, [row], k=5, seasons=[2023])[0]
+    assert set(only_2023["season"]) == {2023}
+    assert len(only_2023) == 3
+    assert index.locate("Nobody", 2024) is None
+
+
+def test_locate_prefers_exact_names_and_rejects_ambiguous_partials():
+    index = SimilarityIndex()
+    index.add_season(2024, _receivers(2024), version="final")
+
+    assert index.locate("Deep Two", 2024) == ("WR", 3)
+    assert index.locate("WR3", 2024) == ("WR", 3)
+    assert index.locate("slot", 2024) == ("WR", 1)
+    with pytest.raises(ValueError, match="Deep Threat, Deep Two"):
+        index.locate("deep", 2024)
+
+
+def test_replacing_a_season_only_rebuilds_that_season():
+    index = SimilarityIndex()
+    index.add_season(2023, _receivers(2023), version="final")
+    index.add_season(2024, _receivers(2024), version="live-1")
+    before = index.most_similar("WR", [0], k=10, seasons=[2023])[0]
+
+    updated = _receivers(2024)
+    updated.loc[0, "receptions"] = 140
+    index.add_season(2024, updated, version="live-2")
+    after = index.most_similar("WR", [0], k=10, seasons=[2023])[0]
+
+    assert index.has_season(2024, "live-2") and not index.has_season(2024, "live-1")
+    assert index.has_season(2023, "final")
+    # Row 0 is a 2023 profile; its comps within 2023 do not move when 2024 changes
+    pd.testing.assert_frame_equal(before, after)
+
+
+def test_similar_players_tool_returns_candidates_for_ambiguous_names():
+    from types import SimpleNamespace
+    from unittest.mock import patch
+
+    from langchain_core.messages import AIMessage
+    from langgraph.graph import START, MessagesState, StateGraph
+    from langgraph.prebuilt import ToolNode
+
+    from sportsagent.models.chatboterror import RetrievalError
+    from sportsagent.tools.dataframe import find_similar_players
+
+    index = SimilarityIndex()
+    index.add_season(2024, _receivers(2024), version="final")
+
+    def get_similar_players(player, season, k=5, seasons=None):
+        try:
+            position, row = index.locate(player, season)
+            return index.most_similar(position, [row], k=k, seasons=seasons)[0]
+        except Exception as e:
+            raise RetrievalError(message=f"Failed to find similar players: {e}") from e
+
+    graph = StateGraph(MessagesState)
+    graph.add_node("tools", ToolNode([find_similar_players]))
+    graph.add_edge(START, "tools")
+    call = {"name": "find_similar_players", "args": {"player_name": "deep", "season": 2024}}
+    with patch(
+        "sportsagent.tools.dataframe.get_datasource",
+        return_value=SimpleNamespace(get_similar_players=get_similar_players),
+    ):
+        result = graph.compile().invoke(
+            {"messages": [AIMessage(content="", tool_calls=[{**call, "id": "call-1"}])]}
+        )
+
+    message = result["messages"][-1]
+    assert message.status == "success"
+    assert "Deep Threat, Deep Two" in message.content
@@ -0,0 +1,100 @@
+import pandas as pd
+import pytest
+
+from sportsagent.datasource.situations import (
+    compute_situational_splits,
+    resolve_situations,
+    restrict_to_last_n_games,
+)
+
+
+def _plays() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "posteam": ["KC", "KC", "KC", "BUF", "BUF", "KC"],
+            "down": [1, 3, 3, 2, 3, None],
+            "ydstogo": [10, 2, 8, 5, 1, None],
+            "yardline_100": [75, 15, 40, 8, 60, 35],
+            "goal_to_go": [0, 0, 0, 1, 0, 0],
+            "half_seconds_remaining": [900, 100, 600, 50, 1200, 0],
+            "pass": [1, 1, 0, 1, 0, 0],
+            "rush": [0, 0, 1, 0, 1, 0],
+            "pass_attempt": [1, 1, 0, 1, 0, 0],
+            "complete_pass": [1, 0, 0, 1, 0, 0],
+            "yards_gained": [12, 0, 9, 8, 3, 0],
+            "epa": [0.8, -0.6, 0.4, 1.5, 0.2, 0.0],
+            "success": [1, 0, 1, 1, 1, 0],
+            "touchdown": [0, 0, 0, 1, 0, 0],
+            "first_down": [1, 0, 1, 0, 1, 0],
+            "interception": [0, 0, 0, 0, 0, 0],
+            "sack": [0, 0, 0, 0, 0, 0],
+            "qb_hit": [0, 1, 0, 0, 0, 0],
+            "was_pressure": [False, None, None, True, None, None],
+            "passer_player_id": ["QB1", "QB1", None, "QB2", None, None],
+            "passer_player_name": ["P.One", "P.One", None, "P.Two", None, None],
+            "rusher_player_id": [None, None, "RB1", None, "RB2", None],
+            "rusher_player_name": [None, None, "R.One", None, "R.Two", None],
+            "receiver_player_id": ["WR1", None, None, "WR2", None, None],
+            "receiver_player_name": ["W.One", None, None, "W.Two", None, None],
+        }
+    )
+
+
+def test_resolve_situations_expands_groups_and_drops_unknown():
+    resolved = resolve_situations("red zone, field_position, nonsense")
+
+    assert resolved[0] == "all"
+    assert "red_zone" in resolved and "own_territory" in resolved
+    assert "nonsense" not in resolved
+    assert len(resolved) == len(set(resolved))
+
+
+def test_player_splits_cover_every_situation_in_one_pass():
+    situations = ["all", "red_zone", "third_down", "two_minute_drill", "under_pressure"]
+    splits = compute_situational_splits(_plays(), situations, level="player")
+    by_key = splits.set_index(["player_id", "situation"])
+
+    assert by_key.loc[("QB1", "all"), "plays"] == 2
+    assert by_key.loc[("QB1", "all"), "completions"] == 1
+    assert by_key.loc[("QB1", "third_down"), "epa"] == pytest.approx(-0.6)
+    # No participation for QB1's second dropback, so qb_hit stands in for pressure
+    assert by_key.loc[("QB1", "under_pressure"), "plays"] == 1
+    assert by_key.loc[("QB2", "under_pressure"), "touchdowns"] == 1
+    assert by_key.loc[("RB1", "third_down"), "success_rate"] == 1.0
+    assert set(by_key.loc["WR1"].index) == {"all"}
+    assert (splits["plays"] > 0).all()
+
+
+def test_team_splits_skip_non_scrimmage_plays():
+    splits = compute_situational_splits(_plays(), ["all", "red_zone"], level="team")
+    by_key = splits.set_index(["team", "situation"])
+
+    assert by_key.loc[("KC", "all"), "plays"] == 3
+    assert by_key.loc[("KC", "red_zone"), "plays"] == 1
+    assert by_key.loc[("BUF", "red_zone"), "yards_per_play"] == 8.0
+
+
+def test_unknown_situation_raises():
+    with pytest.raises(ValueError):
+        compute_situational_splits(_plays(), ["all", "blitz"])
+
+
+def test_last_n_games_window_is_per_player_and_per_team():
+    plays = _plays().assign(
+        season=2024,
+        week=[1, 2, 2, 1, 3, 2],
+        game_id=["g1", "g2", "g2", "b1", "b3", "g2"],
+    )
+
+    players = compute_situational_splits(
+        restrict_to_last_n_games(plays, 1, level="player"), ["all"], level="player"
+    ).set_index("player_id")
+    teams = compute_situational_splits(
+        restrict_to_last_n_games(plays, 1, level="team"), ["all"], level="team"
+    ).set_index("team")
+
+    # QB1's week 1 dropback falls outside its last game; WR1's only catch is that play
+    assert players.loc["QB1", "plays"] == 1
+    assert players.loc["WR1", "plays"] == 1
+    assert teams.loc["KC", "plays"] == 2
+    assert teams.loc["BUF", "plays"] == 1
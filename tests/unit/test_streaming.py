@@ -0,0 +1,90 @@
+import asyncio
+
+from langchain_core.messages import AIMessageChunk
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, StateGraph
+
+from sportsagent.models.chatbotstate import ChatbotState
+from sportsagent.models.streamevent import StreamEvent
+from sportsagent.nodes.analyzer.analyzeragent import JudgmentStream
+from sportsagent.runner import RunResult, WorkflowRunner
+from sportsagent.utils.streaming import emit_stream_event
+
+
+def _tool_chunk(args: str, name: str | None = None) -> AIMessageChunk:
+    return AIMessageChunk(
+        content="",
+        id="run-1",
+        tool_call_chunks=[{"name": name, "args": args, "id": None, "index": 0}],
+    )
+
+
+def test_judgment_stream_emits_only_new_judgment_text():
+    stream = JudgmentStream()
+    chunks = [
+        _tool_chunk('{"analysis": "Burrow ', name="AnalyzerOutput"),
+        _tool_chunk('threw most", "judg'),
+        _tool_chunk('ment": "Joe Bur'),
+        _tool_chunk('row led"'),
+        _tool_chunk("}"),
+    ]
+
+    tokens = [event.content for chunk in chunks for event in stream.feed(chunk)]
+
+    assert tokens == ["Joe Bur", "row led"]
+
+
+def test_judgment_stream_reports_tool_calls_and_plain_text():
+    stream = JudgmentStream()
+
+    events = stream.feed(_tool_chunk("", name="explain_data"))
+    events += stream.feed(AIMessageChunk(content="Looking at the data", id="run-2"))
+
+    assert [(e.kind, e.content) for e in events] == [
+        ("tool", "explain_data"),
+        ("token", "Looking at the data"),
+    ]
+
+
+def test_runner_stream_forwards_node_events_before_result():
+    def answer(state: ChatbotState) -> ChatbotState:
+        emit_stream_event(StreamEvent(kind="token", content="partial", node="answer"))
+        state.generated_response = "partial answer"
+        return state
+
+    graph = StateGraph(ChatbotState)
+    graph.add_node("answer", answer)
+    graph.set_entry_point("answer")
+    graph.add_edge("answer", END)
+
+    runner = WorkflowRunner(session_id="stream-test")
+    runner.graph = graph.compile(checkpointer=MemorySaver())
+
+    items = list(runner.stream("who led the league?"))
+
+    assert [(i.kind, i.content) for i in items[:-1]] == [
+        ("token", "partial"),
+        ("status", "answer"),
+    ]
+    assert isinstance(items[-1], RunResult)
+    assert items[-1].state.generated_response == "partial answer"
+
+
+def test_runner_arun_awaits_async_nodes_on_the_callers_loop():
+    async def answer(state: ChatbotState) -> ChatbotState:
+        await asyncio.sleep(0)
+        state.generated_response = "async answer"
+        return state
+
+    graph = StateGraph(ChatbotState)
+    graph.add_node("answer", answer)
+    graph.set_entry_point("answer")
+    graph.add_edge("answer", END)
+
+    runner = WorkflowRunner(session_id="arun-test")
+    runner.graph = graph.compile(checkpointer=MemorySaver())
+
+    result = asyncio.run(runner.arun("who led the league?"))
+
+    assert result.pending == []
+    assert result.state.generated_response == "async answer"
@@ -0,0 +1,136 @@
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import ToolMessage
+from langgraph.prebuilt.tool_node import ToolCallRequest
+
+from sportsagent.agents import toolmemo
+from sportsagent.agents.toolmemo import ToolMemoMiddleware, prune_tool_memo, tool_memo_key
+
+DATA = SimpleNamespace(version="live-1")
+
+
+@pytest.fixture(autouse=True)
+def _datasource(monkeypatch):
+    DATA.version = "live-1"
+    monkeypatch.setattr(
+        toolmemo, "get_datasource", lambda: SimpleNamespace(similarity_version=lambda: DATA.version)
+    )
+    monkeypatch.setattr(toolmemo, "_ARTIFACTS", OrderedDict())
+
+
+def _request(memo, name="describe_dataset", args=None, handle="frame-a", call_id="call-1"):
+    return ToolCallRequest(
+        tool_call={"name": name, "args": args or {}, "id": call_id},
+        tool=None,
+        state={"data_handle": handle},
+        runtime=SimpleNamespace(config={"configurable": {"tool_memo": memo}}),
+    )
+
+
+class CountingHandler:
+    def __init__(self, status: str = "success") -> None:
+        self.calls = 0
+        self.status = status
+
+    def __call__(self, request: ToolCallRequest) -> ToolMessage:
+        self.calls += 1
+        return ToolMessage(
+            content=f"result {self.calls}",
+            artifact={"rows": [self.calls]},
+            name=request.tool_call["name"],
+            tool_call_id=request.tool_call["id"],
+            status=self.status,
+        )
+
+
+def test_repeated_call_on_same_frame_is_served_from_memo():
+    memo: dict = {}
+    middleware = ToolMemoMiddleware()
+    handler = CountingHandler()
+
+    first = middleware.wrap_tool_call(_request(memo), handler)
+    second = middleware.wrap_tool_call(_request(memo, call_id="call-2"), handler)
+
+    assert handler.calls == 1
+    assert second.content == first.content == "result 1"
+    assert second.artifact == first.artifact == {"rows": [1]}
+    assert second.tool_call_id == "call-2"
+    assert second.additional_kwargs == {"memoized": True}
+
+
+def test_memo_key_separates_args_frames_and_tools():
+    memo: dict = {}
+    middleware = ToolMemoMiddleware()
+    handler = CountingHandler()
+
+    middleware.wrap_tool_call(_request(memo, args={"group_by": "team"}), handler)
+    middleware.wrap_tool_call(_request(memo, args={"group_by": "player"}), handler)
+    middleware.wrap_tool_call(_request(memo, handle="frame-b"), handler)
+    middleware.wrap_tool_call(_request(memo, name="explain_data"), handler)
+    # Non-memoized tools always execute
+    middleware.wrap_tool_call(_request(memo, name="request_more_data"), handler)
+    middleware.wrap_tool_call(_request(memo, name="request_more_data"), handler)
+
+    assert handler.calls == 6
+    assert len(memo) == 4
+    assert tool_memo_key("t", {"a": 1, "b": 2}, "h") == tool_memo_key("t", {"b": 2, "a": 1}, "h")
+
+
+def test_errors_are_not_memoized():
+    memo: dict = {}
+    handler = CountingHandler(status="error")
+
+    ToolMemoMiddleware().wrap_tool_call(_request(memo), handler)
+
+    assert memo == {}
+
+
+def test_prune_drops_entries_for_other_frames():
+    memo = {
+        tool_memo_key("describe_dataset", {}, "frame-a"): "a",
+        tool_memo_key("describe_dataset", {}, "frame-b"): "b",
+        tool_memo_key("find_similar_players", {}, "frame-a"): "comps",
+    }
+
+    assert prune_tool_memo(memo, "frame-b") == 1
+    assert list(memo.values()) == ["b", "comps"]
+    assert prune_tool_memo(memo, None) == 1
+    assert list(memo.values()) == ["comps"]
+
+
+def test_similar_players_are_memoized_across_frames_until_data_refreshes():
+    memo: dict = {}
+    middleware = ToolMemoMiddleware()
+    handler = CountingHandler()
+    args = {"player_name": "Josh Allen", "season": 2024}
+
+    middleware.wrap_tool_call(_request(memo, "find_similar_players", args, "frame-a"), handler)
+    again = middleware.wrap_tool_call(
+        _request(memo, "find_similar_players", args, "frame-b", call_id="call-2"), handler
+    )
+    assert handler.calls == 1
+    assert again.artifact == {"rows": [1]}
+
+    DATA.version = "live-2"
+    prune_tool_memo(memo, "frame-b")
+    assert memo == {}
+    middleware.wrap_tool_call(_request(memo, "find_similar_players", args, "frame-b"), handler)
+    assert handler.calls == 2
+
+
+def test_memo_keeps_artifact_keys_and_reruns_when_artifact_evicted():
+    memo: dict = {}
+    middleware = ToolMemoMiddleware()
+    handler = CountingHandler()
+
+    middleware.wrap_tool_call(_request(memo), handler)
+    (entry,) = memo.values()
+    assert entry == {"content": "result 1", "artifact": next(iter(memo))}
+
+    toolmemo._ARTIFACTS.clear()
+    rerun = middleware.wrap_tool_call(_request(memo, call_id="call-2"), handler)
+
+    assert handler.calls == 2
+    assert rerun.artifact == {"rows": [2]}
@@ -23,8 +23,8 @@ def mock_state():
 
 
 @patch("sportsagent.nodes.visualization.visualizationnode.get_datasource")
-@patch("sportsagent.nodes.visualization.visualizationnode.ChatOpenAI")
-def test_visualization_flow_success(mock_chat_openai, mock_get_datasource, mock_state):
+@patch("sportsagent.nodes.visualization.visualizationnode.get_chat_model")
+def test_visualization_flow_success(mock_get_chat_model, mock_get_datasource, mock_state):
     # Mock the datasource
     mock_datasource = MagicMock()
     mock_datasource.TEAM_COLORS = {"KC": ["#E31837", "#FFB612"]}
@@ -33,7 +33,7 @@ def test_visualization_flow_success(mock_chat_openai, mock_get_datasource, mock_
 
     # Mock the LLM chain response
     mock_llm = MagicMock()
-    mock_chat_openai.return_value = mock_llm
+    mock_get_chat_model.return_value = mock_llm
 
     # Mock the invoke method to return a valid python function string
     mock_chain = MagicMock()
@@ -60,8 +60,8 @@ def generate_plot(df):
     assert isinstance(final_state.visualization, dict)
 
 
-@patch("sportsagent.nodes.visualization.visualizationnode.ChatOpenAI")
-def test_visualization_node_no_data(mock_chat_openai, mock_state):
+@patch("sportsagent.nodes.visualization.visualizationnode.get_chat_model")
+def test_visualization_node_no_data(mock_get_chat_model, mock_state):
     mock_state.retrieved_data = {}
 
     new_state = generate_visualization_node(mock_state)
@@ -69,8 +69,8 @@ def test_visualization_node_no_data(mock_chat_openai, mock_state):
     assert new_state.visualization_code is None
 
 
-@patch("sportsagent.nodes.visualization.visualizationnode.ChatOpenAI")
-def test_visualization_node_not_needed(mock_chat_openai, mock_state):
+@patch("sportsagent.nodes.visualization.visualizationnode.get_chat_model")
+def test_visualization_node_not_needed(mock_get_chat_model, mock_state):
     mock_state.needs_visualization = False
 
     new_state = generate_visualization_node(mock_state)
@@ -128,3 +128,17 @@ def generate_plot(df):
     result_state = execute_visualization_node(mock_state)
 
     assert result_state.visualization is not None
+
+
+def test_native_charts_skip_the_code_review_step(mock_state):
+    from sportsagent import routing
+    from sportsagent.workflow import create_workflow
+
+    mock_state.visualization = '{"data": []}'
+    assert routing.should_continue_after_generate_visualization(mock_state) == "save_report"
+
+    mock_state.visualization, mock_state.visualization_code = None, "def generate_plot(): ..."
+    assert (
+        routing.should_continue_after_generate_visualization(mock_state) == "execute_visualization"
+    )
+    assert "generate_visualization" in create_workflow().branches
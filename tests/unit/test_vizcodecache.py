@@ -0,0 +1,126 @@
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from sportsagent.models.chatbotstate import ChatbotState
+from sportsagent.nodes.queryparser import gazetteer
+from sportsagent.nodes.queryparser.gazetteer import build_gazetteer
+from sportsagent.nodes.visualization import codecache
+from sportsagent.nodes.visualization.codecache import (
+    VizCodeCache,
+    code_is_reusable,
+    viz_code_key,
+)
+from sportsagent.nodes.visualization.visualizationnode import (
+    execute_visualization_node,
+    generate_visualization_node,
+)
+
+CODE = """
+def generate_plot(df):
+    import plotly.express as px
+    return px.bar(df, x='player_name', y='passing_yards')
+"""
+PLAYERS = ["Patrick Mahomes", "Josh Allen", "Joe Burrow", "Lamar Jackson"]
+
+
+@pytest.fixture(autouse=True)
+def player_gazetteer(monkeypatch):
+    monkeypatch.setattr(gazetteer, "_GAZETTEER", build_gazetteer(PLAYERS))
+
+
+def _frame(players: list[str]) -> pd.DataFrame:
+    return pd.DataFrame({"player_name": players, "passing_yards": [4000, 3900]})
+
+
+def _state(query: str, players: list[str]) -> ChatbotState:
+    return ChatbotState(
+        session_id="s",
+        user_query=query,
+        generated_response="",
+        needs_visualization=True,
+        retrieved_data={"players": _frame(players).to_dict("records")},
+    )
+
+
+def test_key_ignores_players_and_seasons_but_not_schema():
+    key = viz_code_key(
+        "Chart Patrick Mahomes vs Josh Allen passing yards in 2023",
+        None,
+        _frame(["Patrick Mahomes", "Josh Allen"]),
+    )
+
+    assert key == viz_code_key(
+        "chart Joe Burrow vs Lamar Jackson passing yards in 2024",
+        None,
+        _frame(["Joe Burrow", "Lamar Jackson"]),
+    )
+    assert key != viz_code_key(
+        "Chart Patrick Mahomes vs Josh Allen passing yards in 2023",
+        None,
+        _frame(["Patrick Mahomes", "Josh Allen"]).assign(passing_yards=["4000", "3900"]),
+    )
+
+
+@patch("sportsagent.nodes.visualization.visualizationnode.get_datasource")
+@patch("sportsagent.nodes.visualization.visualizationnode.get_chat_model")
+def test_validated_code_is_reused_for_another_player_set(mock_get_chat_model, mock_ds):
+    mock_ds.return_value = MagicMock(TEAM_COLORS={}, TEAM_LOGO_PATHS={})
+    mock_get_chat_model.return_value.__or__.return_value.invoke.return_value = CODE
+
+    first = execute_visualization_node(
+        generate_visualization_node(
+            _state("Chart Patrick Mahomes vs Josh Allen passing yards", PLAYERS[:2])
+        )
+    )
+    second = execute_visualization_node(
+        generate_visualization_node(
+            _state("Chart Joe Burrow vs Lamar Jackson passing yards", PLAYERS[2:])
+        )
+    )
+
+    assert mock_get_chat_model.call_count == 1
+    assert first.visualization is not None and second.visualization is not None
+    assert list(second.visualization["data"][0]["x"]) == PLAYERS[2:]
+    assert codecache.get_viz_code_cache().stats()["hits"] == 1
+
+
+@patch("sportsagent.nodes.visualization.visualizationnode.get_datasource")
+def test_code_that_fails_is_evicted(mock_ds):
+    mock_ds.return_value = MagicMock(TEAM_COLORS={}, TEAM_LOGO_PATHS={})
+    state = _state("Chart Josh Allen passing yards", PLAYERS[:2])
+    key = viz_code_key(state.user_query, None, _frame(PLAYERS[:2]))
+    cache = codecache.get_viz_code_cache()
+    cache.put(key, CODE.replace("passing_yards", "rushing_yards"))
+
+    state = execute_visualization_node(generate_visualization_node(state))
+
+    assert state.visualization is None
+    assert cache.get(key) is None
+    assert cache.stats()["failures"] == 1
+
+
+@patch("sportsagent.nodes.visualization.visualizationnode.get_datasource")
+@patch("sportsagent.nodes.visualization.visualizationnode.get_chat_model")
+def test_code_naming_query_literals_is_not_cached(mock_get_chat_model, mock_ds):
+    mock_ds.return_value = MagicMock(TEAM_COLORS={}, TEAM_LOGO_PATHS={})
+    titled = CODE.replace(")\n", ", title='Patrick Mahomes vs Josh Allen, 2023')\n")
+    mock_get_chat_model.return_value.__or__.return_value.invoke.return_value = titled
+    query = "Chart Patrick Mahomes vs Josh Allen passing yards in 2023"
+
+    state = execute_visualization_node(generate_visualization_node(_state(query, PLAYERS[:2])))
+
+    assert state.visualization is not None
+    assert codecache.get_viz_code_cache().stats()["entries"] == 0
+    assert not code_is_reusable(CODE.replace("player_name", "2023"), query)
+    assert code_is_reusable(CODE, query)
+
+
+def test_lru_bound():
+    cache = VizCodeCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, CODE)
+
+    assert cache.get("a") is None and cache.get("c") == CODE
+    assert cache.stats()["evictions"] == 1